@@ -0,0 +1,46 @@
+"""denormalize transaction date and amount
+
+Revision ID: 3c9f2e81d4a7
+Revises: b7d1e5a0c3f2
+Create Date: 2026-10-18 14:03:55.902114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9f2e81d4a7"
+down_revision: Union[str, None] = "b7d1e5a0c3f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transactions", sa.Column("date", sa.TIMESTAMP(timezone=True), nullable=True)
+    )
+    op.add_column(
+        "transactions",
+        sa.Column("amount", sa.DECIMAL(precision=10, scale=2), nullable=True),
+    )
+    op.execute(
+        "UPDATE transactions SET date = ti.date, amount = ti.amount "
+        "FROM transactions_information ti "
+        "WHERE ti.id = transactions.information_id"
+    )
+    op.create_index(
+        "ix_transactions_account_id_date",
+        "transactions",
+        ["account_id", "date"],
+        postgresql_include=["amount"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_account_id_date", table_name="transactions")
+    op.drop_column("transactions", "amount")
+    op.drop_column("transactions", "date")
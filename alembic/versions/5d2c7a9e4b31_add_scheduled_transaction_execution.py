@@ -0,0 +1,85 @@
+"""add scheduled transaction execution
+
+Revision ID: 5d2c7a9e4b31
+Revises: 8e4a6b2f0d15
+Create Date: 2026-10-18 23:58:12.402117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2c7a9e4b31"
+down_revision: Union[str, None] = "8e4a6b2f0d15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transactions_scheduled",
+        sa.Column("last_executed_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "transactions_scheduled",
+        sa.Column("next_run_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    # Occurrences before this upgrade were never created by the app, and users
+    # booked them by hand if at all. Schedules that have already started get
+    # the upgrade time as watermark, so the first scheduler run only creates
+    # occurrences from now on instead of their whole history. It then sets
+    # next_run_at to the occurrence after the watermark. Schedules that have
+    # not started yet are next due on their start.
+    op.execute(
+        "UPDATE transactions_scheduled SET last_executed_at = now() "
+        "WHERE date_start <= now()"
+    )
+    op.execute(
+        "UPDATE transactions_scheduled SET next_run_at = GREATEST(date_start, now())"
+    )
+    op.create_index(
+        "ix_transactions_scheduled_next_run_at",
+        "transactions_scheduled",
+        ["next_run_at"],
+        postgresql_where=sa.text("next_run_at IS NOT NULL"),
+    )
+    op.add_column(
+        "transactions",
+        sa.Column("scheduled_transaction_id", sa.Integer(), nullable=True),
+    )
+    op.create_foreign_key(
+        "transactions_scheduled_transaction_id_fkey",
+        "transactions",
+        "transactions_scheduled",
+        ["scheduled_transaction_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(
+        "ix_transactions_scheduled_transaction_id_account_id_date",
+        "transactions",
+        ["scheduled_transaction_id", "account_id", "date"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_transactions_scheduled_transaction_id_account_id_date",
+        table_name="transactions",
+    )
+    op.drop_constraint(
+        "transactions_scheduled_transaction_id_fkey",
+        "transactions",
+        type_="foreignkey",
+    )
+    op.drop_column("transactions", "scheduled_transaction_id")
+    op.drop_index(
+        "ix_transactions_scheduled_next_run_at", table_name="transactions_scheduled"
+    )
+    op.drop_column("transactions_scheduled", "next_run_at")
+    op.drop_column("transactions_scheduled", "last_executed_at")
@@ -0,0 +1,72 @@
+"""add account monthly summary
+
+Revision ID: 8e4a6b2f0d15
+Revises: 3c9f2e81d4a7
+Create Date: 2026-10-18 16:41:07.118530
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4a6b2f0d15"
+down_revision: Union[str, None] = "3c9f2e81d4a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account_monthly_summary",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("income", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("expenses", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"], ["accounts.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "account_id",
+            "year",
+            "month",
+            name="account_monthly_summary_account_id_year_month_key",
+        ),
+    )
+    # Months are UTC calendar months, independent of the connection time zone
+    op.execute(
+        "INSERT INTO account_monthly_summary "
+        "(account_id, year, month, income, expenses, count) "
+        "SELECT account_id, "
+        "EXTRACT(year FROM date AT TIME ZONE 'UTC'), "
+        "EXTRACT(month FROM date AT TIME ZONE 'UTC'), "
+        "COALESCE(SUM(amount) FILTER (WHERE amount > 0), 0), "
+        "COALESCE(SUM(amount) FILTER (WHERE amount < 0), 0), COUNT(*) "
+        "FROM transactions "
+        "GROUP BY account_id, "
+        "EXTRACT(year FROM date AT TIME ZONE 'UTC'), "
+        "EXTRACT(month FROM date AT TIME ZONE 'UTC')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("account_monthly_summary")
@@ -0,0 +1,46 @@
+"""add period query indexes
+
+Revision ID: b7d1e5a0c3f2
+Revises: ebc9a4757806
+Create Date: 2026-10-18 10:12:41.315208
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d1e5a0c3f2"
+down_revision: Union[str, None] = "ebc9a4757806"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_account_id_information_id",
+        "transactions",
+        ["account_id", "information_id"],
+    )
+    op.create_index(
+        "ix_transactions_information_date", "transactions_information", ["date"]
+    )
+    op.create_index(
+        "ix_transactions_scheduled_account_id_date_start_date_end",
+        "transactions_scheduled",
+        ["account_id", "date_start", "date_end"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_transactions_scheduled_account_id_date_start_date_end",
+        table_name="transactions_scheduled",
+    )
+    op.drop_index(
+        "ix_transactions_information_date", table_name="transactions_information"
+    )
+    op.drop_index(
+        "ix_transactions_account_id_information_id", table_name="transactions"
+    )
@@ -0,0 +1,48 @@
+"""cascade scheduled offset account
+
+Revision ID: c6d9e3a1f4b8
+Revises: a3f8c1d6e2b9
+Create Date: 2026-10-19 00:07:52.640913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6d9e3a1f4b8"
+down_revision: Union[str, None] = "a3f8c1d6e2b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint(
+        "transactions_scheduled_offset_account_id_fkey",
+        "transactions_scheduled",
+        type_="foreignkey",
+    )
+    op.create_foreign_key(
+        "transactions_scheduled_offset_account_id_fkey",
+        "transactions_scheduled",
+        "accounts",
+        ["offset_account_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "transactions_scheduled_offset_account_id_fkey",
+        "transactions_scheduled",
+        type_="foreignkey",
+    )
+    op.create_foreign_key(
+        "transactions_scheduled_offset_account_id_fkey",
+        "transactions_scheduled",
+        "accounts",
+        ["offset_account_id"],
+        ["id"],
+    )
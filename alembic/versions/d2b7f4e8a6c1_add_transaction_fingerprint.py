@@ -0,0 +1,36 @@
+"""add transaction fingerprint
+
+Revision ID: d2b7f4e8a6c1
+Revises: c6d9e3a1f4b8
+Create Date: 2026-10-19 00:26:14.583021
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b7f4e8a6c1"
+down_revision: Union[str, None] = "c6d9e3a1f4b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transactions", sa.Column("fingerprint", sa.String(length=64), nullable=True)
+    )
+    op.create_index(
+        "ix_transactions_account_id_fingerprint",
+        "transactions",
+        ["account_id", "fingerprint"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_account_id_fingerprint", table_name="transactions")
+    op.drop_column("transactions", "fingerprint")
@@ -0,0 +1,32 @@
+"""add category user id index
+
+Revision ID: f3c8a5d1e9b2
+Revises: e7a4c2b9d5f3
+Create Date: 2026-10-19 01:24:09.837150
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3c8a5d1e9b2"
+down_revision: Union[str, None] = "e7a4c2b9d5f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_category_user_id",
+        "transactions_category",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_transactions_category_user_id", table_name="transactions_category"
+    )
@@ -23,6 +23,12 @@ auth_backend = JWTAuthBackend(
 fastapi_users = FastAPIUsers[User, uuid.UUID](get_user_manager, [auth_backend])
 
 current_active_user = fastapi_users.current_user(active=True, verified=True)
+current_active_superuser = fastapi_users.current_user(
+    active=True, verified=True, superuser=True
+)
 optional_current_active_verified_user = fastapi_users.current_user(
     active=True, verified=True, optional=True
 )
+optional_current_active_superuser = fastapi_users.current_user(
+    active=True, verified=True, superuser=True, optional=True
+)
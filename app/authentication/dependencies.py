@@ -1,3 +1,4 @@
+from functools import cache
 from typing import AsyncGenerator
 
 from fastapi import Depends
@@ -28,10 +29,13 @@ async def get_user_manager(
     yield UserManager(user_db)
 
 
+@cache
 def get_strategy() -> JWTAccessRefreshStrategy:
     """
     Returns a custom JWT strategy with specified secret and token lifetimes.
 
+    The strategy holds no per-request state, so one instance is shared.
+
     Returns:
         CustomJWTStrategy: The custom JWT strategy object.
     """
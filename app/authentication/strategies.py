@@ -1,16 +1,58 @@
+import time
 from typing import List, Literal, Optional
 
+import jwt
 from fastapi import Response, status
-from fastapi_users import models
+from fastapi_users import BaseUserManager, exceptions, models
 from fastapi_users.authentication import (
     AuthenticationBackend,
     CookieTransport,
     JWTStrategy,
 )
-from fastapi_users.jwt import SecretType, generate_jwt
+from fastapi_users.jwt import SecretType, decode_jwt, generate_jwt
 
+from app.cache import user_cache
 from app.config import settings
 from app.models import User
+from app.utils.cache import MISSING, TTLCache
+
+# Entries are always stored with the remaining lifetime of their token
+token_claims_cache = TTLCache(ttl=0, max_size=settings.token_cache_max_size)
+
+
+def decode_token(
+    token: str, secret: SecretType, audience: List[str], algorithm: str
+) -> dict:
+    """
+    Verifies a JWT and returns its claims.
+
+    Verified claims are cached until the token expires, so a token that is
+    sent with many requests is only decoded once per worker.
+
+    Args:
+        token: The encoded JWT.
+        secret: The key the token must be signed with.
+        audience: The accepted audiences.
+        algorithm: The signing algorithm.
+
+    Returns:
+        dict: The claims of the token. The dict is shared and must not be
+            modified.
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid or expired.
+    """
+
+    key = (token, secret, tuple(audience), algorithm)
+    claims = token_claims_cache.get(key)
+
+    if claims is MISSING:
+        claims = decode_jwt(token, secret, audience, algorithms=[algorithm])
+
+        if "exp" in claims:
+            token_claims_cache.set(key, claims, ttl=claims["exp"] - time.time())
+
+    return claims
 
 
 class TokensCookieTransport(CookieTransport):
@@ -109,6 +151,35 @@ class JWTAccessRefreshStrategy(JWTStrategy[models.UP, models.ID]):
         self.refresh_lifetime_seconds = refresh_lifetime_seconds
         self.refresh_token_secret = refresh_token_secret
 
+    async def read_token(
+        self, token: Optional[str], user_manager: BaseUserManager[models.UP, models.ID]
+    ) -> Optional[models.UP]:
+        """
+        Returns the user of a valid access token, served from the user cache.
+
+        Args:
+            token: The JWT access token.
+            user_manager: The user manager that parses the user ID.
+
+        Returns:
+            Optional[User]: The user, or None if the token or user is invalid.
+        """
+
+        if token is None:
+            return None
+
+        try:
+            data = decode_token(
+                token, self.decode_key, self.token_audience, self.algorithm
+            )
+            user_id = data.get("sub")
+            if user_id is None:
+                return None
+
+            return await user_cache.get(user_manager.parse_id(user_id))
+        except (jwt.PyJWTError, exceptions.InvalidID):
+            return None
+
     async def write_refresh_token(self, user: User) -> str:
         """
         Generates a JWT refresh token for the given user.
@@ -0,0 +1,239 @@
+import uuid
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from app import models
+from app import repository as repo
+from app.config import settings
+from app.database import db
+from app.logger import get_logger
+from app.utils.cache import MISSING, TTLCache
+
+logger = get_logger(__name__)
+
+
+class VersionedCache:
+    """
+    A process-local cache for data that is shared by all workers.
+
+    Every key is combined with the version of the cache's namespace, which
+    is stored in the database. Invalidating bumps that version in the same
+    transaction as the change, so other workers stop using their old entries
+    once they read the new version. Each worker reads a version at most
+    every version_ttl seconds.
+
+    Entries can belong to a scope, e.g. a user, which has a version of its
+    own in the "<namespace>:<scope>" namespace. Invalidating a scope only
+    drops its entries, while invalidating the namespace drops all of them.
+
+    Args:
+        namespace: The name of the namespace in the cache_versions table.
+        ttl: The number of seconds an entry stays valid.
+        max_size: The maximum number of entries and of read versions.
+        version_ttl: The number of seconds a read version is reused.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float,
+        max_size: int = 1024,
+        version_ttl: float = settings.cache_version_ttl,
+    ) -> None:
+        self.namespace = namespace
+        self.entries = TTLCache(ttl=ttl, max_size=max_size)
+        self.versions = TTLCache(ttl=version_ttl, max_size=max_size)
+
+    def _get_namespace(self, scope: Optional[Hashable]) -> str:
+        """
+        Returns the name of the namespace of a scope.
+
+        Args:
+            scope: The scope, or None for the whole namespace.
+
+        Returns:
+            str: The name in the cache_versions table.
+        """
+
+        if scope is None:
+            return self.namespace
+
+        return f"{self.namespace}:{scope}"
+
+    async def get_version(self, scope: Optional[Hashable] = None) -> int:
+        """
+        Returns the current version of the namespace or of one of its scopes.
+
+        Args:
+            scope: The scope, or None for the whole namespace.
+
+        Returns:
+            int: The version.
+        """
+
+        namespace = self._get_namespace(scope)
+        version = self.versions.get(namespace)
+
+        if version is MISSING:
+            version = await repo.get_cache_version(namespace)
+            self.versions.set(namespace, version)
+
+        return version
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        scope: Optional[Hashable] = None,
+    ) -> Any:
+        """
+        Returns the cached value of a key, loading and storing it on a miss.
+
+        Args:
+            key: The key within the namespace or scope.
+            loader: Returns the current value. The value must not be bound to
+                a database session.
+            scope: The scope of the key, or None if it only depends on the
+                whole namespace.
+
+        Returns:
+            Any: The value.
+        """
+
+        version_key: tuple[int, ...] = (await self.get_version(),)
+        if scope is not None:
+            version_key += (await self.get_version(scope),)
+
+        versioned_key = (version_key, scope, key)
+        value = self.entries.get(versioned_key)
+
+        if value is MISSING:
+            logger.debug("Cache miss for %s %s", self.namespace, versioned_key)
+            value = await loader()
+            self.entries.set(versioned_key, value)
+
+        return value
+
+    async def invalidate(self, scope: Optional[Hashable] = None) -> None:
+        """
+        Drops the entries of the namespace or of one of its scopes in every
+        worker.
+
+        The version bump is part of the current transaction and must be
+        committed with the change that made the entries stale. This worker
+        drops its entries only after that commit, so a concurrent request
+        cannot cache the old data again in between.
+
+        Args:
+            scope: The scope, or None for the whole namespace.
+
+        Returns:
+            None
+        """
+
+        namespace = self._get_namespace(scope)
+        await repo.increment_cache_version(namespace)
+
+        def clear_local(_session: Session) -> None:
+            if scope is None:
+                self.entries.clear()
+                self.versions.clear()
+            else:
+                # The entries of the old version are no longer looked up
+                self.versions.delete(namespace)
+
+        # A new function per call, as a listener is only registered once
+        event.listen(db.session.sync_session, "after_commit", clear_local, once=True)
+
+
+def _detached_copy(instance: models.Base) -> models.Base:
+    """
+    Copies the column values of an instance into a new detached instance.
+
+    Args:
+        instance: The loaded instance.
+
+    Returns:
+        Base: The copy, which is not bound to any session.
+    """
+
+    mapper = inspect(instance).mapper
+    copy = mapper.class_(
+        **{attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs}
+    )
+
+    if isinstance(instance, models.User):
+        copy.oauth_accounts = [
+            _detached_copy(oauth_account) for oauth_account in instance.oauth_accounts
+        ]
+
+    make_transient_to_detached(copy)
+    return copy
+
+
+class UserCache:
+    """
+    A process-local cache of the users that authenticate requests.
+
+    The cache keeps detached snapshots of the users and merges them into the
+    session of each request without a query. Changes are only invalidated in
+    the worker that made them, so the TTL bounds how long other workers can
+    see an outdated user, e.g. one that was deactivated.
+
+    Args:
+        ttl: The number of seconds a user stays cached.
+        max_size: The maximum number of cached users.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024) -> None:
+        self.entries = TTLCache(ttl=ttl, max_size=max_size)
+
+    async def get(self, user_id: uuid.UUID) -> Optional[models.User]:
+        """
+        Returns a user bound to the current session, loading it on a miss.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist.
+        """
+
+        session = db.session
+
+        # The session's own instance is newer than any snapshot
+        if identity_key(models.User, user_id) in session.identity_map:
+            return await session.get(models.User, user_id)
+
+        snapshot = self.entries.get(user_id)
+
+        if snapshot is not MISSING:
+            return await session.merge(snapshot, load=False)
+
+        user = await session.get(models.User, user_id)
+
+        if user is not None:
+            self.entries.set(user_id, _detached_copy(user))
+
+        return user
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """
+        Drops the cached user in this worker.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            None
+        """
+
+        self.entries.delete(user_id)
+
+
+user_cache = UserCache(
+    ttl=settings.user_cache_ttl, max_size=settings.user_cache_max_size
+)
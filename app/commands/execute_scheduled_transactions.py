@@ -0,0 +1,45 @@
+"""
+Creates the transactions of all due scheduled transactions.
+
+Usage:
+    python -m app.commands.execute_scheduled_transactions [--batch-size N]
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from app.database import db
+from app.logger import get_logger
+from app.scheduler import run_scheduled_transactions
+
+logger = get_logger(__name__)
+
+
+async def main(batch_size: Optional[int] = None) -> None:
+    """
+    Materializes all due scheduled transactions once.
+
+    Args:
+        batch_size: The number of scheduled transactions per batch.
+
+    Returns:
+        None
+    """
+
+    await db.init()
+
+    try:
+        created_count = await run_scheduled_transactions(batch_size=batch_size)
+    finally:
+        await db.close()
+
+    logger.info("Created %s transactions from scheduled transactions", created_count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.batch_size))
@@ -0,0 +1,47 @@
+"""
+Regenerates the monthly account summaries from the transactions table.
+
+Usage:
+    python -m app.commands.rebuild_monthly_summaries [--account-id ID]
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from app import repository as repo
+from app.database import db
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def main(account_id: Optional[int] = None) -> None:
+    """
+    Rebuilds the monthly summaries of one or all accounts in one transaction.
+
+    Args:
+        account_id: Only rebuild the summaries of this account (default: all accounts).
+
+    Returns:
+        None
+    """
+
+    await db.init()
+
+    try:
+        async with db.session_scope() as session:
+            await repo.rebuild_monthly_summaries(account_id)
+            await session.commit()
+    finally:
+        await db.close()
+
+    logger.info("Rebuilt monthly summaries for %s", account_id or "all accounts")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--account-id", type=int, default=None)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.account_id))
@@ -17,6 +17,31 @@ class Settings(BaseSettings):
     db_port: str
     db_password: str
     db_user: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = -1
+    db_pool_pre_ping: bool = False
+    db_statement_timeout: int = 0
+    db_prepared_statement_cache_size: int = 100
+
+    fast_json_responses: bool = False
+
+    metrics_enabled: bool = True
+    metrics_token: str = ""
+    slow_request_threshold: float = 1.0
+
+    scheduled_transactions_enabled: bool = False
+    scheduled_transactions_interval: int = 3600
+    scheduled_transactions_batch_size: int = 500
+
+    import_max_bytes: int = 256 * 1024 * 1024
+
+    category_cache_ttl: float = 300
+    category_cache_max_size: int = 4096
+    cache_version_ttl: float = 5
+    user_cache_ttl: float = 30
+    user_cache_max_size: int = 4096
 
     refresh_token_name: str = "refresh_token"
     access_token_name: str = "access_token"
@@ -30,6 +55,7 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_minutes: int = 1440
     secure_cookie: bool = True
+    token_cache_max_size: int = 10000
 
     test_db_name: str = "test_db"
     test_db_port: int = 5433
@@ -1,11 +1,71 @@
 import sys
-from typing import Optional
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
 
 from fastapi_users.db import SQLAlchemyUserDatabase
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
+from app.metrics import instrument_engine
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    A queue pool that counts its checkouts and records how long they wait
+    for a connection.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkout_count = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            wait_time = time.perf_counter() - start
+            self.checkout_count += 1
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+
+def get_engine_options() -> dict:
+    """
+    Build the engine and pool options from the settings.
+
+    Returns:
+        dict: Keyword arguments for create_async_engine.
+    """
+
+    connect_args: dict = {
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size
+    }
+
+    if settings.db_statement_timeout > 0:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.db_statement_timeout)
+        }
+
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
 
 
 class Database:
@@ -22,28 +82,45 @@ class Database:
 
         self.url = url
         self.engine: Optional[AsyncEngine] = None
-        self._session: Optional[AsyncSession] = None
+        self.session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._session_context: ContextVar[Optional[AsyncSession]] = ContextVar(
+            "db_session", default=None
+        )
 
     async def init(self):
         """
-        Initialize the database connection.
+        Initialize the database engine and its session factory.
 
         Raises:
             None
         """
 
-        if self._session is not None:
-            await self._session.close()
+        if self.engine is not None:
+            await self.engine.dispose()
 
-        self.engine = create_async_engine(self.url, future=True)
-        self._session = await self.get_session()
+        self.engine = create_async_engine(self.url, future=True, **get_engine_options())
+        instrument_engine(self.engine)
+        self.session_factory = async_sessionmaker(
+            self.engine, expire_on_commit=False, class_=AsyncSession
+        )
 
-    async def get_session(self) -> AsyncSession:
+    async def close(self):
         """
-        Get the asynchronous session for the database.
+        Dispose the engine and close all pooled connections.
+
+        Raises:
+            None
+        """
+
+        if self.engine is not None:
+            await self.engine.dispose()
+
+    def get_pool_status(self) -> dict:
+        """
+        Get the current state of the connection pool.
 
         Returns:
-            AsyncSession: The asynchronous session for the database.
+            dict: Connection counts and checkout wait times of the pool.
 
         Raises:
             RuntimeError: If the engine has not been initialized.
@@ -52,27 +129,100 @@ class Database:
         if self.engine is None:
             raise RuntimeError("Engine has not been initialized")
 
-        session_factory = sessionmaker(
-            self.engine, expire_on_commit=False, class_=AsyncSession
-        )
+        pool = self.engine.pool
+        checkout_count = getattr(pool, "checkout_count", 0)
+        wait_time_total = getattr(pool, "wait_time_total", 0.0)
+
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": settings.db_max_overflow,
+            "checkout_count": checkout_count,
+            "wait_time_total": wait_time_total,
+            "wait_time_avg": (
+                wait_time_total / checkout_count if checkout_count else 0.0
+            ),
+            "wait_time_max": getattr(pool, "wait_time_max", 0.0),
+        }
 
-        return session_factory()
+    async def get_session(self) -> AsyncSession:
+        """
+        Create a new asynchronous session that is not bound to the current context.
+
+        Returns:
+            AsyncSession: A new asynchronous session for the database.
+
+        Raises:
+            RuntimeError: If the engine has not been initialized.
+        """
+
+        if self.session_factory is None:
+            raise RuntimeError("Engine has not been initialized")
+
+        return self.session_factory()
+
+    @asynccontextmanager
+    async def session_scope(self, join: bool = True) -> AsyncIterator[AsyncSession]:
+        """
+        Bind a session to the current context for the duration of the block.
+
+        If a session is already bound, the scope joins it instead of opening a
+        second one, so nested units of work share a single identity map.
+
+        Args:
+            join: Whether to join an already bound session. Work that runs
+                after the response, like background tasks, passes False to
+                get a session of its own.
+
+        Yields:
+            AsyncSession: The session bound to the current context.
+
+        Raises:
+            RuntimeError: If the engine has not been initialized.
+        """
+
+        current_session = self._session_context.get()
+        if join and current_session is not None:
+            yield current_session
+            return
+
+        session = await self.get_session()
+        token = self._session_context.set(session)
+        try:
+            yield session
+        finally:
+            self._session_context.reset(token)
+            await session.close()
 
     @property
     def session(self) -> AsyncSession:
         """
-        Get the asynchronous session for the database.
+        Get the asynchronous session bound to the current context.
 
         Returns:
             AsyncSession: The asynchronous session for the database.
 
         Raises:
-            RuntimeError: If the database session has not been initialized.
+            RuntimeError: If no session is bound to the current context.
+        """
+
+        session = self._session_context.get()
+        if session is None:
+            raise RuntimeError("No database session bound to the current context.")
+        return session
+
+    @property
+    def current_session(self) -> Optional[AsyncSession]:
+        """
+        Get the asynchronous session bound to the current context, if any.
+
+        Returns:
+            Optional[AsyncSession]: The bound session, or None if there is none.
         """
 
-        if self._session is None:
-            raise RuntimeError("Database session has not been initialized.")
-        return self._session
+        return self._session_context.get(None)
 
 
 async def get_user_db():
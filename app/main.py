@@ -1,30 +1,31 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager, suppress
-from datetime import datetime, timezone
-from urllib.parse import parse_qs
 
 import arel
-import jwt
-from fastapi import FastAPI, Request, Response, status
+from fastapi import FastAPI, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from jwt import ExpiredSignatureError
 from starlette.exceptions import HTTPException
 from starlette.middleware.sessions import SessionMiddleware
 from starlette_wtf import CSRFProtectMiddleware
 
-from app import models, repository, schemas, templates
-from app.authentication.dependencies import get_strategy
-from app.authentication.strategies import JWTAccessRefreshStrategy
+from app import schemas, templates
 from app.config import settings
 from app.database import db
 from app.logger import get_logger
-from app.middleware import HeaderLinkMiddleware
+from app.middleware import (
+    BreadcrumbMiddleware,
+    DatabaseSessionMiddleware,
+    HeaderLinkMiddleware,
+    MetricsMiddleware,
+    TokenRefreshMiddleware,
+)
 from app.routes import router_list
-from app.utils import BreadcrumbBuilder
+from app.scheduler import run_scheduler
 from app.utils.exceptions import UnauthorizedPageException
 
 logger = get_logger(__name__)
@@ -43,12 +44,29 @@ async def lifespan(_api_app: FastAPI):
 
     """
 
+    scheduler_task = None
+
     try:
         await db.init()
+
+        # Only the workers that opt in run the scheduler, the others rely on them
+        # or on the execute_scheduled_transactions command
+        if (
+            settings.scheduled_transactions_enabled
+            and settings.scheduled_transactions_interval > 0
+        ):
+            scheduler_task = asyncio.create_task(
+                run_scheduler(settings.scheduled_transactions_interval)
+            )
+
         yield
     finally:
-        if db.session is not None:
-            await db.session.close()
+        if scheduler_task is not None:
+            scheduler_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await scheduler_task
+
+        await db.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -67,6 +85,14 @@ app.add_middleware(
 app.add_middleware(HeaderLinkMiddleware)
 app.add_middleware(SessionMiddleware, secret_key=settings.session_secret_key)
 app.add_middleware(CSRFProtectMiddleware, csrf_secret=settings.csrf_secret)
+app.add_middleware(BreadcrumbMiddleware)
+app.add_middleware(TokenRefreshMiddleware)
+# Registered after the other middlewares so it wraps them, including the token refresh
+app.add_middleware(DatabaseSessionMiddleware)
+
+# Outermost, so the recorded latency includes all middlewares
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
 
 for route in router_list:
     app.include_router(
@@ -74,112 +100,6 @@ for route in router_list:
     )
 
 
-@app.middleware("http")
-async def add_breadcrumbs(request: Request, call_next):
-    """Middleware to add breadcrumbs to the request state.
-
-    Args:
-        request: The request object.
-        call_next: The next middleware or route handler.
-
-    Returns:
-        Response: The response from the next middleware or route handler.
-
-    Raises:
-        None
-    """
-    breadcrumb_builder = BreadcrumbBuilder(request)
-    breadcrumb_builder.add("Dashboard", "/dashboard")
-
-    setattr(request.state, "breadcrumb_builder", breadcrumb_builder)
-
-    return await call_next(request)
-
-
-@app.middleware("http")
-async def token_refresh_middleware(request: Request, call_next) -> Response:
-    """
-    Middleware to handle token refresh for access and refresh tokens in the HTTP request.
-
-    Args:
-        request: The incoming HTTP request object.
-        call_next: The callback to proceed with the request handling.
-
-    Returns:
-        Response: The HTTP response after handling token refresh.
-    """
-
-    access_token = request.cookies.get(settings.access_token_name)
-    refresh_token = request.cookies.get(settings.refresh_token_name)
-    algorithm = settings.algorithm
-
-    if access_token:
-        with suppress(ExpiredSignatureError):
-            payload = jwt.decode(
-                access_token,
-                settings.access_token_secret_key,
-                algorithms=[algorithm],
-                audience=settings.token_audience,
-            )
-            if payload.get("exp", 0) > datetime.now(timezone.utc).timestamp():
-                return await call_next(request)
-
-    if not refresh_token:
-        return await call_next(request)
-
-    with suppress(ExpiredSignatureError):
-        payload = jwt.decode(
-            refresh_token,
-            settings.refresh_token_secret_key,
-            algorithms=[algorithm],
-            audience=settings.token_audience,
-        )
-        user = await repository.get(models.User, payload["sub"])
-
-        if user is None:
-            return await call_next(request)
-
-        strategy = get_strategy()
-        new_access_token = await strategy.write_token(user)
-
-        update_request_headers_with_new_token(request, new_access_token)
-
-        response: Response = await call_next(request)
-        set_tokens_in_response(
-            response, refresh_token, new_access_token, payload, strategy
-        )
-
-        return response
-
-
-def update_request_headers_with_new_token(request: Request, new_access_token: str):
-    """Helper function to update the request headers with the new access token."""
-    mutable_headers = request.headers.mutablecopy()
-    if "cookie" in mutable_headers:
-        cookies = parse_qs(mutable_headers["cookie"])
-        cookies[settings.access_token_name] = [new_access_token]
-        mutable_headers["cookie"] = "; ".join(f"{k}={v[0]}" for k, v in cookies.items())
-    request._headers = mutable_headers  # pylint: disable=protected-access
-    request.scope.update(headers=request.headers.raw)
-
-
-def set_tokens_in_response(
-    response: Response,
-    refresh_token: str,
-    new_access_token: str,
-    payload: dict,
-    strategy: JWTAccessRefreshStrategy,
-):
-    """Helper function to set the new tokens in the response."""
-    response.set_cookie(settings.refresh_token_name, refresh_token, payload["exp"])
-    response.set_cookie(
-        settings.access_token_name,
-        new_access_token,
-        max_age=strategy.lifetime_seconds,
-        secure=settings.secure_cookie,
-    )
-
-
 if _debug := os.getenv("DEBUG"):
     hot_reload = arel.HotReload(paths=[arel.Path(".")])
     app.add_websocket_route("/hot-reload", route=hot_reload, name="hot-reload")
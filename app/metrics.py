@@ -0,0 +1,189 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.logger import get_logger
+from app.utils.metrics import Counter, Histogram, MetricsRegistry
+
+logger = get_logger(__name__)
+
+# Only the first queries of a request are kept for the slow request log
+MAX_LOGGED_QUERIES = 50
+MAX_LOGGED_STATEMENT_LENGTH = 500
+
+QUERY_COUNT_BUCKET_LIST = [1, 2, 5, 10, 20, 50, 100, 200, 500]
+
+registry = MetricsRegistry()
+
+request_duration = registry.register(
+    Histogram(
+        "pecuny_http_request_duration_seconds",
+        "Time spent handling HTTP requests.",
+        ["method", "route", "status"],
+    )
+)
+request_queries = registry.register(
+    Histogram(
+        "pecuny_http_request_queries",
+        "Database queries executed per HTTP request.",
+        ["route"],
+        buckets=QUERY_COUNT_BUCKET_LIST,
+    )
+)
+request_db_duration = registry.register(
+    Histogram(
+        "pecuny_http_request_db_duration_seconds",
+        "Time spent in database queries per HTTP request.",
+        ["route"],
+    )
+)
+slow_requests = registry.register(
+    Counter(
+        "pecuny_http_slow_requests",
+        "HTTP requests that took longer than the slow request threshold.",
+        ["route"],
+    )
+)
+db_queries = registry.register(
+    Counter("pecuny_db_queries", "Database queries executed by the process.")
+)
+db_query_duration = registry.register(
+    Counter(
+        "pecuny_db_query_duration_seconds",
+        "Time spent in database queries by the process.",
+    )
+)
+
+
+@dataclass
+class RequestStats:
+    """
+    The database work of one request.
+    """
+
+    query_count: int = 0
+    query_duration: float = 0.0
+    query_list: list[tuple[str, float]] = field(default_factory=list)
+
+    def add_query(self, statement: str, duration: float) -> None:
+        """
+        Records an executed query.
+
+        Args:
+            statement: The SQL statement.
+            duration: The execution time in seconds.
+
+        Returns:
+            None
+        """
+
+        self.query_count += 1
+        self.query_duration += duration
+
+        if len(self.query_list) < MAX_LOGGED_QUERIES:
+            self.query_list.append((statement, duration))
+
+
+# The stats of the request that is handled in the current context
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _many):
+    conn.info.setdefault("query_start_time_list", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, _parameters, _context, _many):
+    duration = time.perf_counter() - conn.info["query_start_time_list"].pop()
+
+    db_queries.inc()
+    db_query_duration.inc(amount=duration)
+
+    stats = request_stats.get()
+    if stats is not None:
+        stats.add_query(statement, duration)
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time_list"):
+        connection.info["query_start_time_list"].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Counts the queries of an engine and their execution time, in total and
+    for the request that executed them.
+
+    Args:
+        engine: The engine.
+
+    Returns:
+        None
+    """
+
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+def record_request(
+    method: str, route: str, status_code: int, duration: float, stats: RequestStats
+) -> None:
+    """
+    Records a finished request and logs it with its queries if it was slow.
+
+    Args:
+        method: The HTTP method.
+        route: The path template of the matched route.
+        status_code: The status code of the response.
+        duration: The time the request took in seconds.
+        stats: The database work of the request.
+
+    Returns:
+        None
+    """
+
+    request_duration.observe(duration, method, route, str(status_code))
+    request_queries.observe(stats.query_count, route)
+    request_db_duration.observe(stats.query_duration, route)
+
+    threshold = settings.slow_request_threshold
+    if threshold <= 0 or duration < threshold:
+        return
+
+    slow_requests.inc(route)
+
+    query_lines = "\n".join(
+        f"  {query_duration * 1000:8.1f} ms  "
+        f"{' '.join(statement.split())[:MAX_LOGGED_STATEMENT_LENGTH]}"
+        for statement, query_duration in stats.query_list
+    )
+    logger.warning(
+        "Slow request %s %s took %.3f s with %d queries (%.3f s in the database)"
+        "\n%s",
+        method,
+        route,
+        duration,
+        stats.query_count,
+        stats.query_duration,
+        query_lines,
+    )
+
+
+def render_metrics() -> str:
+    """
+    Renders all metrics of the process in the Prometheus text format.
+
+    Returns:
+        str: The exposition text.
+    """
+
+    return registry.render()
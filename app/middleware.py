@@ -1,25 +1,277 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+import time
+import uuid
+from contextlib import suppress
+from datetime import datetime, timezone
 
+from jwt import PyJWTError
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request, cookie_parser
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-class HeaderLinkMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+from app.authentication.dependencies import get_strategy
+from app.authentication.strategies import JWTAccessRefreshStrategy, decode_token
+from app.cache import user_cache
+from app.config import settings
+from app.database import db
+from app.metrics import RequestStats, record_request, request_stats
+from app.utils import BreadcrumbBuilder
+
+# Paths that never render a page and need no page context
+NON_PAGE_PATH_PREFIXES = ("/api/", "/static/")
+
+
+def is_page_request(scope: Scope) -> bool:
+    """
+    Checks whether a connection is an HTTP request for a rendered page.
+
+    Args:
+        scope: The ASGI connection scope.
+
+    Returns:
+        bool: True if the request may render a page, False otherwise.
+    """
+
+    return scope["type"] == "http" and not scope["path"].startswith(
+        NON_PAGE_PATH_PREFIXES
+    )
+
+
+class HeaderLinkMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Adds the header links of the page layout to the request state.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+
+        Returns:
+            None
+        """
+        if is_page_request(scope):
+            scope.setdefault("state", {})["header_links"] = [
+                # {
+                #     "url": dashboard_router.prefix,
+                #     "text": "Dashboard",
+                #     "active": current_path.startswith(dashboard_router.prefix),
+                # },
+            ]
+
+        await self.app(scope, receive, send)
+
+
+class BreadcrumbMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Adds a breadcrumb builder that starts at the dashboard to the request
+        state.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+
+        Returns:
+            None
+        """
+        if is_page_request(scope):
+            breadcrumb_builder = BreadcrumbBuilder(Request(scope))
+            breadcrumb_builder.add("Dashboard", "/dashboard")
+            scope.setdefault("state", {})["breadcrumb_builder"] = breadcrumb_builder
+
+        await self.app(scope, receive, send)
+
+
+class TokenRefreshMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Issues a new access token when it has expired but the refresh token is
+        still valid.
+
+        The new token replaces the access token cookie of the request, so the
+        request is authenticated, and is set as a cookie on the response.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+
+        Returns:
+            None
+        """
+        if scope["type"] != "http" or scope["path"].startswith("/static/"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = MutableHeaders(scope=scope)
+        cookies = cookie_parser(request_headers.get("cookie", ""))
+        access_token = cookies.get(settings.access_token_name)
+        refresh_token = cookies.get(settings.refresh_token_name)
+
+        if access_token and self.is_valid_access_token(access_token):
+            await self.app(scope, receive, send)
+            return
+
+        payload = None
+        if refresh_token:
+            with suppress(PyJWTError):
+                payload = decode_token(
+                    refresh_token,
+                    settings.refresh_token_secret_key,
+                    settings.token_audience,
+                    settings.algorithm,
+                )
+
+        user = await user_cache.get(uuid.UUID(payload["sub"])) if payload else None
+
+        if payload is None or user is None:
+            await self.app(scope, receive, send)
+            return
+
+        strategy = get_strategy()
+        new_access_token = await strategy.write_token(user)
+
+        cookies[settings.access_token_name] = new_access_token
+        request_headers["cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
+
+        cookie_response = Response()
+        set_tokens_in_response(
+            cookie_response, refresh_token, new_access_token, payload, strategy
+        )
+
+        async def send_with_tokens(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for key, value in cookie_response.raw_headers:
+                    if key == b"set-cookie":
+                        response_headers.append("set-cookie", value.decode("latin-1"))
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_tokens)
+
+    @staticmethod
+    def is_valid_access_token(access_token: str) -> bool:
         """
-        Dispatches the request to the next middleware or route handler.
+        Checks whether an access token is valid and not expired.
 
         Args:
-            self: The instance of the middleware.
-            request (Request): The incoming request object.
-            call_next (Callable): The next middleware or route handler.
+            access_token: The access token.
 
         Returns:
-            Awaitable: The response returned by the next middleware or route handler.
-        """
-        request.state.header_links = [
-            # {
-            #     "url": dashboard_router.prefix,
-            #     "text": "Dashboard",
-            #     "active": current_path.startswith(dashboard_router.prefix),
-            # },
-        ]
-        return await call_next(request)
+            bool: True if the token can be used, False otherwise.
+        """
+        with suppress(PyJWTError):
+            payload = decode_token(
+                access_token,
+                settings.access_token_secret_key,
+                settings.token_audience,
+                settings.algorithm,
+            )
+            return payload.get("exp", 0) > datetime.now(timezone.utc).timestamp()
+
+        return False
+
+
+def set_tokens_in_response(
+    response: Response,
+    refresh_token: str,
+    new_access_token: str,
+    payload: dict,
+    strategy: JWTAccessRefreshStrategy,
+):
+    """Helper function to set the new tokens in the response."""
+    response.set_cookie(settings.refresh_token_name, refresh_token, payload["exp"])
+    response.set_cookie(
+        settings.access_token_name,
+        new_access_token,
+        max_age=strategy.lifetime_seconds,
+        secure=settings.secure_cookie,
+    )
+
+
+class DatabaseSessionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Binds a database session to the context of each HTTP request.
+
+        Every request gets its own session from the engine's connection pool,
+        which is closed again once the response has been sent.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+
+        Returns:
+            None
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with db.session_scope():
+            await self.app(scope, receive, send)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Records the latency and the database queries of each HTTP request.
+
+        Requests are labeled with the path template of the matched route, so
+        path parameters do not create new series.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+
+        Returns:
+            None
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            request_stats.reset(token)
+            record_request(
+                scope["method"],
+                getattr(scope.get("route"), "path", "unmatched"),
+                status_code,
+                time.perf_counter() - start,
+                stats,
+            )
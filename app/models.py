@@ -2,8 +2,8 @@ from fastapi_users.db import (
     SQLAlchemyBaseOAuthAccountTableUUID,
     SQLAlchemyBaseUserTableUUID,
 )
-from sqlalchemy import DECIMAL, Column, Integer, String, text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DECIMAL, Column, Index, Integer, String, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase, Mapped, relationship
 from sqlalchemy.sql.schema import ForeignKey
@@ -16,6 +16,8 @@ class Base(DeclarativeBase):
 
 class BaseModel(Base):
     __abstract__ = True
+    # Fetch server defaults with RETURNING during the flush
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, nullable=False)
     created_at = Column(
@@ -92,18 +94,52 @@ class UserId(Base):
 
 class Transaction(BaseModel):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index(
+            "ix_transactions_account_id_information_id", "account_id", "information_id"
+        ),
+        Index(
+            "ix_transactions_account_id_date",
+            "account_id",
+            "date",
+            postgresql_include=["amount"],
+        ),
+        Index(
+            "ix_transactions_scheduled_transaction_id_account_id_date",
+            "scheduled_transaction_id",
+            "account_id",
+            "date",
+            unique=True,
+        ),
+        Index(
+            "ix_transactions_account_id_fingerprint",
+            "account_id",
+            "fingerprint",
+            unique=True,
+        ),
+    )
 
     account_id = Column(
         Integer, ForeignKey("accounts.id", ondelete="CASCADE", onupdate="CASCADE")
     )
+    # Copies of information.date and information.amount for single-table range scans
+    date = Column(type_=TIMESTAMP(timezone=True))
+    amount = Column(DECIMAL(10, 2))
     information_id = Column(Integer, ForeignKey("transactions_information.id"))
+    scheduled_transaction_id = Column(
+        Integer,
+        ForeignKey("transactions_scheduled.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    # Identifies imported transactions, see app.utils.fingerprints
+    fingerprint = Column(String(64), nullable=True)
     information = relationship(
         "TransactionInformation",
         backref="transactions",
         uselist=False,
         cascade="all,delete",
         foreign_keys=[information_id],
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     offset_transactions_id = Column(
@@ -122,14 +158,29 @@ class Transaction(BaseModel):
         foreign_keys=[offset_transactions_id],
         post_update=True,
         cascade="all,delete",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
-    account = relationship("Account", back_populates="transactions", lazy="selectin")
+    account = relationship(
+        "Account", back_populates="transactions", lazy="raise_on_sql"
+    )
 
 
 class TransactionScheduled(BaseModel):
     __tablename__ = "transactions_scheduled"
+    __table_args__ = (
+        Index(
+            "ix_transactions_scheduled_account_id_date_start_date_end",
+            "account_id",
+            "date_start",
+            "date_end",
+        ),
+        Index(
+            "ix_transactions_scheduled_next_run_at",
+            "next_run_at",
+            postgresql_where=text("next_run_at IS NOT NULL"),
+        ),
+    )
 
     account_id = Column(
         Integer, ForeignKey("accounts.id", ondelete="CASCADE", onupdate="CASCADE")
@@ -137,7 +188,7 @@ class TransactionScheduled(BaseModel):
     account = relationship(
         "Account",
         back_populates="scheduled_transactions",
-        lazy="selectin",
+        lazy="raise_on_sql",
         foreign_keys=[account_id],
     )
 
@@ -146,15 +197,21 @@ class TransactionScheduled(BaseModel):
         backref="transactions_scheduled",
         uselist=False,
         cascade="all,delete",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     information_id = Column(Integer, ForeignKey("transactions_information.id"))
-    offset_account_id = Column(Integer, ForeignKey("accounts.id"), nullable=True)
+    offset_account_id = Column(
+        Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=True
+    )
 
-    frequency = relationship("Frequency", cascade="all,delete", lazy="selectin")
+    frequency = relationship("Frequency", cascade="all,delete", lazy="raise_on_sql")
     frequency_id = Column(Integer, ForeignKey("frequencies.id", ondelete="CASCADE"))
     date_start = Column(type_=TIMESTAMP(timezone=True))
     date_end = Column(type_=TIMESTAMP(timezone=True))
+    # Date of the last occurrence materialized as a transaction
+    last_executed_at = Column(type_=TIMESTAMP(timezone=True), nullable=True)
+    # Date of the next occurrence to materialize, None once the schedule is exhausted
+    next_run_at = Column(type_=TIMESTAMP(timezone=True), nullable=True)
 
 
 class Account(BaseModel, UserId):
@@ -174,13 +231,65 @@ class Account(BaseModel, UserId):
     )
 
 
+class AccountMonthlySummary(BaseModel):
+    __tablename__ = "account_monthly_summary"
+    __table_args__ = (
+        UniqueConstraint(
+            "account_id",
+            "year",
+            "month",
+            name="account_monthly_summary_account_id_year_month_key",
+        ),
+    )
+
+    account_id = Column(
+        Integer,
+        ForeignKey("accounts.id", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+    )
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    income = Column(DECIMAL(12, 2), nullable=False, default=0)
+    expenses = Column(DECIMAL(12, 2), nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class ImportJob(BaseModel, UserId):
+    __tablename__ = "import_jobs"
+
+    account_id = Column(
+        Integer,
+        ForeignKey("accounts.id", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+    )
+    file_format = Column(String(8), nullable=False)
+    status = Column(String(16), nullable=False)
+    rows_read = Column(Integer, nullable=False, default=0)
+    created_count = Column(Integer, nullable=False, default=0)
+    duplicate_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    # The first rejected rows, as {"index", "detail"} objects
+    errors = Column(JSONB, nullable=False, default=list)
+    finished_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+
+class CacheVersion(BaseModel):
+    __tablename__ = "cache_versions"
+
+    # Bumped whenever cached data of the namespace changes, so every worker
+    # notices that its local copies are stale
+    namespace = Column(String(64), nullable=False, unique=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
 class TransactionInformation(BaseModel):
     __tablename__ = "transactions_information"
+    __table_args__ = (Index("ix_transactions_information_date", "date"),)
 
     amount = Column(DECIMAL(10, 2), default=0)
     reference = Column(String(128))
     date = Column(type_=TIMESTAMP(timezone=True), default=text("now()"))
-    category = relationship("TransactionCategory", lazy="selectin")
+    category = relationship("TransactionCategory", lazy="raise_on_sql")
     category_id = Column(Integer, ForeignKey("transactions_category.id"))
 
 
@@ -198,13 +307,14 @@ class TransactionSection(BaseModel):
 
 class TransactionCategory(BaseModel):
     __tablename__ = "transactions_category"
+    __table_args__ = (Index("ix_transactions_category_user_id", "user_id"),)
 
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"))
     user = relationship(
         "User",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     label = Column(String(36))
-    section = relationship("TransactionSection", lazy="selectin")
+    section = relationship("TransactionSection", lazy="raise_on_sql")
     section_id = Column(Integer, ForeignKey("transactions_section.id"))
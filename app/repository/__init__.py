@@ -0,0 +1,85 @@
+# The queries are grouped by topic in the submodules and re-exported here, so
+# callers keep using `from app import repository as repo`.
+from app.repository.base import (
+    LOAD_PROFILES,
+    ModelT,
+    commit,
+    delete,
+    filter_by,
+    filter_by_multiple,
+    get,
+    get_all,
+    get_cache_version,
+    get_categories_by_user,
+    get_owned,
+    get_owned_account_ids,
+    get_usable_category_ids,
+    increment_cache_version,
+    load_profile,
+    load_relationships,
+    refresh,
+    save,
+    update,
+)
+from app.repository.bulk import (
+    bulk_insert,
+    bulk_insert_ignoring_conflicts,
+    bulk_update,
+    delete_by_ids,
+    increment_balances,
+)
+from app.repository.scheduled import (
+    get_due_scheduled_transactions,
+    get_scheduled_transactions_for_account,
+    get_scheduled_transactions_from_period,
+)
+from app.repository.summaries import (
+    get_monthly_summaries,
+    rebuild_monthly_summaries,
+    update_monthly_summaries,
+)
+from app.repository.transactions import (
+    get_category_totals,
+    get_transaction_summary,
+    get_transactions_from_period,
+    get_transactions_page,
+    stream_account_transactions,
+)
+
+__all__ = [
+    "LOAD_PROFILES",
+    "ModelT",
+    "load_profile",
+    "load_relationships",
+    "get_all",
+    "get",
+    "get_owned",
+    "get_owned_account_ids",
+    "get_usable_category_ids",
+    "filter_by",
+    "filter_by_multiple",
+    "get_categories_by_user",
+    "get_cache_version",
+    "increment_cache_version",
+    "save",
+    "commit",
+    "update",
+    "delete",
+    "refresh",
+    "bulk_insert",
+    "bulk_insert_ignoring_conflicts",
+    "delete_by_ids",
+    "bulk_update",
+    "increment_balances",
+    "get_scheduled_transactions_from_period",
+    "get_due_scheduled_transactions",
+    "get_scheduled_transactions_for_account",
+    "update_monthly_summaries",
+    "rebuild_monthly_summaries",
+    "get_monthly_summaries",
+    "get_transactions_from_period",
+    "get_transaction_summary",
+    "get_category_totals",
+    "stream_account_transactions",
+    "get_transactions_page",
+]
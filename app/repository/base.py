@@ -0,0 +1,498 @@
+import uuid
+from typing import Any, List, Optional, Tuple, Type, TypeVar, Union
+
+from sqlalchemy import Select, func, or_, text
+from sqlalchemy import update as sql_update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+from sqlalchemy.orm import contains_eager, joinedload, noload, selectinload
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.base import ExecutableOption
+
+from app import models
+from app.database import db
+from app.models import BaseModel
+from app.utils.enums import DatabaseFilterOperator, LoadProfile
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+_category_options = joinedload(models.TransactionCategory.section)
+_information_options = selectinload(models.TransactionInformation.category).options(
+    _category_options
+)
+_transaction_information_options = selectinload(models.Transaction.information).options(
+    _information_options
+)
+_scheduled_list_options = [
+    selectinload(models.TransactionScheduled.information).options(_information_options),
+    selectinload(models.TransactionScheduled.frequency),
+]
+
+# The relationships each loading profile loads per model. Relationships that
+# are not listed are not loaded and raise when they would need a query. The
+# minimal profile loads none of them.
+LOAD_PROFILES: dict[type, dict[LoadProfile, list[ExecutableOption]]] = {
+    models.Transaction: {
+        # What the transaction responses and the account page show
+        LoadProfile.LIST: [
+            _transaction_information_options,
+            selectinload(models.Transaction.offset_transaction).options(
+                selectinload(models.Transaction.account)
+            ),
+        ],
+        # What updating and deleting a transaction and its offset needs
+        LoadProfile.DETAIL: [
+            _transaction_information_options,
+            selectinload(models.Transaction.offset_transaction).options(
+                selectinload(models.Transaction.information)
+            ),
+        ],
+    },
+    models.TransactionScheduled: {
+        LoadProfile.LIST: _scheduled_list_options,
+        LoadProfile.DETAIL: _scheduled_list_options,
+    },
+    models.TransactionInformation: {
+        LoadProfile.LIST: [_information_options],
+        LoadProfile.DETAIL: [_information_options],
+    },
+    models.TransactionCategory: {
+        LoadProfile.LIST: [_category_options],
+        LoadProfile.DETAIL: [_category_options],
+    },
+}
+
+
+def load_profile(query: Select, cls: Type[ModelT], profile: LoadProfile) -> Select:
+    """Apply the loading options of a profile to a query.
+
+    Args:
+        query: The SQLAlchemy query object.
+        cls: The model class the query selects.
+        profile: The loading profile.
+
+    Returns:
+        The modified query with loading options applied.
+    """
+    option_list = LOAD_PROFILES.get(cls, {}).get(profile, [])
+    return query.options(*option_list) if option_list else query
+
+
+def load_relationships(
+    query: Select, relationships: InstrumentedAttribute = None
+) -> Select:
+    """Apply loading options for specified relationships to a query.
+
+    Args:
+        cls: The model class.
+        query: The SQLAlchemy query object.
+        *relationships: Class-bound attributes representing relationships to load.
+
+    Returns:
+        The modified query with loading options applied.
+    """
+    if relationships:
+        options = [selectinload(rel) for rel in relationships]
+        query = query.options(*options)
+    return query
+
+
+async def get_all(
+    cls: Type[ModelT],
+    load_relationships_list: Optional[list[InstrumentedAttribute]] = None,
+    profile: LoadProfile = LoadProfile.MINIMAL,
+) -> list[ModelT]:
+    """Retrieve all instances of the specified model from the database.
+
+    Args:
+        cls: The type of the model.
+        load_relationships: Optional list of relationships to load.
+        profile: The loading profile of the instances.
+
+    Returns:
+        list[ModelT]: A list of instances of the specified model.
+    """
+    q = select(cls)
+    q = load_profile(q, cls, profile)
+    q = load_relationships(q, load_relationships_list)
+    result = await db.session.execute(q)
+    return result.unique().scalars().all()
+
+
+async def get(
+    cls: Type[ModelT],
+    instance_id: int,
+    load_relationships_list: Optional[list[InstrumentedAttribute]] = None,
+    profile: LoadProfile = LoadProfile.MINIMAL,
+) -> Optional[ModelT]:
+    """Retrieve an instance of the specified model by its ID.
+
+    Args:
+        cls: The type of the model.
+        instance_id: The ID of the instance to retrieve.
+        load_relationships: Optional list of relationships to load.
+        profile: The loading profile of the instance.
+
+    Returns:
+        Optional[ModelT]:
+            The instance of the specified model with
+            the given ID, or None if not found.
+    """
+    q = select(cls).where(cls.id == instance_id)
+    q = load_profile(q, cls, profile)
+    q = load_relationships(q, load_relationships_list)
+    result = await db.session.execute(q)
+    return result.scalars().first()
+
+
+async def get_owned(
+    cls: Type[ModelT],
+    instance_id: int,
+    user_id: uuid.UUID,
+    load_relationships_list: Optional[list[InstrumentedAttribute]] = None,
+    profile: LoadProfile = LoadProfile.MINIMAL,
+) -> Optional[ModelT]:
+    """Retrieve an instance by its ID if it belongs to the user.
+
+    Models with a user_id, like accounts and import jobs, are matched by it.
+    Every other model is joined to the account it belongs to and matched by
+    the account's user_id in the same query, which also populates its account
+    relationship.
+
+    Args:
+        cls: The type of the model, one with a user_id or with an account.
+        instance_id: The ID of the instance to retrieve.
+        user_id: The ID of the user who must own the instance.
+        load_relationships_list: Optional list of relationships to load.
+        profile: The loading profile of the instance.
+
+    Returns:
+        Optional[ModelT]: The instance, or None if it does not exist or
+            belongs to another user.
+    """
+    q = select(cls).where(cls.id == instance_id)
+
+    if issubclass(cls, models.UserId):
+        q = q.where(cls.user_id == user_id)
+    else:
+        q = (
+            q.join(cls.account)
+            .where(models.Account.user_id == user_id)
+            .options(contains_eager(cls.account))
+        )
+
+    q = load_profile(q, cls, profile)
+    q = load_relationships(q, load_relationships_list)
+    result = await db.session.execute(q)
+    return result.scalars().first()
+
+
+async def get_owned_account_ids(user_id: Any, account_id_list: list[int]) -> set[int]:
+    """Find out which of the given accounts belong to a user.
+
+    Args:
+        user_id: The ID of the user.
+        account_id_list: The IDs of the accounts.
+
+    Returns:
+        set[int]: The IDs of the user's accounts among account_id_list.
+
+    Raises:
+        None
+    """
+    if not account_id_list:
+        return set()
+
+    account = models.Account
+    query = (
+        select(account.id)
+        .filter(account.id.in_(account_id_list))
+        .filter(account.user_id == user_id)
+    )
+
+    result = await db.session.execute(query)
+    return set(result.scalars().all())
+
+
+async def get_usable_category_ids(
+    user_id: Any, category_id_list: list[int]
+) -> set[int]:
+    """Find out which of the given categories a user may assign.
+
+    These are the global categories and the user's own ones.
+
+    Args:
+        user_id: The ID of the user.
+        category_id_list: The IDs of the categories.
+
+    Returns:
+        set[int]: The IDs of the usable categories among category_id_list.
+
+    Raises:
+        None
+    """
+    if not category_id_list:
+        return set()
+
+    category = models.TransactionCategory
+    query = (
+        select(category.id)
+        .filter(category.id.in_(category_id_list))
+        .filter(or_(category.user_id.is_(None), category.user_id == user_id))
+    )
+
+    result = await db.session.execute(query)
+    return set(result.scalars().all())
+
+
+async def filter_by(
+    cls: Type[ModelT],
+    attribute: InstrumentedAttribute,
+    value: str,
+    operator: DatabaseFilterOperator = DatabaseFilterOperator.EQUAL,
+    load_relationships_list: Optional[list[str]] = None,
+    profile: LoadProfile = LoadProfile.MINIMAL,
+) -> list[ModelT]:
+    """
+    Filters the records of a given model by a specified attribute and value.
+
+    Args:
+        cls: The model class.
+        attribute: The attribute to filter by.
+        value: The value to filter with.
+        operator: The operator to use for the filter (default: EQUAL).
+        profile: The loading profile of the records.
+
+    Returns:
+        list[Type[ModelT]]: The filtered records.
+
+    Raises:
+        None
+    """
+    condition = text(f"{attribute.key} {operator.value} :val")
+
+    q = select(cls).where(condition).params(val=value)
+    q = load_profile(q, cls, profile)
+    q = load_relationships(q, load_relationships_list)
+
+    result = await db.session.execute(q)
+
+    return result.unique().scalars().all()
+
+
+async def filter_by_multiple(
+    cls: Type[ModelT],
+    conditions: list[Tuple[InstrumentedAttribute, Any, DatabaseFilterOperator]],
+    load_relationships_list: Optional[list[str]] = None,
+    profile: LoadProfile = LoadProfile.MINIMAL,
+) -> list[ModelT]:
+    """
+    Filters the records of a given model by multiple attributes and values.
+
+    Args:
+        cls: The model class.
+        conditions: A list of tuples where each tuple contains an attribute to filter by,
+                    a value to filter with, and an optional operator
+                    (if not provided, EQUAL is used).
+        load_relationships_list: Optional list of relationships to load.
+        profile: The loading profile of the records.
+
+    Returns:
+        list[Model]: The filtered records.
+    """
+
+    where_conditions = []
+    params = {}
+    for i, (attribute, value, operator) in enumerate(conditions):
+        param_name = f"val{i}"
+        where_conditions.append(text(f"{attribute.key} {operator.value} :{param_name}"))
+        params[param_name] = value
+
+    q = select(cls)
+    if where_conditions:
+        for condition in where_conditions:
+            q = q.where(condition)
+    q = q.params(**params)
+
+    q = load_profile(q, cls, profile)
+    q = load_relationships(q, load_relationships_list)
+
+    result = await db.session.execute(q)
+
+    return result.scalars().unique().all()
+
+
+async def get_categories_by_user(
+    user_id: Optional[Any],
+) -> list[models.TransactionCategory]:
+    """Retrieve the categories owned by a user, or the global ones.
+
+    Uses the index on transactions_category.user_id, so the cost depends on
+    the number of matching categories only. The owning user is not loaded.
+
+    Args:
+        user_id: The ID of the user, or None for the global categories.
+
+    Returns:
+        list[models.TransactionCategory]: The categories with their sections,
+            ordered by ID.
+
+    Raises:
+        None
+    """
+    category = models.TransactionCategory
+    condition = (
+        category.user_id.is_(None) if user_id is None else category.user_id == user_id
+    )
+    query = (
+        select(category)
+        .where(condition)
+        .options(selectinload(category.section), noload(category.user))
+        .order_by(category.id)
+    )
+
+    result = await db.session.scalars(query)
+    return result.all()
+
+
+async def get_cache_version(namespace: str) -> int:
+    """Get the current version of a cache namespace.
+
+    Args:
+        namespace: The name of the cache namespace.
+
+    Returns:
+        int: The version, 0 if the namespace has never been invalidated.
+
+    Raises:
+        None
+    """
+    query = select(models.CacheVersion.version).filter(
+        models.CacheVersion.namespace == namespace
+    )
+    version = await db.session.scalar(query)
+    return version or 0
+
+
+async def increment_cache_version(namespace: str) -> int:
+    """Increment the version of a cache namespace.
+
+    The new version becomes visible to other workers when the surrounding
+    transaction commits, together with the change that made it necessary.
+
+    Args:
+        namespace: The name of the cache namespace.
+
+    Returns:
+        int: The new version.
+
+    Raises:
+        None
+    """
+    cache_version = models.CacheVersion
+    query = insert(cache_version).values(namespace=namespace, version=1)
+    query = query.on_conflict_do_update(
+        index_elements=[cache_version.namespace],
+        set_={
+            "version": cache_version.version + 1,
+            "updated_at": func.now(),  # pylint: disable=not-callable
+        },
+    ).returning(cache_version.version)
+
+    return await db.session.scalar(query)
+
+
+async def save(obj: Union[ModelT, List[ModelT]]) -> None:
+    """Save an object or a list of objects to the database.
+
+    Args:
+        obj: The object or list of objects to save.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    if isinstance(obj, list):
+        db.session.add_all(obj)
+        return
+
+    db.session.add(obj)
+
+
+async def commit(session) -> None:
+    """Commit the changes made in the session to the database.
+
+    Args:
+        session: The database session.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    await session.commit()
+
+
+async def update(cls: Type[ModelT], instance_id: int, **kwargs) -> None:
+    """Update an instance of the specified model with the given ID.
+
+    Args:
+        cls: The type of the model.
+        instance_id: The ID of the instance to update.
+        **kwargs: The attributes and values to update.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    query = (
+        sql_update(cls)
+        .where(cls.id == instance_id)
+        .values(**kwargs)
+        .execution_options(synchronize_session="fetch")
+    )
+    await db.session.execute(query)
+
+
+async def delete(obj: Type[ModelT]) -> None:
+    """Delete an object from the database.
+
+    Args:
+        obj: The object to delete.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+
+    # TODO: Test this
+    # if isinstance(obj, list):
+    #     for object in obj:
+    #         db.session.delete(object)
+    #     return
+
+    # TODO: Await needed?
+    await db.session.delete(obj)
+
+
+async def refresh(obj: Type[ModelT]) -> None:
+    """Refresh the state of an object from the database.
+
+    Args:
+        obj: The object to refresh.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    return await db.session.refresh(obj)
@@ -0,0 +1,149 @@
+from decimal import Decimal
+from typing import Type
+
+from sqlalchemy import Row, bindparam
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import update as sql_update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm.attributes import InstrumentedAttribute, set_committed_value
+
+from app import models
+from app.database import db
+from app.repository.base import ModelT
+
+
+async def bulk_insert(cls: Type[ModelT], value_list: list[dict]) -> list[int]:
+    """Insert many rows with multi-row INSERT statements.
+
+    Args:
+        cls: The type of the model.
+        value_list: The column values of each row.
+
+    Returns:
+        list[int]: The IDs of the inserted rows, in the order of value_list.
+
+    Raises:
+        None
+    """
+    if not value_list:
+        return []
+
+    query = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+    result = await db.session.scalars(query, value_list)
+    return result.all()
+
+
+async def bulk_insert_ignoring_conflicts(
+    cls: Type[ModelT],
+    value_list: list[dict],
+    index_elements: list[InstrumentedAttribute],
+    returning: list[InstrumentedAttribute],
+) -> list[Row]:
+    """Insert many rows, skipping those that already exist in a unique index.
+
+    The rows are written with multi-row INSERT ... ON CONFLICT DO NOTHING
+    statements, so existing rows are skipped without looking them up first.
+
+    Args:
+        cls: The type of the model.
+        value_list: The column values of each row.
+        index_elements: The columns of the unique index.
+        returning: The columns to return for every inserted row.
+
+    Returns:
+        list[Row]: The returning columns of the inserted rows, in no particular
+            order.
+
+    Raises:
+        None
+    """
+    if not value_list:
+        return []
+
+    query = (
+        insert(cls)
+        .on_conflict_do_nothing(index_elements=index_elements)
+        .returning(*returning)
+    )
+    result = await db.session.execute(query, value_list)
+    return result.all()
+
+
+async def delete_by_ids(cls: Type[ModelT], id_list: list[int]) -> None:
+    """Delete many rows by primary key in one statement.
+
+    Args:
+        cls: The type of the model.
+        id_list: The IDs of the rows to delete.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    if id_list:
+        await db.session.execute(
+            sql_delete(cls)
+            .where(cls.id.in_(id_list))
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def bulk_update(cls: Type[ModelT], value_list: list[dict]) -> None:
+    """Update many rows by primary key in one executemany round trip.
+
+    Args:
+        cls: The type of the model.
+        value_list: The values of each row, including its "id".
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    if value_list:
+        await db.session.execute(sql_update(cls), value_list)
+
+
+async def increment_balances(delta_map: dict[int, Decimal]) -> None:
+    """Add an amount to the balance of each given account.
+
+    Args:
+        delta_map: The amount to add, keyed by account ID.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    if not delta_map:
+        return
+
+    account = models.Account.__table__
+    query = (
+        sql_update(account)
+        .where(account.c.id == bindparam("account_id"))
+        .values(balance=account.c.balance + bindparam("delta"))
+    )
+
+    await db.session.execute(
+        query,
+        [
+            {"account_id": account_id, "delta": delta}
+            for account_id, delta in delta_map.items()
+        ],
+    )
+
+    # Keep already loaded accounts in line with the database, like
+    # synchronize_session does for ORM-enabled updates
+    for account_id, delta in delta_map.items():
+        loaded_account = db.session.identity_map.get(
+            db.session.identity_key(models.Account, account_id)
+        )
+        if loaded_account is not None:
+            set_committed_value(
+                loaded_account, "balance", loaded_account.balance + delta
+            )
@@ -0,0 +1,153 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Row, or_
+from sqlalchemy.future import select
+
+from app import models
+from app.database import db
+from app.repository.base import load_profile
+from app.utils.enums import LoadProfile
+
+
+async def get_scheduled_transactions_from_period(
+    account_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    profile: LoadProfile = LoadProfile.LIST,
+) -> list[models.TransactionScheduled]:
+    """Retrieve scheduled transactions for a specific account within a given period.
+
+    Args:
+        account_id: The ID of the account.
+        start_date: The start date of the period.
+        end_date: The end date of the period.
+        profile: The loading profile of the scheduled transactions.
+
+    Returns:
+        list[models.TransactionScheduled]:
+            A list of scheduled transactions within the specified period.
+
+    Raises:
+        None
+    """
+    transaction = models.TransactionScheduled
+
+    query = (
+        select(transaction)
+        .filter(transaction.date_end <= end_date)
+        .filter(transaction.date_start >= start_date)
+        .filter(account_id == transaction.account_id)
+    )
+    query = load_profile(query, transaction, profile)
+
+    result = await db.session.execute(query)
+    return result.scalars().all()
+
+
+async def get_due_scheduled_transactions(
+    now: datetime, limit: int, after_id: int = 0
+) -> list[Row]:
+    """Lock and retrieve a batch of scheduled transactions with due occurrences.
+
+    A schedule is due once its next_run_at has passed, so exhausted schedules
+    and schedules waiting for their next occurrence are not selected. Only the
+    columns needed to materialize occurrences are selected. Rows are locked
+    with FOR UPDATE SKIP LOCKED, so concurrent runs never process the same
+    schedule twice.
+
+    Args:
+        now: Occurrences up to this date are due.
+        limit: The maximum number of scheduled transactions to return.
+        after_id: Only return scheduled transactions with a higher ID.
+
+    Returns:
+        list[Row]: The scheduled transactions, ordered by ID.
+
+    Raises:
+        None
+    """
+    scheduled = models.TransactionScheduled
+    information = models.TransactionInformation
+
+    query = (
+        select(
+            scheduled.id,
+            scheduled.account_id,
+            scheduled.offset_account_id,
+            scheduled.frequency_id,
+            scheduled.date_start,
+            scheduled.date_end,
+            scheduled.last_executed_at,
+            information.amount,
+            information.reference,
+            information.category_id,
+        )
+        .join(information, scheduled.information_id == information.id)
+        .filter(scheduled.id > after_id)
+        .filter(scheduled.next_run_at <= now)
+        .order_by(scheduled.id)
+        .limit(limit)
+        .with_for_update(of=scheduled, skip_locked=True)
+    )
+
+    result = await db.session.execute(query)
+    return result.all()
+
+
+async def get_scheduled_transactions_for_account(
+    account_id: int, start_date: Optional[datetime], end_date: datetime
+) -> list[Row]:
+    """Retrieve the scheduled transactions that can occur in a period.
+
+    Schedules where the account is the offset account are included as well.
+    Only the columns needed to expand occurrences are selected.
+
+    Args:
+        account_id: The ID of the account.
+        start_date: The start date of the period, or None for every schedule
+            that still has occurrences to create.
+        end_date: The end date of the period.
+
+    Returns:
+        list[Row]: The scheduled transactions, ordered by ID.
+
+    Raises:
+        None
+    """
+    scheduled = models.TransactionScheduled
+    information = models.TransactionInformation
+
+    query = (
+        select(
+            scheduled.id,
+            scheduled.account_id,
+            scheduled.offset_account_id,
+            scheduled.frequency_id,
+            scheduled.date_start,
+            scheduled.date_end,
+            scheduled.last_executed_at,
+            information.amount,
+            information.reference,
+            information.category_id,
+        )
+        .join(information, scheduled.information_id == information.id)
+        .filter(
+            or_(
+                scheduled.account_id == account_id,
+                scheduled.offset_account_id == account_id,
+            )
+        )
+        .filter(scheduled.date_start <= end_date)
+        .order_by(scheduled.id)
+    )
+
+    if start_date is None:
+        query = query.filter(scheduled.next_run_at.is_not(None))
+    else:
+        query = query.filter(
+            or_(scheduled.date_end.is_(None), scheduled.date_end >= start_date)
+        )
+
+    result = await db.session.execute(query)
+    return result.all()
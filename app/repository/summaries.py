@@ -0,0 +1,161 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import extract, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+
+from app import models
+from app.database import db
+from app.utils.classes import RoundedDecimal
+
+
+def _get_utc_month(date: datetime) -> Tuple[int, int]:
+    """Get the UTC calendar month the monthly summaries file a date under.
+
+    Args:
+        date: The date, naive dates are taken as UTC.
+
+    Returns:
+        Tuple[int, int]: The year and month.
+    """
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc)
+
+    return date.year, date.month
+
+
+async def update_monthly_summaries(
+    entry_list: list[Tuple[int, datetime, Decimal, int]],
+) -> None:
+    """Apply transaction changes to the monthly account summaries.
+
+    All entries are folded per (account, year, month) and written with a single
+    INSERT ... ON CONFLICT DO UPDATE statement.
+
+    Args:
+        entry_list:
+            (account_id, date, amount, count) tuples. count is 1 for an added
+            transaction and -1 for a removed one.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    summary = models.AccountMonthlySummary
+    delta_map: dict[Tuple[int, int, int], dict] = defaultdict(
+        lambda: {"income": Decimal(0), "expenses": Decimal(0), "count": 0}
+    )
+
+    for account_id, date, amount, count in entry_list:
+        delta = delta_map[(account_id, *_get_utc_month(date))]
+        delta["income" if amount > 0 else "expenses"] += RoundedDecimal(amount) * count
+        delta["count"] += count
+
+    if not delta_map:
+        return
+
+    query = insert(summary).values(
+        [
+            {"account_id": account_id, "year": year, "month": month, **delta}
+            for (account_id, year, month), delta in delta_map.items()
+        ]
+    )
+    query = query.on_conflict_do_update(
+        constraint="account_monthly_summary_account_id_year_month_key",
+        set_={
+            "income": summary.income + query.excluded.income,
+            "expenses": summary.expenses + query.excluded.expenses,
+            "count": summary.count + query.excluded.count,
+            "updated_at": func.now(),  # pylint: disable=not-callable
+        },
+    )
+
+    # The upsert only depends on the given values, so pending ORM changes are
+    # left for the surrounding commit instead of being autoflushed here. The
+    # execution option keeps the session's autoflush setting untouched, unlike
+    # no_autoflush, which interleaving callers of one session can leave off.
+    await db.session.execute(query, execution_options={"autoflush": False})
+
+
+async def rebuild_monthly_summaries(account_id: Optional[int] = None) -> None:
+    """Regenerate the monthly account summaries from the transactions table.
+
+    Transactions are filed under their UTC calendar month, like
+    update_monthly_summaries does, whatever the time zone of the connection is.
+
+    Args:
+        account_id: Only rebuild the summaries of this account (default: all accounts).
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+    summary = models.AccountMonthlySummary
+    transaction = models.Transaction
+    amount = transaction.amount
+    utc_date = func.timezone("UTC", transaction.date)
+    year = extract("year", utc_date)
+    month = extract("month", utc_date)
+
+    delete_query = sql_delete(summary)
+    aggregate_query = select(
+        transaction.account_id,
+        year,
+        month,
+        func.coalesce(func.sum(amount).filter(amount > 0), 0),
+        func.coalesce(func.sum(amount).filter(amount < 0), 0),
+        func.count(),  # pylint: disable=not-callable
+    ).group_by(transaction.account_id, year, month)
+
+    if account_id is not None:
+        delete_query = delete_query.where(summary.account_id == account_id)
+        aggregate_query = aggregate_query.where(transaction.account_id == account_id)
+
+    await db.session.execute(delete_query)
+    await db.session.execute(
+        insert(summary).from_select(
+            ["account_id", "year", "month", "income", "expenses", "count"],
+            aggregate_query,
+        )
+    )
+
+
+async def get_monthly_summaries(
+    account_id: int, start_date: datetime, end_date: datetime
+) -> list[models.AccountMonthlySummary]:
+    """Retrieve the monthly summaries of an account within a given period.
+
+    Args:
+        account_id: The ID of the account.
+        start_date: The start date of the period.
+        end_date: The end date of the period.
+
+    Returns:
+        list[models.AccountMonthlySummary]:
+            The monthly summaries with at least one transaction, oldest first.
+
+    Raises:
+        None
+    """
+    summary = models.AccountMonthlySummary
+    period = tuple_(summary.year, summary.month)
+
+    query = (
+        select(summary)
+        .filter(summary.account_id == account_id)
+        .filter(summary.count > 0)
+        .filter(period >= tuple_(*_get_utc_month(start_date)))
+        .filter(period <= tuple_(*_get_utc_month(end_date)))
+        .order_by(summary.year, summary.month)
+    )
+
+    result = await db.session.execute(query)
+    return result.scalars().all()
@@ -0,0 +1,267 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional, Tuple
+
+from sqlalchemy import Date, Row, cast, func, tuple_
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+
+from app import models
+from app.database import db
+from app.repository.base import load_profile
+from app.utils.dataclasses_utils import DailyTransactionSummary, TransactionSummary
+from app.utils.enums import LoadProfile
+
+
+async def get_transactions_from_period(
+    account_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    profile: LoadProfile = LoadProfile.LIST,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> list[models.Transaction]:
+    """Retrieve transactions for a specific account within a given period.
+
+    Args:
+        account_id: The ID of the account.
+        start_date: The start date of the period.
+        end_date: The end date of the period.
+        profile: The loading profile of the transactions.
+        limit: The maximum number of transactions to return, all if None.
+        after: The (date, id) of the last transaction of the previous page.
+
+    Returns:
+        list[models.Transaction]:
+            A list of transactions within the specified period, newest first.
+
+    Raises:
+        None
+    """
+    transaction = models.Transaction
+    class_date = transaction.date
+
+    query = (
+        select(transaction)
+        .filter(class_date <= end_date)
+        .filter(class_date >= start_date)
+        .filter(account_id == transaction.account_id)
+        .order_by(class_date.desc(), transaction.id.desc())
+        .limit(limit)
+    )
+    query = load_profile(query, transaction, profile)
+
+    if after is not None:
+        query = query.filter(tuple_(class_date, transaction.id) < tuple_(*after))
+
+    result = await db.session.execute(query)
+    return result.scalars().all()
+
+
+async def get_transaction_summary(
+    account_id: int, start_date: datetime, end_date: datetime
+) -> TransactionSummary:
+    """Aggregate income, expenses and totals of an account within a given period.
+
+    The period totals and the per-day buckets come from a single
+    GROUP BY ROLLUP query, so no transaction rows are loaded. Days are
+    calendar days in UTC, whatever the time zone of the connection is.
+
+    Args:
+        account_id: The ID of the account.
+        start_date: The start date of the period.
+        end_date: The end date of the period.
+
+    Returns:
+        TransactionSummary: The period totals and the per-day buckets, newest first.
+
+    Raises:
+        None
+    """
+    transaction = models.Transaction
+    amount = transaction.amount
+    day = cast(func.timezone("UTC", transaction.date), Date)
+
+    query = (
+        select(
+            day.label("day"),
+            func.coalesce(func.sum(amount).filter(amount > 0), 0).label("income"),
+            func.coalesce(func.sum(amount).filter(amount < 0), 0).label("expenses"),
+            func.coalesce(func.sum(amount), 0).label("total"),
+            func.count().label("count"),  # pylint: disable=not-callable
+        )
+        .filter(transaction.account_id == account_id)
+        .filter(transaction.date >= start_date)
+        .filter(transaction.date <= end_date)
+        .group_by(func.rollup(day))  # pylint: disable=not-callable
+        .order_by(day.desc().nulls_first())
+    )
+
+    result = await db.session.execute(query)
+
+    summary = TransactionSummary()
+    for row in result:
+        if row.day is None:
+            summary.income = row.income
+            summary.expenses = row.expenses
+            summary.total = row.total
+            summary.count = row.count
+            continue
+
+        summary.days.append(
+            DailyTransactionSummary(
+                row.day, row.income, row.expenses, row.total, row.count
+            )
+        )
+
+    return summary
+
+
+async def get_category_totals(
+    account_id: int, start_date: datetime, end_date: datetime
+) -> list[Row]:
+    """Sum an account's transactions per category within a given period.
+
+    Transactions created from scheduled transactions are left out.
+
+    Args:
+        account_id: The ID of the account.
+        start_date: The start date of the period.
+        end_date: The end date of the period.
+
+    Returns:
+        list[Row]: (category_id, total) rows.
+
+    Raises:
+        None
+    """
+    transaction = models.Transaction
+    information = models.TransactionInformation
+
+    query = (
+        select(information.category_id, func.sum(transaction.amount))
+        .join(information, transaction.information_id == information.id)
+        .filter(transaction.account_id == account_id)
+        .filter(transaction.date >= start_date)
+        .filter(transaction.date <= end_date)
+        .filter(transaction.scheduled_transaction_id.is_(None))
+        .group_by(information.category_id)
+    )
+
+    result = await db.session.execute(query)
+    return result.all()
+
+
+async def stream_account_transactions(
+    account_id: int, batch_size: int = 1000
+) -> AsyncIterator[list[Row]]:
+    """Stream all transactions of an account with their labels, oldest first.
+
+    The rows are fetched through a server-side cursor in batches, so memory
+    stays constant regardless of the account's history.
+
+    Args:
+        account_id: The ID of the account.
+        batch_size: The number of rows fetched per round trip.
+
+    Yields:
+        list[Row]: The next batch of rows with id, date, amount, reference,
+            category, section and offset_account_id.
+
+    Raises:
+        None
+    """
+    transaction = models.Transaction
+    information = models.TransactionInformation
+    category = models.TransactionCategory
+    section = models.TransactionSection
+    offset_transaction = aliased(models.Transaction)
+
+    query = (
+        select(
+            transaction.id,
+            transaction.date,
+            transaction.amount,
+            information.reference,
+            category.label.label("category"),
+            section.label.label("section"),
+            offset_transaction.account_id.label("offset_account_id"),
+        )
+        .join(information, transaction.information_id == information.id)
+        .outerjoin(category, information.category_id == category.id)
+        .outerjoin(section, category.section_id == section.id)
+        .outerjoin(
+            offset_transaction,
+            transaction.offset_transactions_id == offset_transaction.id,
+        )
+        .filter(transaction.account_id == account_id)
+        .order_by(transaction.date, transaction.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    result = await db.session.stream(query)
+    async for partition in result.partitions():
+        yield partition
+
+
+async def get_transactions_page(
+    account_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> list[Row]:
+    """Retrieve one page of an account's transactions, newest first.
+
+    Pages are keyed on (date, id), so every page is a bounded index range scan
+    no matter how far into the history it starts. Only the listed columns are
+    selected, with explicit joins, so no ORM objects are built.
+
+    Args:
+        account_id: The ID of the account.
+        start_date: The start date of the period.
+        end_date: The end date of the period.
+        limit: The maximum number of transactions to return.
+        after: The (date, id) of the last transaction of the previous page.
+
+    Returns:
+        list[Row]: The rows of the page with id, account_id,
+            offset_transactions_id, date, amount, reference, category_id,
+            category_label, section_id and section_label. The category and
+            section fields are None for transactions without them.
+
+    Raises:
+        None
+    """
+    transaction = models.Transaction
+    information = models.TransactionInformation
+    category = models.TransactionCategory
+    section = models.TransactionSection
+
+    query = (
+        select(
+            transaction.id,
+            transaction.account_id,
+            transaction.offset_transactions_id,
+            transaction.date,
+            transaction.amount,
+            information.reference,
+            information.category_id,
+            category.label.label("category_label"),
+            section.id.label("section_id"),
+            section.label.label("section_label"),
+        )
+        .join(information, transaction.information_id == information.id)
+        .outerjoin(category, information.category_id == category.id)
+        .outerjoin(section, category.section_id == section.id)
+        .filter(transaction.account_id == account_id)
+        .filter(transaction.date >= start_date)
+        .filter(transaction.date <= end_date)
+        .order_by(transaction.date.desc(), transaction.id.desc())
+        .limit(limit)
+    )
+
+    if after is not None:
+        query = query.filter(tuple_(transaction.date, transaction.id) < tuple_(*after))
+
+    result = await db.session.execute(query)
+    return result.all()
@@ -1,6 +1,7 @@
 import calendar
-from datetime import datetime
+from datetime import datetime, timezone
 from itertools import groupby
+from typing import Optional
 
 from fastapi import Cookie, Depends, Request
 from fastapi.exceptions import HTTPException
@@ -17,6 +18,7 @@ from app.services.transactions import TransactionService
 from app.utils import PageRouter
 from app.utils.account_utils import get_account_list_template
 from app.utils.enums import FeedbackType
+from app.utils.pagination import parse_cursor
 from app.utils.template_utils import add_breadcrumb, render_template, set_feedback
 
 PREFIX = f"{dashboard_router.prefix}/accounts"
@@ -24,6 +26,8 @@ router = PageRouter(prefix=PREFIX, tags=["Accounts"])
 service = AccountService()
 transaction_service = TransactionService()
 
+TRANSACTION_PAGE_LIMIT = 50
+
 
 async def handle_account_route(
     request, user: models.User, account_id: int, create_link=True
@@ -166,12 +170,13 @@ async def page_create_account(
 
 
 @router.get("/{account_id}")
-async def page_get_account(
+async def page_get_account(  # pylint: disable=too-many-arguments
     request: Request,
     account_id: int,
     user: models.User = Depends(current_active_user),
     date_start: datetime = Cookie(None),
     date_end: datetime = Cookie(None),
+    cursor: Optional[str] = None,
 ):
     """
     Renders the account details page.
@@ -182,13 +187,19 @@ async def page_get_account(
         user: The current active user.
         date_start: The start date for filtering transactions (optional).
         date_end: The end date for filtering transactions (optional).
+        cursor: The cursor of the page of transactions (optional).
 
     Returns:
         TemplateResponse: The rendered account details page.
+
+    Raises:
+        HTTPException: If the cursor is invalid or the account is not found.
     """
 
     account = await handle_account_route(request, user, account_id, False)
 
+    after = parse_cursor(cursor)
+
     if date_start is None:
         date_start = datetime.now().replace(
             day=1, hour=0, minute=0, second=0, microsecond=0
@@ -200,32 +211,18 @@ async def page_get_account(
             day=last_day, hour=23, minute=59, second=59, microsecond=999999
         )
 
-    transaction_list: list[models.Transaction] = (
-        await transaction_service.get_transaction_list(
-            user, account_id, date_start, date_end
-        )
-    ) or []
-
-    expenses = 0
-    income = 0
-    total = 0
-
-    for transaction in transaction_list:
-        if transaction.information.amount < 0:
-            expenses += transaction.information.amount
-        else:
-            income += transaction.information.amount
-
-        total += transaction.information.amount
-
-    # Sort the transactions by date.
-    transaction_list.sort(key=lambda x: x.information.date, reverse=True)
+    page = await transaction_service.get_account_transactions(
+        account, date_start, date_end, TRANSACTION_PAGE_LIMIT, after
+    )
+    summary = page["summary"]
 
-    # Group the transactions by date.
+    # The transactions are sorted by date, newest first, and the days of the
+    # summary are UTC calendar days.
+    day_summaries = {day.day: day for day in summary.days}
     transaction_list_grouped = [
-        {"date": date, "transactions": list(transactions)}
-        for date, transactions in groupby(
-            transaction_list, key=lambda x: x.information.date
+        {"summary": day_summaries[day], "transactions": list(transactions)}
+        for day, transactions in groupby(
+            page["transactions"], key=lambda x: x.date.astimezone(timezone.utc).date()
         )
     ]
     return render_template(
@@ -234,10 +231,11 @@ async def page_get_account(
         {
             "account": account,
             "transaction_list_grouped": transaction_list_grouped,
+            "next_cursor": page["next_cursor"],
             "date_picker_form": schemas.DatePickerForm(request),
-            "expenses": expenses,
-            "income": income,
-            "total": total,
+            "expenses": summary.expenses,
+            "income": summary.income,
+            "total": summary.total,
         },
     )
 
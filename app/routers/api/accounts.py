@@ -1,17 +1,28 @@
-from fastapi import Depends, status
+from datetime import datetime
+
+from fastapi import Depends, Query, status
 from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
 
 from app import schemas
 from app import transaction_manager as tm
 from app.models import User
 from app.routers.api.users import current_active_user
+from app.services import exports as export_service
+from app.services import forecasts as forecast_service
 from app.services.accounts import AccountService
 from app.utils import APIRouterExtended
+from app.utils.enums import ExportFormat
 
 router = APIRouterExtended(prefix="/accounts", tags=["Accounts"])
 ResponseModel = schemas.AccountData
 service = AccountService()
 
+EXPORT_MEDIA_TYPE_MAP = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
 
 @router.get("/", response_model=list[ResponseModel])
 async def api_get_accounts(current_user: User = Depends(current_active_user)):
@@ -54,6 +65,82 @@ async def api_get_account(
     return account
 
 
+@router.get(
+    "/{account_id}/monthly-summary", response_model=list[schemas.MonthlySummaryData]
+)
+async def api_get_monthly_summaries(
+    account_id: int,
+    date_start: datetime,
+    date_end: datetime,
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Retrieves the monthly income and expense summaries of an account.
+
+    Args:
+        account_id: The ID of the account.
+        date_start: The start date of the period.
+        date_end: The end date of the period.
+        current_user: The current active user.
+
+    Returns:
+        list[MonthlySummaryData]: The monthly summaries, oldest first.
+
+    Raises:
+        HTTPException: If the account is not found.
+    """
+
+    summary_list = await service.get_monthly_summaries(
+        current_user, account_id, date_start, date_end
+    )
+
+    if summary_list is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Account not found")
+
+    return summary_list
+
+
+@router.get("/{account_id}/forecast", response_model=schemas.BalanceForecast)
+async def api_get_balance_forecast(
+    account_id: int,
+    until: datetime,
+    history_days: int = Query(default=0, ge=0, le=3650),
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Retrieves the projected daily balances of an account.
+
+    Args:
+        account_id: The ID of the account.
+        until: The last day of the forecast.
+        history_days: The number of past days whose category averages are
+            included (0 disables them).
+        current_user: The current active user.
+
+    Returns:
+        schemas.BalanceForecast: The forecast.
+
+    Raises:
+        HTTPException: If the account is not found or the forecast is too long.
+    """
+
+    try:
+        forecast = await forecast_service.get_balance_forecast(
+            current_user, account_id, until, history_days
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    if forecast is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Account not found"
+        )
+
+    return forecast
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=ResponseModel)
 async def api_create_account(
     account: schemas.Account, current_user: User = Depends(current_active_user)
@@ -122,3 +209,50 @@ async def api_delete_account(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Account not found"
         )
+
+
+@router.get(
+    "/{account_id}/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPE_MAP.values()}
+        }
+    },
+)
+async def api_export_account(
+    account_id: int,
+    file_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Streams all transactions of an account as CSV or NDJSON.
+
+    Args:
+        account_id: The ID of the account.
+        file_format: The format of the export.
+        current_user: The current active user.
+
+    Returns:
+        StreamingResponse: The export as a file download.
+
+    Raises:
+        HTTPException: If the account is not found.
+    """
+
+    content = await export_service.export_account_transactions(
+        current_user, account_id, file_format
+    )
+
+    if content is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Account not found")
+
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPE_MAP[file_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="account-{account_id}.{file_format.value}"'
+            )
+        },
+    )
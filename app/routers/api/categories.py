@@ -2,6 +2,7 @@ from fastapi import Depends, status
 from fastapi.exceptions import HTTPException
 
 from app import schemas
+from app import transaction_manager as tm
 from app.models import User
 from app.routers.api.users import current_active_user
 from app.services import categories as service
@@ -56,37 +57,92 @@ async def api_get_category(
     return category
 
 
-# @router.post("/", status_code=status.HTTP_201_CREATED, response_model=response_model)
-# async def api_create_category(
-#     category: schemas.category, current_user: User = Depends(current_active_user)
-# ):
-#     category = await tm.transaction(service.create_category, current_user, category)
-#     return category
-
-
-# @router.put("/{category_id}", response_model=response_model)
-# async def api_update_category(
-#     category_id: int,
-#     category_data: schemas.categoryUpdate,
-#     current_user: User = Depends(current_active_user),
-# ):
-#     return await tm.transaction(
-#         service.update_category, current_user, category_id, category_data
-#     )
-
-
-# @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
-# async def api_delete_category(
-#     category_id: int, current_user: User = Depends(current_active_user)
-# ):
-#     result = await tm.transaction(service.delete_category, current_user, category_id)
-#     if result:
-#         return Response(
-#             status_code=status.HTTP_204_NO_CONTENT,
-#             content="category deleted successfully",
-#         )
-
-#     if result is None:
-#         raise HTTPException(
-#             status_code=status.HTTP_404_NOT_FOUND, detail="category not found"
-#         )
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=ResponseModel)
+async def api_create_category(
+    category_data: schemas.CategoryCreate,
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Creates a custom category of the user.
+
+    Args:
+        category_data: The label and the section of the category.
+        current_user: The current active user.
+
+    Returns:
+        ResponseModel: The created category.
+
+    Raises:
+        HTTPException: If the section is not found.
+    """
+
+    category = await tm.transaction(
+        service.create_category,
+        current_user,
+        category_data.label,
+        category_data.section_id,
+    )
+
+    if category:
+        return category
+
+    raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Section not found")
+
+
+@router.post("/{category_id}", response_model=ResponseModel)
+async def api_update_category(
+    category_id: int,
+    category_data: schemas.CategoryUpdate,
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Renames a custom category of the user.
+
+    Args:
+        category_id: The ID of the category.
+        category_data: The new label of the category.
+        current_user: The current active user.
+
+    Returns:
+        ResponseModel: The updated category.
+
+    Raises:
+        HTTPException: If the category is not found.
+    """
+
+    category = await tm.transaction(
+        service.update_category, current_user, category_id, category_data.label
+    )
+
+    if category:
+        return category
+
+    raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Category not found")
+
+
+@router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def api_delete_category(
+    category_id: int, current_user: User = Depends(current_active_user)
+):
+    """
+    Deletes a custom category of the user.
+
+    Args:
+        category_id: The ID of the category.
+        current_user: The current active user.
+
+    Returns:
+        None
+
+    Raises:
+        HTTPException: If the category is not found or still has transactions.
+    """
+
+    result = await tm.transaction(service.delete_category, current_user, category_id)
+    if result:
+        return None
+
+    if result is False:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Category not found")
+
+    raise HTTPException(status.HTTP_409_CONFLICT, detail="Category is in use")
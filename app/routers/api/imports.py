@@ -0,0 +1,145 @@
+import codecs
+from tempfile import SpooledTemporaryFile
+
+from fastapi import BackgroundTasks, Depends, Request, status
+from fastapi.exceptions import HTTPException
+
+from app import schemas
+from app import transaction_manager as tm
+from app.config import settings
+from app.models import User
+from app.routers.api.users import current_active_user
+from app.services import imports as import_service
+from app.utils import APIRouterExtended
+from app.utils.enums import ImportFormat
+from app.utils.statement_parsing import CsvMapping
+
+router = APIRouterExtended(prefix="/imports", tags=["Imports"])
+ResponseModel = schemas.ImportJobData
+
+# Statements up to this size are buffered in memory, larger ones on disk
+MAX_IMPORT_MEMORY_BYTES = 1024 * 1024
+
+
+@router.post(
+    "/",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=ResponseModel,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ofx": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def api_create_import(  # pylint: disable=too-many-arguments
+    request: Request,
+    background_tasks: BackgroundTasks,
+    account_id: int,
+    category_id: int,
+    file_format: ImportFormat = ImportFormat.CSV,
+    encoding: str = "utf-8",
+    mapping: CsvMapping = Depends(),
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Imports a CSV or OFX bank statement, sent as the request body.
+
+    The statement is processed after the response has been sent; its
+    progress can be followed with GET /api/imports/{job_id}.
+
+    Args:
+        request: The request with the statement as body.
+        background_tasks: The tasks to run after the response.
+        account_id: The ID of the account to import into.
+        category_id: The ID of the category of the imported transactions.
+        file_format: The format of the statement.
+        encoding: The text encoding of the statement.
+        mapping: The layout of a CSV statement.
+        current_user: The current active user.
+
+    Returns:
+        ResponseModel: The pending import job.
+
+    Raises:
+        HTTPException: If the encoding is unknown, the statement is too large
+            or the account is not found.
+    """
+
+    try:
+        codecs.lookup(encoding)
+    except LookupError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown encoding: {encoding}",
+        ) from e
+
+    file = SpooledTemporaryFile(  # pylint: disable=consider-using-with
+        max_size=MAX_IMPORT_MEMORY_BYTES
+    )
+    size = 0
+
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > settings.import_max_bytes:
+            file.close()
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"A statement is limited to {settings.import_max_bytes} bytes",
+            )
+        file.write(chunk)
+
+    file.seek(0)
+
+    job = await tm.transaction(
+        import_service.create_import_job, current_user, account_id, file_format
+    )
+
+    if not job:
+        file.close()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Account not found"
+        )
+
+    background_tasks.add_task(
+        import_service.run_import_job,
+        job.id,
+        file,
+        category_id,
+        encoding=encoding,
+        mapping=mapping,
+    )
+
+    return job
+
+
+@router.get("/{job_id}", response_model=ResponseModel)
+async def api_get_import(
+    job_id: int,
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Retrieves the status and progress of an import job.
+
+    Args:
+        job_id: The ID of the import job.
+        current_user: The current active user.
+
+    Returns:
+        ResponseModel: The import job.
+
+    Raises:
+        HTTPException: If the import job is not found.
+    """
+
+    job = await tm.transaction(import_service.get_import_job, current_user, job_id)
+
+    if job:
+        return job
+
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found"
+    )
@@ -44,6 +44,41 @@ async def api_get_transactions(
     )
 
 
+@router.get("/projected", response_model=list[schemas.ProjectedTransaction])
+async def api_get_projected_transactions(
+    account_id: int,
+    date_start: datetime,
+    date_end: datetime,
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Retrieves the upcoming occurrences of an account's scheduled transactions.
+
+    Args:
+        account_id: The ID of the account.
+        date_start: The start date of the projection.
+        date_end: The end date of the projection.
+        current_user: The current active user.
+
+    Returns:
+        list[schemas.ProjectedTransaction]: The projected transactions.
+
+    Raises:
+        HTTPException: If the account is not found.
+    """
+
+    projected_list = await service.get_projected_transactions(
+        current_user, account_id, date_start, date_end
+    )
+
+    if projected_list is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Account not found"
+        )
+
+    return projected_list
+
+
 @router.get("/{transaction_id}", response_model=ResponseModel)
 async def api_get_transaction(
     transaction_id: int,
@@ -0,0 +1,26 @@
+from fastapi import Depends
+
+from app import schemas
+from app.auth_manager import current_active_superuser
+from app.database import db
+from app.models import User
+from app.utils import APIRouterExtended
+
+router = APIRouterExtended(prefix="/system", tags=["System"])
+
+
+@router.get("/pool", response_model=schemas.PoolStatus)
+async def api_get_pool_status(
+    _current_user: User = Depends(current_active_superuser),
+):
+    """
+    Retrieves the state of the database connection pool.
+
+    Args:
+        _current_user: The current active superuser.
+
+    Returns:
+        PoolStatus: Connection counts and checkout wait times of the pool.
+    """
+
+    return db.get_pool_status()
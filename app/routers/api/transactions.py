@@ -1,6 +1,8 @@
+import json
 from datetime import datetime
+from typing import Any, Optional
 
-from fastapi import Depends, Response, status
+from fastapi import Depends, Query, Request, Response, status
 from fastapi.exceptions import HTTPException
 
 from app import schemas
@@ -9,39 +11,59 @@ from app.models import User
 from app.routers.api.users import current_active_user
 from app.services.transactions import TransactionService
 from app.utils import APIRouterExtended
+from app.utils.pagination import parse_cursor
+from app.utils.responses import ApiJSONResponse
 
 router = APIRouterExtended(prefix="/transactions", tags=["Transactions"])
 ResponseModel = schemas.Transaction
 service = TransactionService()
 
+MAX_BULK_ROWS = 100_000
+MAX_BULK_BYTES = 32 * 1024 * 1024
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
 
-@router.get("/", response_model=list[ResponseModel])
-async def api_get_transactions(
+
+@router.get("/", response_model=schemas.TransactionPage)
+async def api_get_transactions(  # pylint: disable=too-many-arguments
     account_id: int,
     date_start: datetime,
     date_end: datetime,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     current_user: User = Depends(current_active_user),
 ):
     """
-    Retrieves a list of transactions.
+    Retrieves a page of transactions, newest first.
 
     Args:
         account_id: The ID of the account.
         date_start: The start date for filtering transactions.
         date_end: The end date for filtering transactions.
+        limit: The maximum number of transactions on the page.
+        cursor: The next_cursor of the previous page.
         current_user: The current active user.
 
     Returns:
-        list[ResponseModel]: A list of transaction information.
+        TransactionPage: The transactions of the page and the cursor of the next page.
 
     Raises:
-        HTTPException: If the account is not found.
+        HTTPException: If the cursor is invalid or the account is not found.
     """
 
-    return await service.get_transaction_list(
-        current_user, account_id, date_start, date_end
+    after = parse_cursor(cursor)
+
+    page = await service.get_transaction_page(
+        current_user, account_id, date_start, date_end, limit, after
     )
 
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Account not found"
+        )
+
+    # The page is already in the shape of the response model
+    return ApiJSONResponse(page)
+
 
 @router.get("/{transaction_id}", response_model=ResponseModel)
 async def api_get_transaction(
@@ -105,6 +127,128 @@ async def api_create_transaction(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=schemas.BulkTransactionResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"type": "object"}}
+                },
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def api_create_transactions_bulk(
+    request: Request,
+    current_user: User = Depends(current_active_user),
+):
+    """
+    Creates many transactions from a JSON array or NDJSON (one object per line).
+
+    Args:
+        request: The request with the transactions as body.
+        current_user: The current active user.
+
+    Returns:
+        schemas.BulkTransactionResult: The number of created transactions and
+            the errors of the rejected rows.
+
+    Raises:
+        HTTPException: If the body is too large, cannot be decoded or has too
+            many rows, or if the transactions could not be created.
+    """
+
+    body = await _read_body(request)
+
+    if request.headers.get("content-type", "").split(";")[0] in NDJSON_MEDIA_TYPES:
+        row_list = [
+            _decode_json_line(line) for line in body.splitlines() if line.strip()
+        ]
+    else:
+        try:
+            row_list = json.loads(body)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON"
+            ) from e
+
+        if not isinstance(row_list, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Expected a JSON array",
+            )
+
+    if len(row_list) > MAX_BULK_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {MAX_BULK_ROWS} transactions per request",
+        )
+
+    result = await tm.transaction(
+        service.create_transactions_bulk, current_user, row_list
+    )
+
+    if result:
+        return result
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Transactions not created"
+    )
+
+
+async def _read_body(request: Request) -> bytes:
+    """
+    Reads a bulk request body, rejecting it as soon as it exceeds MAX_BULK_BYTES.
+
+    Args:
+        request: The request.
+
+    Returns:
+        bytes: The body.
+
+    Raises:
+        HTTPException: If the body is larger than MAX_BULK_BYTES.
+    """
+
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"A bulk request is limited to {MAX_BULK_BYTES} bytes",
+    )
+
+    if int(request.headers.get("content-length") or 0) > MAX_BULK_BYTES:
+        raise too_large
+
+    body = bytearray()
+
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > MAX_BULK_BYTES:
+            raise too_large
+
+    return bytes(body)
+
+
+def _decode_json_line(line: bytes) -> Any:
+    """
+    Decodes one NDJSON line.
+
+    Args:
+        line: The raw line.
+
+    Returns:
+        Any: The decoded value, None if the line is not valid JSON.
+    """
+
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
 @router.post("/{transaction_id}", response_model=ResponseModel)
 async def api_update_transaction(
     transaction_id: int,
@@ -0,0 +1,68 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+
+from app.auth_manager import optional_current_active_superuser
+from app.config import settings
+from app.metrics import render_metrics
+from app.models import User
+from app.utils.metrics import CONTENT_TYPE
+
+router = APIRouter(tags=["Metrics"])
+
+
+def _has_metrics_token(request: Request) -> bool:
+    """
+    Checks whether the request carries the configured metrics bearer token.
+
+    Args:
+        request: The request.
+
+    Returns:
+        bool: True if a token is configured and the request sends it.
+    """
+
+    if not settings.metrics_token:
+        return False
+
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+
+    return scheme.lower() == "bearer" and secrets.compare_digest(
+        token.encode(), settings.metrics_token.encode()
+    )
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics(
+    request: Request,
+    current_superuser: Optional[User] = Depends(optional_current_active_superuser),
+):
+    """
+    Exposes the request and database metrics in the Prometheus text format.
+
+    The metrics are only served to superusers and to scrapers that send the
+    METRICS_TOKEN as bearer token.
+
+    Args:
+        request: The request.
+        current_superuser: The current active superuser, if any.
+
+    Returns:
+        Response: The metrics of this worker process.
+
+    Raises:
+        HTTPException: If the metrics are disabled or the client may not
+            read them.
+    """
+
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    if current_superuser is None and not _has_metrics_token(request):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
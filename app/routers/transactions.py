@@ -14,7 +14,7 @@ from app.services.accounts import AccountService
 from app.services.transactions import TransactionService
 from app.utils import PageRouter
 from app.utils.account_utils import get_account_list_template
-from app.utils.template_utils import group_categories_by_section, render_template
+from app.utils.template_utils import render_template
 
 PREFIX = account_router.prefix + "/{account_id}/transactions"
 
@@ -105,11 +105,7 @@ async def populate_transaction_form_category_choices(
         None
     """
 
-    category_list = await category_service.get_categories(user) or []
-    category_data_list = [
-        schemas.CategoryData(**category.__dict__) for category in category_list
-    ]
-    form.category_id.choices = group_categories_by_section(category_data_list)
+    form.category_id.choices = await category_service.get_category_choices(user)
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -4,11 +4,13 @@ import fastapi_users
 from fastapi import APIRouter
 
 from app.auth_manager import auth_backend, fastapi_users
-from app.routers import accounts, auth, dashboard, index, transactions, users
+from app.routers import accounts, auth, dashboard, index, metrics, transactions, users
 from app.routers.api import accounts as api_accounts
 from app.routers.api import auth as api_auth
 from app.routers.api import categories as api_categories
+from app.routers.api import imports as api_imports
 from app.routers.api import scheduled_transactions as api_scheduled_transactions
+from app.routers.api import system as api_system
 from app.routers.api import transactions as api_transactions
 from app.routers.api import users as api_users
 from app.schemas import UserRead, UserUpdate
@@ -45,6 +47,8 @@ router_list: RouterList = [
     {"router": auth.router},
     {"router": users.router},
     {"router": transactions.router},
+    ## Metrics
+    {"router": metrics.router},
     ## Api
     {
         "router": api_users.router,
@@ -60,6 +64,8 @@ router_list: RouterList = [
     {
         "router": api_scheduled_transactions.router,
     },
+    {"router": api_imports.router},
+    {"router": api_system.router},
     ## Fastapi Users
     {
         "router": fastapi_users.get_users_router(UserRead, UserUpdate),
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.config import settings
+from app.database import db
+from app.logger import get_logger
+from app.services import scheduled_transactions as scheduled_service
+
+logger = get_logger(__name__)
+
+
+async def run_scheduled_transactions(
+    now: Optional[datetime] = None, batch_size: Optional[int] = None
+) -> int:
+    """
+    Materializes all due scheduled transactions, committing after every batch.
+
+    Running it again for the same date creates nothing, because every schedule's
+    watermark is advanced in the batch that created its transactions.
+
+    Args:
+        now: Occurrences up to this date are due (default: the current time).
+        batch_size: The number of scheduled transactions per batch.
+
+    Returns:
+        int: The number of created transactions.
+    """
+
+    now = now or datetime.now(timezone.utc)
+    batch_size = batch_size or settings.scheduled_transactions_batch_size
+    created_count = 0
+    after_id: Optional[int] = 0
+
+    async with db.session_scope() as session:
+        while after_id is not None:
+            try:
+                count, after_id = await scheduled_service.execute_due_transactions(
+                    now, batch_size, after_id
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+            created_count += count
+
+    return created_count
+
+
+async def run_scheduler(interval: int) -> None:
+    """
+    Runs the scheduled transactions periodically until cancelled.
+
+    Args:
+        interval: The number of seconds between two runs.
+
+    Returns:
+        None
+    """
+
+    while True:
+        try:
+            created_count = await run_scheduled_transactions()
+            logger.info("Scheduler created %s transactions", created_count)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error occurred while running the scheduler: %s", e)
+
+        await asyncio.sleep(interval)
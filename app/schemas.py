@@ -111,6 +111,15 @@ class CategoryData(Base):
     section: SectionData
 
 
+class CategoryCreate(BaseModel):
+    label: StringContr
+    section_id: int
+
+
+class CategoryUpdate(BaseModel):
+    label: StringContr
+
+
 class TransactionInformationCreate(TransactionInformation):
     account_id: int
     offset_account_id: Optional[int] = None
@@ -129,7 +138,9 @@ class ScheduledTransactionInformationCreate(TransactionInformationBase):
 
 
 class TransactionInformationData(TransactionInformation):
-    category: CategoryData
+    # Stored transactions may have no category
+    category_id: Optional[int]  # type: ignore[assignment]
+    category: Optional[CategoryData]
 
 
 class TransactionBase(Base):
@@ -142,6 +153,37 @@ class Transaction(TransactionBase):
     offset_transactions_id: Optional[int]
 
 
+class TransactionPage(Base):
+    items: list[Transaction]
+    limit: int
+    next_cursor: Optional[str] = None
+
+
+class BulkTransactionError(BaseModel):
+    index: int
+    detail: str
+
+
+class BulkTransactionResult(BaseModel):
+    created: int
+    duplicates: int = 0
+    errors: list[BulkTransactionError]
+
+
+class ImportJobData(Base):
+    id: int
+    account_id: int
+    file_format: str
+    status: str
+    rows_read: int
+    created_count: int
+    duplicate_count: int
+    error_count: int
+    errors: list[BulkTransactionError]
+    created_at: dt
+    finished_at: Optional[dt] = None
+
+
 class ScheduledTransactionData(TransactionBase):
     date_start: dt
     frequency: FrequencyData
@@ -150,6 +192,40 @@ class ScheduledTransactionData(TransactionBase):
     offset_account_id: Optional[int]
 
 
+class ProjectedTransaction(Base):
+    scheduled_transaction_id: int
+    account_id: int
+    date: dt
+    amount: RoundedDecimal
+    reference: str
+    category_id: Optional[int] = None
+
+    model_config = ConfigDict(json_encoders={Decimal: float})
+
+
+class ForecastDay(BaseModel):
+    date: datetime.date
+    balance: RoundedDecimal
+
+    model_config = ConfigDict(json_encoders={Decimal: float})
+
+
+class CategoryAverage(BaseModel):
+    category_id: Optional[int] = None
+    daily_amount: RoundedDecimal
+
+    model_config = ConfigDict(json_encoders={Decimal: float})
+
+
+class BalanceForecast(BaseModel):
+    account_id: int
+    balance: RoundedDecimal
+    days: list[ForecastDay]
+    category_averages: list[CategoryAverage] = []
+
+    model_config = ConfigDict(json_encoders={Decimal: float})
+
+
 class Account(Base):
     label: StringContr
     description: Optional[str] = None
@@ -162,6 +238,29 @@ class AccountData(Account):
     id: int
 
 
+class PoolStatus(BaseModel):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    max_overflow: int
+    checkout_count: int
+    wait_time_total: float
+    wait_time_avg: float
+    wait_time_max: float
+
+
+class MonthlySummaryData(Base):
+    account_id: int
+    year: int
+    month: int
+    income: RoundedDecimal
+    expenses: RoundedDecimal
+    count: int
+
+    model_config = ConfigDict(json_encoders={Decimal: float})
+
+
 class LoginForm(StarletteForm):
     username = StringField("E-Mail", validators=[InputRequired()])
     password = PasswordField("Password", validators=[InputRequired()])
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from app import models
@@ -43,16 +44,45 @@ class AccountService:
         """
 
         logger.info("Getting account %s for user: %s", account_id, current_user.id)
-        account = await repo.get(models.Account, account_id)
+        account = await repo.get_owned(models.Account, account_id, current_user.id)
 
         if account is None:
             return None
 
-        if self.has_user_access_to_account(current_user, account):
-            logger.info("Found account %s for user: %s", account_id, current_user.id)
-            return account
+        logger.info("Found account %s for user: %s", account_id, current_user.id)
+        return account
 
-        return None
+    async def get_monthly_summaries(
+        self,
+        current_user: models.User,
+        account_id: int,
+        date_start: datetime,
+        date_end: datetime,
+    ) -> Optional[list[models.AccountMonthlySummary]]:
+        """
+        Retrieves the monthly income and expense summaries of an account.
+
+        Args:
+            current_user: The current active user.
+            account_id: The ID of the account.
+            date_start: The start date of the period.
+            date_end: The end date of the period.
+
+        Returns:
+            list[AccountMonthlySummary]: The monthly summaries, oldest first.
+        """
+
+        logger.info(
+            "Getting monthly summaries of account %s for user: %s",
+            account_id,
+            current_user.id,
+        )
+        account = await self.get_account(current_user, account_id)
+
+        if account is None:
+            return None
+
+        return await repo.get_monthly_summaries(account_id, date_start, date_end)
 
     async def create_account(
         self, user: models.User, account: schemas.Account
@@ -90,12 +120,9 @@ class AccountService:
         """
 
         logger.info("Updating account %s for user: %s", account_id, current_user.id)
-        db_account = await repo.get(models.Account, account_id)
-
-        if db_account is None:
-            return None
+        db_account = await repo.get_owned(models.Account, account_id, current_user.id)
 
-        if db_account.user_id == current_user.id:
+        if db_account is not None:
             await repo.update(models.Account, db_account.id, **account.model_dump())
             logger.info("Account %s updated for user:  %s", account, current_user.id)
             return db_account
@@ -121,8 +148,8 @@ class AccountService:
         """
 
         logger.info("Deleting account %s for user: %s", account_id, current_user.id)
-        account = await repo.get(models.Account, account_id)
-        if account and account.user_id == current_user.id:
+        account = await repo.get_owned(models.Account, account_id, current_user.id)
+        if account is not None:
             await repo.delete(account)
             logger.info("Account %s deleted for user: %s", account_id, current_user.id)
             return True
@@ -1,27 +1,106 @@
-from typing import Optional
+from typing import Any, Optional
 
 from app import models
 from app import repository as repo
+from app import schemas
+from app.cache import VersionedCache
+from app.config import settings
 from app.logger import get_logger
+from app.utils.enums import LoadProfile
+from app.utils.template_utils import group_categories_by_section
 
 logger = get_logger(__name__)
 
+category_cache = VersionedCache(
+    "categories",
+    ttl=settings.category_cache_ttl,
+    max_size=settings.category_cache_max_size,
+)
 
-async def get_categories(
-    current_user: models.User,
-) -> Optional[list[models.TransactionCategory]]:
+
+async def _load_categories(user_id: Optional[Any]) -> list[schemas.CategoryData]:
     """
-    Retrieves a list of transaction categories.
+    Loads the categories of a user, or the global ones, with their sections.
+
+    Args:
+        user_id: The ID of the user, or None for the global categories.
+
+    Returns:
+        list[CategoryData]: The categories, detached from the session.
+    """
+
+    category_list = await repo.get_categories_by_user(user_id)
+    return [schemas.CategoryData.model_validate(category) for category in category_list]
+
+
+async def get_categories(current_user: models.User) -> list[schemas.CategoryData]:
+    """
+    Retrieves the global transaction categories and the user's own ones.
+
+    Both parts are cached per worker until a category of their part changes
+    or the cache expires, so the global categories are shared by all users.
 
     Args:
         current_user: The current active user.
 
     Returns:
-        list[TransactionCategory]: A list of transaction category objects.
+        list[CategoryData]: A list of transaction categories.
     """
 
     logger.info("Getting categories for user %s", current_user.id)
-    return await repo.get_all(models.TransactionCategory)
+
+    global_category_list = await category_cache.get_or_load(
+        "global", lambda: _load_categories(None)
+    )
+    user_category_list = await category_cache.get_or_load(
+        "user", lambda: _load_categories(current_user.id), scope=current_user.id
+    )
+
+    return global_category_list + user_category_list
+
+
+async def get_category_choices(
+    current_user: models.User,
+) -> dict[str, list[tuple[int, str]]]:
+    """
+    Retrieves the user's transaction categories grouped by section for select
+    fields.
+
+    Args:
+        current_user: The current active user.
+
+    Returns:
+        dict: The (id, label) choices per section label.
+    """
+
+    async def load_choices() -> dict[str, list[tuple[int, str]]]:
+        return dict(group_categories_by_section(await get_categories(current_user)))
+
+    return await category_cache.get_or_load(
+        "choices", load_choices, scope=current_user.id
+    )
+
+
+async def invalidate_categories(user_id: Optional[Any] = None) -> None:
+    """
+    Drops the cached categories of all workers after a category has changed.
+
+    Must be called in the transaction that changes the category.
+
+    Args:
+        user_id: The ID of the user whose own categories changed, or None if
+            global categories changed, which drops the cache of every user.
+
+    Returns:
+        None
+    """
+
+    if user_id is None:
+        logger.info("Invalidating the category cache of all users")
+    else:
+        logger.info("Invalidating the category cache of user %s", user_id)
+
+    await category_cache.invalidate(user_id)
 
 
 async def get_category(
@@ -42,7 +121,9 @@ async def get_category(
     """
 
     logger.info("Getting category with id %s for user %s", category_id, current_user.id)
-    category = await repo.get(models.TransactionCategory, category_id)
+    category = await repo.get(
+        models.TransactionCategory, category_id, profile=LoadProfile.DETAIL
+    )
 
     if category and (category.user_id is None or category.user_id == current_user.id):
         return category
@@ -55,32 +136,88 @@ async def get_category(
     return None
 
 
-# async def create_category(
-#     user: models.User, category: schemas.TransactionCategory
-# ) -> models.TransactionCategory:
+async def create_category(
+    current_user: models.User, label: str, section_id: int
+) -> Optional[models.TransactionCategory]:
+    """
+    Creates a custom transaction category of the user.
+
+    Args:
+        current_user: The current active user.
+        label: The label of the category.
+        section_id: The ID of the section of the category.
+
+    Returns:
+        TransactionCategory: The created transaction category, or None if the
+            section does not exist.
+    """
+
+    section = await repo.get(models.TransactionSection, section_id)
+
+    if section is None:
+        logger.warning("Section %s not found", section_id)
+        return None
+
+    logger.info("Creating category %s for user %s", label, current_user.id)
+    category = models.TransactionCategory(
+        user_id=current_user.id, label=label, section=section
+    )
+    await repo.save(category)
+    await invalidate_categories(current_user.id)
+
+    return category
+
 
-#     db_category = models.TransactionCategory(user=user, **category.dict())
-#     await repo.save(db_category)
-#     return db_category
+async def update_category(
+    current_user: models.User, category_id: int, label: str
+) -> Optional[models.TransactionCategory]:
+    """
+    Renames a custom transaction category of the user.
+
+    Args:
+        current_user: The current active user.
+        category_id: The ID of the transaction category to update.
+        label: The new label of the category.
+
+    Returns:
+        TransactionCategory: The updated transaction category, or None if the
+            user does not own it.
+    """
+
+    category = await repo.get(
+        models.TransactionCategory, category_id, profile=LoadProfile.DETAIL
+    )
 
+    if category is None or category.user_id != current_user.id:
+        return None
 
-# async def update_category(
-#     current_user: models.User, category_id, category: schemas.TransactionCategoryData
-# ) -> models.TransactionCategory:
+    logger.info("Updating category %s of user %s", category_id, current_user.id)
+    category.label = label
+    await invalidate_categories(current_user.id)
 
-#     db_category = await repo.get(models.TransactionCategory, category_id)
-#     if db_category.user_id == current_user.id:
-#         await repo.update(models.TransactionCategory, db_category.id, **category.dict())
-#         return db_category
+    return category
 
-#     return None
 
+async def delete_category(current_user: models.User, category_id: int) -> bool:
+    """
+    Deletes a custom transaction category of the user.
+
+    Args:
+        current_user: The current active user.
+        category_id: The ID of the transaction category to delete.
+
+    Returns:
+        bool: True if the category was deleted, False if the user does not
+            own it.
+    """
+
+    category = await repo.get(models.TransactionCategory, category_id)
 
-# async def delete_category(current_user: models.User, category_id: int) -> bool:
+    if category is None or category.user_id != current_user.id:
+        return False
 
-#     category = await repo.get(models.TransactionCategory, category_id)
-#     if category and category.user_id == current_user.id:
-#         await repo.delete(category)
-#         return True
+    logger.info("Deleting category %s of user %s", category_id, current_user.id)
+    await repo.delete(category)
+    await invalidate_categories(current_user.id)
 
-#     return None
+    return True
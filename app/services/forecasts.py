@@ -0,0 +1,164 @@
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+
+from app import models
+from app import repository as repo
+from app.logger import get_logger
+from app.services.scheduled_transactions import expand_account_schedules
+
+logger = get_logger(__name__)
+
+MAX_FORECAST_DAYS = 10 * 366
+
+
+def _to_cents(amount_list: list) -> np.ndarray:
+    """
+    Converts amounts into integer cents.
+
+    Args:
+        amount_list: The amounts.
+
+    Returns:
+        np.ndarray: The amounts in cents as int64.
+    """
+
+    return np.rint(np.array(amount_list, dtype=np.float64) * 100).astype(np.int64)
+
+
+async def _get_scheduled_cents(
+    account_id: int, now: datetime, until: datetime, day_count: int
+) -> np.ndarray:
+    """
+    Bins the scheduled transactions of an account that are not created yet
+    into days.
+
+    Occurrences that are already due but not created by the scheduler yet
+    are counted on the first day.
+
+    Args:
+        account_id: The ID of the account.
+        now: The start of the forecast.
+        until: The end of the forecast.
+        day_count: The number of days of the forecast.
+
+    Returns:
+        np.ndarray: The scheduled amount in cents of every day.
+    """
+
+    scheduled_list = await repo.get_scheduled_transactions_for_account(
+        account_id, None, until
+    )
+    schedule_index_array, date_array, amount_list = expand_account_schedules(
+        scheduled_list, account_id, None, until
+    )
+
+    today = np.datetime64(now.date(), "D")
+    day_index_array = np.maximum(
+        (date_array.astype("datetime64[D]") - today).astype(np.int64), 0
+    )
+
+    return np.bincount(
+        day_index_array,
+        weights=_to_cents(amount_list)[schedule_index_array],
+        minlength=day_count,
+    )[:day_count]
+
+
+async def _get_category_averages(
+    account_id: int, now: datetime, history_days: int
+) -> tuple[list[dict], float]:
+    """
+    Averages the daily amount per category of an account's past transactions.
+
+    Args:
+        account_id: The ID of the account.
+        now: The end of the history.
+        history_days: The number of past days to average (0 disables it).
+
+    Returns:
+        tuple[list[dict], float]: The daily amount of every category and the
+            daily amount of all of them in cents.
+    """
+
+    if not history_days:
+        return [], 0.0
+
+    category_total_list = await repo.get_category_totals(
+        account_id, now - timedelta(days=history_days), now
+    )
+    category_average_list = [
+        {"category_id": category_id, "daily_amount": total / history_days}
+        for category_id, total in category_total_list
+    ]
+    daily_average_cents = (
+        _to_cents([total for _, total in category_total_list]).sum() / history_days
+    )
+
+    return category_average_list, float(daily_average_cents)
+
+
+async def get_balance_forecast(
+    user: models.User, account_id: int, until: datetime, history_days: int = 0
+) -> Optional[dict]:
+    """
+    Projects the daily balance of an account from today until the given date.
+
+    The projection starts from the current balance and adds the occurrences
+    of the account's scheduled transactions that are not created yet,
+    including incoming transfers. The last day is included as a whole. With
+    history_days, the average daily amount per category of the account's
+    other transactions in that many past days is added as well. All events
+    are binned into days and accumulated in one pass.
+
+    Args:
+        user: The user object.
+        account_id: The ID of the account.
+        until: The last day of the forecast.
+        history_days: The number of past days to average (0 disables it).
+
+    Returns:
+        dict: The forecast with the balance of every day.
+
+    Raises:
+        ValueError: If the forecast would exceed MAX_FORECAST_DAYS.
+    """
+
+    account = await repo.get_owned(models.Account, account_id, user.id)
+
+    if account is None:
+        return None
+
+    now = datetime.now(timezone.utc)
+    today = np.datetime64(now.date(), "D")
+    day_count = max(int((np.datetime64(until.date(), "D") - today).astype(int)), 0) + 1
+
+    if day_count > MAX_FORECAST_DAYS:
+        raise ValueError(f"A forecast is limited to {MAX_FORECAST_DAYS} days.")
+
+    until_end = datetime.combine(until.date(), time.max, tzinfo=until.tzinfo)
+    daily_cents = await _get_scheduled_cents(account_id, now, until_end, day_count)
+    category_average_list, daily_average_cents = await _get_category_averages(
+        account_id, now, history_days
+    )
+
+    # Today's regular transactions are already part of the balance
+    balance_cents = np.rint(
+        _to_cents([account.balance or 0])[0]
+        + np.cumsum(daily_cents)
+        + np.arange(day_count) * daily_average_cents
+    ).astype(np.int64)
+
+    return {
+        "account_id": account_id,
+        "balance": account.balance,
+        "days": [
+            {"date": date, "balance": Decimal(cents).scaleb(-2)}
+            for date, cents in zip(
+                np.arange(today, today + day_count).tolist(), balance_cents.tolist()
+            )
+        ],
+        "category_averages": category_average_list,
+    }
@@ -0,0 +1,390 @@
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
+from typing import IO, Iterable, Iterator, Optional
+
+from pydantic import ValidationError
+
+from app import models
+from app import repository as repo
+from app import schemas
+from app.database import db
+from app.logger import get_logger
+from app.services.transactions import (
+    MAX_AMOUNT,
+    TransactionService,
+    _format_validation_error,
+)
+from app.utils.enums import ImportFormat, ImportStatus
+from app.utils.fingerprints import FingerprintCounter
+from app.utils.statement_parsing import (
+    CsvMapping,
+    StatementError,
+    StatementRow,
+    iter_chunks,
+    iter_lines,
+    iter_text,
+    parse_csv,
+    parse_ofx,
+)
+
+logger = get_logger(__name__)
+
+IMPORT_BATCH_SIZE = 1000
+MAX_JOB_ERRORS = 100
+# The limit of the String(128) reference column
+MAX_REFERENCE_LENGTH = 128
+
+
+@dataclass(slots=True)
+class ImportProgress:
+    """
+    The counters of an import job, written to the job as it progresses.
+
+    Args:
+        rows_read: The number of statement rows read so far.
+        created_count: The number of created transactions.
+        duplicate_count: The number of rows that already exist in the account.
+        error_count: The number of rejected rows.
+        errors: The first MAX_JOB_ERRORS rejected rows with their index and detail.
+    """
+
+    rows_read: int = 0
+    created_count: int = 0
+    duplicate_count: int = 0
+    error_count: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, index: int, detail: str) -> None:
+        """
+        Counts a rejected row and keeps its detail while there is room.
+
+        Args:
+            index: The position of the row in the statement.
+            detail: What was wrong with the row.
+
+        Returns:
+            None
+        """
+
+        self.error_count += 1
+        if len(self.errors) < MAX_JOB_ERRORS:
+            self.errors.append({"index": index, "detail": detail})
+
+
+async def create_import_job(
+    user: models.User, account_id: int, file_format: ImportFormat
+) -> Optional[models.ImportJob]:
+    """
+    Creates a pending import job for one of the user's accounts.
+
+    Args:
+        user: The user object.
+        account_id: The ID of the account to import into.
+        file_format: The format of the statement.
+
+    Returns:
+        ImportJob: The created job, or None if the account is not found.
+
+    Raises:
+        None
+    """
+
+    account = await repo.get_owned(models.Account, account_id, user.id)
+
+    if account is None:
+        return None
+
+    job = models.ImportJob(
+        user_id=user.id,
+        account_id=account_id,
+        file_format=file_format.value,
+        status=ImportStatus.PENDING.value,
+        rows_read=0,
+        created_count=0,
+        duplicate_count=0,
+        error_count=0,
+        errors=[],
+    )
+    await repo.save(job)
+
+    return job
+
+
+async def get_import_job(user: models.User, job_id: int) -> Optional[models.ImportJob]:
+    """
+    Retrieves an import job of the user.
+
+    Args:
+        user: The user object.
+        job_id: The ID of the job.
+
+    Returns:
+        ImportJob: The job, or None if it is not found.
+
+    Raises:
+        None
+    """
+
+    return await repo.get_owned(models.ImportJob, job_id, user.id)
+
+
+def parse_statement(
+    file: IO[bytes], file_format: ImportFormat, encoding: str, mapping: CsvMapping
+) -> Iterator[StatementRow | StatementError]:
+    """
+    Parses a statement file chunk by chunk.
+
+    Args:
+        file: The binary statement file.
+        file_format: The format of the statement.
+        encoding: The text encoding of the statement.
+        mapping: The layout of a CSV statement.
+
+    Returns:
+        Iterator[StatementRow | StatementError]: The parsed and rejected rows.
+
+    Raises:
+        None
+    """
+
+    texts = iter_text(iter_chunks(file), encoding)
+
+    if file_format == ImportFormat.OFX:
+        return parse_ofx(texts)
+
+    return parse_csv(iter_lines(texts), mapping)
+
+
+def normalize_row(row: StatementRow, account_id: int, category_id: int) -> dict:
+    """
+    Converts a statement row into a transaction entry.
+
+    Args:
+        row: The parsed row.
+        account_id: The ID of the account to import into.
+        category_id: The ID of the category of the imported transactions.
+
+    Returns:
+        dict: The validated entry for TransactionService.insert_transactions.
+
+    Raises:
+        ValueError: If the row is not a valid transaction.
+    """
+
+    transaction_information = schemas.TransactionInformationCreate.model_validate(
+        {
+            "account_id": account_id,
+            "amount": row.amount,
+            "reference": row.reference[:MAX_REFERENCE_LENGTH],
+            "date": row.date,
+            "category_id": category_id,
+        }
+    )
+
+    if abs(transaction_information.amount) >= MAX_AMOUNT:
+        raise ValueError(f"Amount out of range: {transaction_information.amount}")
+
+    return transaction_information.model_dump()
+
+
+def _iter_entries(
+    rows: Iterable[StatementRow | StatementError],
+    account_id: int,
+    category_id: int,
+    progress: ImportProgress,
+) -> Iterator[dict]:
+    """
+    Turns parsed statement rows into fingerprinted transaction entries.
+
+    Rejected rows are counted in the progress instead of being yielded.
+
+    Args:
+        rows: The parsed and rejected rows.
+        account_id: The ID of the account to import into.
+        category_id: The ID of the category of the imported transactions.
+        progress: The progress of the job, updated in place.
+
+    Yields:
+        dict: The next entry for TransactionService.insert_transactions.
+    """
+
+    fingerprint_counter = FingerprintCounter()
+
+    for row in rows:
+        progress.rows_read += 1
+
+        if isinstance(row, StatementError):
+            progress.add_error(row.index, row.detail)
+            continue
+
+        try:
+            entry = normalize_row(row, account_id, category_id)
+        except ValidationError as e:
+            progress.add_error(row.index, _format_validation_error(e))
+            continue
+        except ValueError as e:
+            progress.add_error(row.index, str(e))
+            continue
+
+        entry["fingerprint"] = fingerprint_counter.fingerprint(
+            entry["account_id"], entry["date"], entry["amount"], entry["reference"]
+        )
+        yield entry
+
+
+async def _write_batch(
+    job_id: int, entry_list: list[dict], progress: ImportProgress
+) -> None:
+    """
+    Inserts a batch of entries and commits it together with the job's progress.
+
+    The progress is only updated once the batch is committed, so a failed
+    batch is not counted.
+
+    Args:
+        job_id: The ID of the import job.
+        entry_list: The entries of the batch.
+        progress: The progress of the job, updated in place.
+
+    Returns:
+        None
+    """
+
+    _, skipped_count = await TransactionService().insert_transactions(entry_list)
+    batch_progress = replace(
+        progress,
+        created_count=progress.created_count + len(entry_list) - skipped_count,
+        duplicate_count=progress.duplicate_count + skipped_count,
+        errors=list(progress.errors),
+    )
+    await repo.update(models.ImportJob, job_id, **asdict(batch_progress))
+    await db.session.commit()
+
+    progress.created_count = batch_progress.created_count
+    progress.duplicate_count = batch_progress.duplicate_count
+
+
+async def _import_statement(  # pylint: disable=too-many-arguments
+    job: models.ImportJob,
+    file: IO[bytes],
+    category_id: int,
+    encoding: str,
+    mapping: CsvMapping,
+    batch_size: int,
+    progress: ImportProgress,
+) -> None:
+    """
+    Imports the rows of a statement file in batches.
+
+    Args:
+        job: The running import job.
+        file: The binary statement file.
+        category_id: The ID of the category of the imported transactions.
+        encoding: The text encoding of the statement.
+        mapping: The layout of a CSV statement.
+        batch_size: The number of transactions per batch.
+        progress: The progress of the job, updated in place.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the category is not available to the job's user or
+            the statement cannot be parsed.
+    """
+
+    if not await repo.get_usable_category_ids(job.user_id, [category_id]):
+        raise ValueError(f"Category[id: {category_id}] not found")
+
+    rows = parse_statement(file, ImportFormat(job.file_format), encoding, mapping)
+    entry_list: list[dict] = []
+
+    for entry in _iter_entries(rows, job.account_id, category_id, progress):
+        entry_list.append(entry)
+
+        if len(entry_list) >= batch_size:
+            await _write_batch(job.id, entry_list, progress)
+            entry_list = []
+
+    await _write_batch(job.id, entry_list, progress)
+
+
+async def run_import_job(  # pylint: disable=too-many-arguments
+    job_id: int,
+    file: IO[bytes],
+    category_id: int,
+    encoding: str = "utf-8",
+    mapping: Optional[CsvMapping] = None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> None:
+    """
+    Imports a statement file into the job's account.
+
+    Runs as a background task with a session of its own. The rows flow
+    through parse, normalize and fingerprint steps one at a time and are
+    inserted in batches with TransactionService.insert_transactions. Every
+    batch is committed together with the job's progress, so the job status
+    shows how far the import is and completed batches are kept if a later one
+    fails. Rows whose fingerprint already exists in the account, as after
+    importing an overlapping statement, are counted as duplicates. As the
+    fingerprints count repeated rows, a statement may contain the same
+    booking twice.
+
+    Args:
+        job_id: The ID of the pending import job.
+        file: The binary statement file. It is closed when the import ends.
+        category_id: The ID of the category of the imported transactions.
+        encoding: The text encoding of the statement.
+        mapping: The layout of a CSV statement.
+        batch_size: The number of transactions per batch.
+
+    Returns:
+        None
+
+    Raises:
+        None
+    """
+
+    async with db.session_scope(join=False):
+        job = await repo.get(models.ImportJob, job_id)
+
+        if job is None:
+            logger.error("Import job %s not found", job_id)
+            file.close()
+            return
+
+        progress = ImportProgress()
+
+        try:
+            await repo.update(
+                models.ImportJob, job_id, status=ImportStatus.RUNNING.value
+            )
+            await db.session.commit()
+            await _import_statement(
+                job,
+                file,
+                category_id,
+                encoding,
+                mapping or CsvMapping(),
+                batch_size,
+                progress,
+            )
+            status = ImportStatus.COMPLETED
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Error occurred during import job %s: %s", job_id, e)
+            await db.session.rollback()
+            # Reported at the position where the import stopped
+            progress.add_error(progress.rows_read, str(e))
+            status = ImportStatus.FAILED
+        finally:
+            file.close()
+
+        await repo.update(
+            models.ImportJob,
+            job_id,
+            status=status.value,
+            finished_at=datetime.now(timezone.utc),
+            **asdict(progress),
+        )
+        await db.session.commit()
+        logger.info("Import job %s %s: %s", job_id, status.value, progress)
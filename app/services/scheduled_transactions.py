@@ -1,12 +1,23 @@
 from datetime import datetime
-from typing import Optional
+from decimal import Decimal
+from typing import Optional, Tuple
+
+import numpy as np
+from sqlalchemy import Row
 
 from app import models
 from app import repository as repo
 from app import schemas
 from app.logger import get_logger
-from app.services.accounts import AccountService
+from app.services.transactions import TransactionService, set_category
+from app.utils.enums import Frequency, LoadProfile
 from app.utils.exceptions import AccessDeniedError
+from app.utils.recurrence import (
+    expand_occurrences,
+    from_datetime64,
+    next_occurrences,
+    to_datetime64,
+)
 
 logger = get_logger(__name__)
 
@@ -30,17 +41,116 @@ async def get_transaction_list(
         None
     """
 
-    account = await repo.get(models.Account, account_id)
+    account = await repo.get_owned(models.Account, account_id, user.id)
 
     if account is None:
         return None
 
-    if account.user_id == user.id:
-        return await repo.get_scheduled_transactions_from_period(
-            account_id, date_start, date_end
-        )
+    return await repo.get_scheduled_transactions_from_period(
+        account_id, date_start, date_end
+    )
+
+
+def expand_account_schedules(
+    scheduled_list: list,
+    account_id: int,
+    date_start: Optional[datetime],
+    date_end: datetime,
+) -> Tuple[np.ndarray, np.ndarray, list[Decimal]]:
+    """
+    Expands the not yet created occurrences of scheduled transactions as seen
+    from one account.
+
+    Args:
+        scheduled_list: Rows of repo.get_scheduled_transactions_for_account.
+        account_id: The ID of the account. Schedules where it is the offset
+            account contribute the inverted amount.
+        date_start: The start date of the period, or None for every occurrence
+            after the schedule's watermark.
+        date_end: The end date of the period.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, list[Decimal]]: The schedule index and date
+            of every occurrence, sorted by date, and the signed amount of every
+            schedule.
+
+    Raises:
+        None
+    """
+
+    # Occurrences up to the watermark already exist as transactions
+    after_array = to_datetime64(
+        [scheduled.last_executed_at for scheduled in scheduled_list]
+    )
+    if date_start is not None:
+        period_after = to_datetime64([date_start])[0] - np.timedelta64(1, "us")
+        after_array = np.fmax(after_array, period_after)
+
+    schedule_index_array, date_array = expand_occurrences(
+        [scheduled.frequency_id for scheduled in scheduled_list],
+        to_datetime64([scheduled.date_start for scheduled in scheduled_list]),
+        to_datetime64([scheduled.date_end for scheduled in scheduled_list]),
+        after=after_array,
+        until=to_datetime64([date_end])[0],
+    )
+
+    signed_amount_list = [
+        -scheduled.amount if scheduled.account_id != account_id else scheduled.amount
+        for scheduled in scheduled_list
+    ]
+
+    return schedule_index_array, date_array, signed_amount_list
+
+
+async def get_projected_transactions(
+    user: models.User, account_id: int, date_start: datetime, date_end: datetime
+) -> Optional[list[dict]]:
+    """
+    Retrieves the not yet created occurrences of an account's scheduled
+    transactions within a period.
+
+    Incoming transfers, i.e. schedules with the account as offset account,
+    are included with the inverted amount.
+
+    Args:
+        user: The user object.
+        account_id: The ID of the account.
+        date_start: The start date of the period.
+        date_end: The end date of the period.
+
+    Returns:
+        list[dict]: The projected transactions, oldest first.
 
-    return None
+    Raises:
+        None
+    """
+
+    account = await repo.get_owned(models.Account, account_id, user.id)
+
+    if account is None:
+        return None
+
+    scheduled_list = await repo.get_scheduled_transactions_for_account(
+        account_id, date_start, date_end
+    )
+
+    schedule_index_array, date_array, amount_list = expand_account_schedules(
+        scheduled_list, account_id, date_start, date_end
+    )
+
+    return [
+        {
+            "scheduled_transaction_id": scheduled_list[schedule_index].id,
+            "account_id": account_id,
+            "date": date,
+            "amount": amount_list[schedule_index],
+            "reference": scheduled_list[schedule_index].reference,
+            "category_id": scheduled_list[schedule_index].category_id,
+        }
+        for schedule_index, date in zip(
+            schedule_index_array.tolist(), from_datetime64(date_array)
+        )
+    ]
 
 
 async def get_transaction(
@@ -60,17 +170,9 @@ async def get_transaction(
         None
     """
 
-    transaction = await repo.get(models.TransactionScheduled, transaction_id)
-
-    if transaction is None:
-        return None
-
-    account = await repo.get(models.Account, transaction.account_id)
-
-    if account is None:
-        return None
-
-    return transaction if account.user_id == user.id else None
+    return await repo.get_owned(
+        models.TransactionScheduled, transaction_id, user.id, profile=LoadProfile.DETAIL
+    )
 
 
 async def create_scheduled_transaction(
@@ -91,23 +193,21 @@ async def create_scheduled_transaction(
         None
     """
 
-    account = await repo.get(models.Account, transaction_information.account_id)
+    account = await repo.get_owned(
+        models.Account, transaction_information.account_id, user.id
+    )
 
     if account is None:
         return None
 
-    if not AccountService.has_user_access_to_account(user, account):
-        return None
-
     offset_account_id = transaction_information.offset_account_id
 
     if offset_account_id:
-        offset_account = await repo.get(models.Account, offset_account_id)
+        offset_account = await repo.get_owned(
+            models.Account, offset_account_id, user.id
+        )
 
         if offset_account is None:
-            return None
-
-        if not AccountService.has_user_access_to_account(user, offset_account):
             raise AccessDeniedError(
                 (
                     f"User[id: {user.id}] not allowed to access "
@@ -120,15 +220,23 @@ async def create_scheduled_transaction(
         transaction_information.model_dump()
     )
 
+    await set_category(db_transaction_information, transaction_information.category_id)
+
     transaction = models.TransactionScheduled(
         frequency_id=transaction_information.frequency_id,
         date_start=transaction_information.date_start,
         date_end=transaction_information.date_end,
+        next_run_at=transaction_information.date_start,
         information=db_transaction_information,
         account_id=account.id,
         offset_account_id=offset_account_id,
     )
 
+    # The response shows the frequency
+    frequency = await repo.get(models.Frequency, transaction_information.frequency_id)
+    if frequency is not None:
+        transaction.frequency = frequency
+
     await repo.save([transaction, db_transaction_information])
 
     return transaction
@@ -154,20 +262,172 @@ async def delete_scheduled_transaction(
         current_user.id,
     )
 
-    transaction = await repo.get(
+    # The information and frequency are deleted along with the schedule
+    transaction = await repo.get_owned(
         models.TransactionScheduled,
         transaction_id,
-        load_relationships_list=[models.Transaction.offset_transaction],
+        current_user.id,
+        profile=LoadProfile.DETAIL,
     )
 
     if transaction is None:
         logger.warning("Scheduled Transaction with ID %s not found.", transaction_id)
         return None
 
-    account = await repo.get(models.Account, transaction.account_id)
-    if account is None or current_user.id != account.user_id:
-        return None
-
     await repo.delete(transaction)
 
     return True
+
+
+def _split_by_frequency(scheduled_list: list[Row]) -> Tuple[list[Row], list[Row]]:
+    """
+    Separates the scheduled transactions with an unknown frequency and logs
+    each of them, so they do not abort the batch they are in.
+
+    Args:
+        scheduled_list: The scheduled transactions.
+
+    Returns:
+        Tuple[list[Row], list[Row]]: The scheduled transactions with a known
+            frequency and those with an unknown one.
+    """
+
+    known_id_set = {frequency.value for frequency in Frequency}
+    known_list, unknown_list = [], []
+
+    for scheduled in scheduled_list:
+        if scheduled.frequency_id in known_id_set:
+            known_list.append(scheduled)
+            continue
+
+        logger.error(
+            "Scheduled transaction %s has the unknown frequency %s",
+            scheduled.id,
+            scheduled.frequency_id,
+        )
+        unknown_list.append(scheduled)
+
+    return known_list, unknown_list
+
+
+def _get_next_runs(scheduled_list: list[Row], watermark_map: dict) -> list[dict]:
+    """
+    Computes the new watermark and the next due date of every scheduled
+    transaction of a batch.
+
+    Args:
+        scheduled_list: The scheduled transactions with a known frequency.
+        watermark_map: The date of the last created occurrence, keyed by the
+            ID of the scheduled transaction.
+
+    Returns:
+        list[dict]: The id, last_executed_at and next_run_at of every
+            scheduled transaction. next_run_at is None once a scheduled
+            transaction has no occurrences left.
+    """
+
+    last_executed_list = [
+        watermark_map.get(scheduled.id, scheduled.last_executed_at)
+        for scheduled in scheduled_list
+    ]
+    next_run_array = next_occurrences(
+        [scheduled.frequency_id for scheduled in scheduled_list],
+        to_datetime64([scheduled.date_start for scheduled in scheduled_list]),
+        to_datetime64([scheduled.date_end for scheduled in scheduled_list]),
+        to_datetime64(last_executed_list),
+    )
+
+    return [
+        {"id": scheduled.id, "last_executed_at": last_executed_at, "next_run_at": date}
+        for scheduled, last_executed_at, date in zip(
+            scheduled_list, last_executed_list, from_datetime64(next_run_array)
+        )
+    ]
+
+
+async def execute_due_transactions(
+    now: datetime, batch_size: int, after_id: int = 0
+) -> Tuple[int, Optional[int]]:
+    """
+    Materializes the due occurrences of one batch of scheduled transactions.
+
+    Every occurrence after a schedule's watermark (last_executed_at) up to now
+    becomes a transaction, plus its offset transaction if the schedule has an
+    offset account. Rows are written with multi-row inserts, balances and
+    monthly summaries with one aggregated statement each, and the watermarks
+    and next due dates are advanced in the same database transaction.
+    Scheduled transactions with an unknown frequency are logged and no longer
+    selected.
+
+    Args:
+        now: Occurrences up to this date are due.
+        batch_size: The maximum number of scheduled transactions to process.
+        after_id: Only process scheduled transactions with a higher ID.
+
+    Returns:
+        Tuple[int, Optional[int]]: The number of created transactions and the ID
+            of the last processed scheduled transaction (None if nothing was left).
+
+    Raises:
+        None
+    """
+
+    due_list = await repo.get_due_scheduled_transactions(now, batch_size, after_id)
+
+    if not due_list:
+        return 0, None
+
+    scheduled_list, unknown_list = _split_by_frequency(due_list)
+    schedule_index_array, date_array = expand_occurrences(
+        [scheduled.frequency_id for scheduled in scheduled_list],
+        to_datetime64([scheduled.date_start for scheduled in scheduled_list]),
+        to_datetime64([scheduled.date_end for scheduled in scheduled_list]),
+        after=to_datetime64(
+            [scheduled.last_executed_at for scheduled in scheduled_list]
+        ),
+        until=to_datetime64([now])[0],
+    )
+
+    entry_list = []
+    watermark_map = {}
+
+    for schedule_index, date in zip(
+        schedule_index_array.tolist(), from_datetime64(date_array)
+    ):
+        scheduled = scheduled_list[schedule_index]
+        watermark_map[scheduled.id] = date
+        entry_list.append(
+            {
+                "account_id": scheduled.account_id,
+                "offset_account_id": scheduled.offset_account_id,
+                "amount": scheduled.amount,
+                "reference": scheduled.reference,
+                "date": date,
+                "category_id": scheduled.category_id,
+                "scheduled_transaction_id": scheduled.id,
+            }
+        )
+
+    created_count, _ = await TransactionService().insert_transactions(entry_list)
+
+    # Schedules with an unknown frequency are not selected again
+    await repo.bulk_update(
+        models.TransactionScheduled,
+        _get_next_runs(scheduled_list, watermark_map)
+        + [
+            {
+                "id": scheduled.id,
+                "last_executed_at": scheduled.last_executed_at,
+                "next_run_at": None,
+            }
+            for scheduled in unknown_list
+        ],
+    )
+
+    logger.info(
+        "Created %s transactions from %s scheduled transactions",
+        created_count,
+        len(watermark_map),
+    )
+
+    return created_count, due_list[-1].id
@@ -1,17 +1,333 @@
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional
+from decimal import Decimal
+from typing import Any, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import Row
 
 from app import models
 from app import repository as repo
 from app import schemas
 from app.logger import get_logger
-from app.services.accounts import AccountService
 from app.utils.classes import RoundedDecimal
+from app.utils.enums import LoadProfile
 from app.utils.exceptions import AccessDeniedError
-from app.utils.log_messages import ACCOUNT_USER_ID_MISMATCH
+from app.utils.fingerprints import FingerprintCounter
+from app.utils.log_messages import ACCOUNT_NOT_FOUND, TRANSACTION_NOT_FOUND
+from app.utils.pagination import encode_cursor
 
 logger = get_logger(__name__)
 
+# The limit of the DECIMAL(10, 2) amount columns
+MAX_AMOUNT = 10**8
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """
+    Formats a pydantic validation error as a single line.
+
+    Args:
+        error: The validation error.
+
+    Returns:
+        str: The failing fields and their messages.
+    """
+
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+def _format_datetime(value: datetime) -> str:
+    """
+    Formats a datetime like pydantic does in JSON responses.
+
+    Args:
+        value: The datetime.
+
+    Returns:
+        str: The ISO 8601 string, with Z for UTC.
+    """
+
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _serialize_transaction_row(row: Row) -> dict:
+    """
+    Converts a transaction row of a page into the JSON shape of
+    schemas.Transaction without validating it.
+
+    A transaction without a category has null as category, like a category
+    without a section has null as section.
+
+    Args:
+        row: The row from repository.get_transactions_page.
+
+    Returns:
+        dict: The JSON compatible transaction.
+    """
+
+    category = None
+    if row.category_id is not None:
+        section = None
+        if row.section_id is not None:
+            section = {"id": row.section_id, "label": row.section_label}
+
+        category = {
+            "id": row.category_id,
+            "label": row.category_label,
+            "section": section,
+        }
+
+    return {
+        "id": row.id,
+        "account_id": row.account_id,
+        "information": {
+            "amount": float(row.amount),
+            "reference": row.reference,
+            "category_id": row.category_id,
+            "date": _format_datetime(row.date),
+            "category": category,
+        },
+        "offset_transactions_id": row.offset_transactions_id,
+    }
+
+
+async def set_category(
+    information: models.TransactionInformation, category_id: Optional[int]
+) -> None:
+    """
+    Sets the category of transaction information together with its section,
+    so responses can show them without a reload after the commit.
+
+    An unknown category is left to the foreign key, which rejects it.
+
+    Args:
+        information: The transaction information.
+        category_id: The ID of the category.
+
+    Returns:
+        None
+    """
+
+    if category_id is None:
+        return
+
+    category = await repo.get(
+        models.TransactionCategory, category_id, profile=LoadProfile.DETAIL
+    )
+
+    if category is not None:
+        information.category = category
+
+
+def _build_rows(
+    entry_list: list[dict],
+) -> Tuple[list[dict[str, Any]], list[dict[str, Any]], dict[int, int]]:
+    """
+    Builds the information and transaction rows of bulk inserted entries.
+
+    An entry with an offset account gets a second pair of rows with the
+    negated amount right after its own.
+
+    Args:
+        entry_list: The entries, see TransactionService.insert_transactions.
+
+    Returns:
+        Tuple[list[dict[str, Any]], list[dict[str, Any]], dict[int, int]]: The
+            information rows, the transaction rows and the index of the offset
+            row keyed by the index of its transaction row.
+    """
+
+    information_list: list[dict[str, Any]] = []
+    transaction_list: list[dict[str, Any]] = []
+    offset_index_map: dict[int, int] = {}
+
+    for entry in entry_list:
+        amount = RoundedDecimal(entry["amount"])
+        side_list: list[Tuple[int, Decimal, Optional[str]]] = [
+            (entry["account_id"], amount, entry.get("fingerprint"))
+        ]
+
+        if entry.get("offset_account_id"):
+            side_list.append((entry["offset_account_id"], -amount, None))
+            offset_index_map[len(transaction_list)] = len(transaction_list) + 1
+
+        for account_id, side_amount, fingerprint in side_list:
+            information_list.append(
+                {
+                    "amount": side_amount,
+                    "reference": entry["reference"],
+                    "date": entry["date"],
+                    "category_id": entry["category_id"],
+                }
+            )
+            transaction_list.append(
+                {
+                    "account_id": account_id,
+                    "date": entry["date"],
+                    "amount": side_amount,
+                    "scheduled_transaction_id": entry.get("scheduled_transaction_id"),
+                    "fingerprint": fingerprint,
+                }
+            )
+
+    return information_list, transaction_list, offset_index_map
+
+
+async def _insert_fingerprinted_rows(
+    transaction_list: list[dict[str, Any]],
+    transaction_id_list: list[Optional[int]],
+    offset_index_map: dict[int, int],
+) -> Tuple[int, set[int]]:
+    """
+    Inserts the transaction rows with a fingerprint, skipping existing ones.
+
+    The IDs of the inserted rows are filled into transaction_id_list. A
+    skipped row is skipped together with its offset, which is removed from
+    offset_index_map, and their information rows are deleted.
+
+    Args:
+        transaction_list: All transaction rows with their information_id.
+        transaction_id_list: The ID of every transaction row, filled in place.
+        offset_index_map: The index of the offset row keyed by the index of
+            its transaction row, updated in place.
+
+    Returns:
+        Tuple[int, set[int]]: The number of skipped entries and the indexes of
+            all skipped rows, offsets included.
+    """
+
+    fingerprint_index_list = [
+        index
+        for index, transaction in enumerate(transaction_list)
+        if transaction["fingerprint"]
+    ]
+
+    if not fingerprint_index_list:
+        return 0, set()
+
+    inserted_row_list = await repo.bulk_insert_ignoring_conflicts(
+        models.Transaction,
+        [transaction_list[index] for index in fingerprint_index_list],
+        index_elements=[models.Transaction.account_id, models.Transaction.fingerprint],
+        returning=[models.Transaction.id, models.Transaction.information_id],
+    )
+    id_map = {row.information_id: row.id for row in inserted_row_list}
+    skipped_index_list = []
+
+    for index in fingerprint_index_list:
+        transaction_id_list[index] = id_map.get(
+            transaction_list[index]["information_id"]
+        )
+
+        if transaction_id_list[index] is None:
+            skipped_index_list.append(index)
+            if index in offset_index_map:
+                skipped_index_list.append(offset_index_map.pop(index))
+
+    await repo.delete_by_ids(
+        models.TransactionInformation,
+        [transaction_list[index]["information_id"] for index in skipped_index_list],
+    )
+
+    return len(fingerprint_index_list) - len(id_map), set(skipped_index_list)
+
+
+async def _insert_remaining_rows(
+    transaction_list: list[dict[str, Any]],
+    transaction_id_list: list[Optional[int]],
+    skipped_index_set: set[int],
+) -> None:
+    """
+    Inserts the transaction rows without a fingerprint that were not skipped.
+
+    Args:
+        transaction_list: All transaction rows with their information_id.
+        transaction_id_list: The ID of every transaction row, filled in place.
+        skipped_index_set: The indexes of the skipped rows.
+
+    Returns:
+        None
+    """
+
+    remaining_index_list = [
+        index
+        for index, transaction in enumerate(transaction_list)
+        if not transaction["fingerprint"] and index not in skipped_index_set
+    ]
+    remaining_id_list = await repo.bulk_insert(
+        models.Transaction,
+        [transaction_list[index] for index in remaining_index_list],
+    )
+
+    for index, transaction_id in zip(remaining_index_list, remaining_id_list):
+        transaction_id_list[index] = transaction_id
+
+
+def _get_offset_links(
+    transaction_id_list: list[Optional[int]], offset_index_map: dict[int, int]
+) -> list[dict[str, Any]]:
+    """
+    Builds the updates that link inserted transactions with their offsets.
+
+    Args:
+        transaction_id_list: The ID of every transaction row.
+        offset_index_map: The index of the offset row keyed by the index of
+            its transaction row.
+
+    Returns:
+        list[dict[str, Any]]: The id and offset_transactions_id of both rows
+            of every pair.
+    """
+
+    offset_link_list = []
+
+    for index, offset_index in offset_index_map.items():
+        transaction_id = transaction_id_list[index]
+        offset_transaction_id = transaction_id_list[offset_index]
+        offset_link_list.extend(
+            [
+                {"id": transaction_id, "offset_transactions_id": offset_transaction_id},
+                {"id": offset_transaction_id, "offset_transactions_id": transaction_id},
+            ]
+        )
+
+    return offset_link_list
+
+
+def _get_balance_deltas(
+    transaction_list: list[dict[str, Any]], transaction_id_list: list[Optional[int]]
+) -> Tuple[dict[int, Decimal], list[Tuple[int, datetime, Decimal, int]]]:
+    """
+    Sums up the balance and monthly summary changes of inserted transactions.
+
+    Args:
+        transaction_list: All transaction rows.
+        transaction_id_list: The ID of every transaction row, None if skipped.
+
+    Returns:
+        Tuple[dict[int, Decimal], list[Tuple[int, datetime, Decimal, int]]]:
+            The balance change per account ID and the summary entries.
+    """
+
+    balance_map: dict[int, Decimal] = defaultdict(Decimal)
+    summary_entry_list = []
+
+    for transaction, transaction_id in zip(transaction_list, transaction_id_list):
+        if transaction_id is None:
+            continue
+
+        balance_map[transaction["account_id"]] += transaction["amount"]
+        summary_entry_list.append(
+            (transaction["account_id"], transaction["date"], transaction["amount"], 1)
+        )
+
+    return balance_map, summary_entry_list
+
 
 class TransactionService:
     """
@@ -22,47 +338,109 @@ class TransactionService:
 
     """
 
-    async def get_transaction_list(
+    async def get_account_transactions(
+        self,
+        account: models.Account,
+        date_start: datetime,
+        date_end: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> dict:
+        """
+        Retrieves the totals and one page of transactions within a specified
+        period for an account the user has already been checked to own.
+
+        Args:
+            account: The account.
+            date_start: The start date of the period.
+            date_end: The end date of the period.
+            limit: The maximum number of transactions on the page.
+            after: The (date, id) of the last transaction of the previous page.
+
+        Returns:
+            dict: The summary of the period, the transactions of the page,
+                newest first, and the cursor of the next page.
+
+        Raises:
+            None
+        """
+
+        logger.info("Starting transaction retrieval for account %s", account.id)
+        summary = await repo.get_transaction_summary(account.id, date_start, date_end)
+
+        transaction_list: list[models.Transaction] = []
+        if summary.count:
+            transaction_list = await repo.get_transactions_from_period(
+                account.id, date_start, date_end, limit=limit + 1, after=after
+            )
+
+        next_cursor = None
+        if len(transaction_list) > limit:
+            transaction_list = transaction_list[:limit]
+            next_cursor = encode_cursor(
+                transaction_list[-1].date, transaction_list[-1].id
+            )
+
+        return {
+            "summary": summary,
+            "transactions": transaction_list,
+            "next_cursor": next_cursor,
+        }
+
+    async def get_transaction_page(  # pylint: disable=too-many-arguments
         self,
         user: models.User,
         account_id: int,
         date_start: datetime,
         date_end: datetime,
-    ) -> Optional[list[models.Transaction]]:
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Optional[dict]:
         """
-        Retrieves a list of transactions within a specified period for a given account.
+        Retrieves one page of transactions within a specified period for a given account.
 
         Args:
             user: The user object.
             account_id: The ID of the account.
             date_start: The start date of the period.
             date_end: The end date of the period.
+            limit: The maximum number of transactions on the page.
+            after: The (date, id) position the page starts after.
 
         Returns:
-            list[Transaction]: A list of transactions within the specified period.
+            dict: The transactions of the page, the limit and the cursor of the next page.
+                The transactions are JSON compatible dicts in the shape of
+                schemas.Transaction.
 
         Raises:
             None
         """
 
         logger.info(
-            "Starting transaction list retrieval for user %s and account %s",
+            "Starting transaction page retrieval for user %s and account %s",
             user.id,
             account_id,
         )
-        account = await repo.get(models.Account, account_id)
+        account = await repo.get_owned(models.Account, account_id, user.id)
 
         if account is None:
+            logger.warning(ACCOUNT_NOT_FOUND, account_id, user.id)
             return None
 
-        if account.user_id == user.id:
-            logger.info("User ID verified. Retrieving transactions.")
-            return await repo.get_transactions_from_period(
-                account_id, date_start, date_end
-            )
+        row_list = await repo.get_transactions_page(
+            account_id, date_start, date_end, limit + 1, after
+        )
 
-        logger.warning(ACCOUNT_USER_ID_MISMATCH)
-        return None
+        next_cursor = None
+        if len(row_list) > limit:
+            row_list = row_list[:limit]
+            next_cursor = encode_cursor(row_list[-1].date, row_list[-1].id)
+
+        return {
+            "items": [_serialize_transaction_row(row) for row in row_list],
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
 
     async def get_transaction(
         self, user: models.User, transaction_id: int
@@ -84,23 +462,14 @@ class TransactionService:
         logger.info(
             "Retrieving transaction with ID %s for user %s", transaction_id, user.id
         )
-        transaction = await repo.get(models.Transaction, transaction_id)
+        transaction = await repo.get_owned(
+            models.Transaction, transaction_id, user.id, profile=LoadProfile.DETAIL
+        )
 
         if transaction is None:
-            logger.warning("Transaction with ID %s not found.", transaction_id)
-            return None
-
-        account = await repo.get(models.Account, transaction.account_id)
+            logger.warning(TRANSACTION_NOT_FOUND, transaction_id, user.id)
 
-        if account is None:
-            return None
-
-        if account.user_id == user.id:
-            logger.info("User ID verified. Returning transaction.")
-            return transaction
-
-        logger.warning(ACCOUNT_USER_ID_MISMATCH)
-        return None
+        return transaction
 
     async def create_transaction(
         self,
@@ -122,23 +491,31 @@ class TransactionService:
         """
 
         logger.info("Creating new transaction for user %s", user.id)
-        account = await repo.get(models.Account, transaction_information.account_id)
+        account = await repo.get_owned(
+            models.Account, transaction_information.account_id, user.id
+        )
 
         if account is None:
-            return None
-
-        if not AccountService.has_user_access_to_account(user, account):
-            logger.warning(ACCOUNT_USER_ID_MISMATCH)
+            logger.warning(
+                ACCOUNT_NOT_FOUND, transaction_information.account_id, user.id
+            )
             return None
 
         db_transaction_information = models.TransactionInformation()
         db_transaction_information.add_attributes_from_dict(
             transaction_information.model_dump()
         )
+        await set_category(
+            db_transaction_information, transaction_information.category_id
+        )
 
         transaction = models.Transaction(
-            information=db_transaction_information, account_id=account.id
+            information=db_transaction_information,
+            account_id=account.id,
+            date=db_transaction_information.date,
+            amount=db_transaction_information.amount,
         )
+        summary_entry_list = [(account.id, transaction.date, transaction.amount, 1)]
 
         if transaction_information.offset_account_id:
             logger.info("Handling offset account for transaction.")
@@ -162,13 +539,179 @@ class TransactionService:
             transaction.offset_transaction = offset_transaction
             offset_transaction.offset_transaction = transaction
             await repo.save(offset_transaction)
+            summary_entry_list.append(
+                (
+                    offset_transaction.account_id,
+                    offset_transaction.date,
+                    offset_transaction.amount,
+                    1,
+                )
+            )
 
         account.balance += db_transaction_information.amount
 
         await repo.save([account, transaction, db_transaction_information])
+        await repo.update_monthly_summaries(summary_entry_list)
 
         return transaction
 
+    async def create_transactions_bulk(
+        self, user: models.User, row_list: list[Any]
+    ) -> dict:
+        """
+        Creates many transactions at once.
+
+        Every row is validated on its own; rows that fail are reported and
+        skipped. Account ownership and categories, which must be global or the
+        user's own, are checked with one query each for the whole batch. Rows
+        whose fingerprint already exists in their account are counted as
+        duplicates instead of being created again.
+
+        Args:
+            user: The user object.
+            row_list: The decoded rows. None marks a row that could not be decoded.
+
+        Returns:
+            dict: The number of created and duplicate transactions and the
+                per-row errors.
+
+        Raises:
+            None
+        """
+
+        logger.info("Creating %s transactions for user %s", len(row_list), user.id)
+
+        error_list: list[dict[str, Any]] = []
+        valid_row_list = []
+
+        for index, row in enumerate(row_list):
+            if not isinstance(row, dict):
+                error_list.append({"index": index, "detail": "Invalid JSON object"})
+                continue
+
+            try:
+                valid_row_list.append(
+                    (index, schemas.TransactionInformationCreate.model_validate(row))
+                )
+            except ValidationError as e:
+                error_list.append(
+                    {"index": index, "detail": _format_validation_error(e)}
+                )
+
+        account_id_list = list(
+            {row.account_id for _, row in valid_row_list}
+            | {
+                row.offset_account_id
+                for _, row in valid_row_list
+                if row.offset_account_id
+            }
+        )
+        owned_account_id_set = await repo.get_owned_account_ids(
+            user.id, account_id_list
+        )
+        category_id_set = await repo.get_usable_category_ids(
+            user.id, list({row.category_id for _, row in valid_row_list})
+        )
+
+        entry_list = []
+        fingerprint_counter = FingerprintCounter()
+
+        for index, row in valid_row_list:
+            if row.account_id not in owned_account_id_set:
+                detail = f"Account[id: {row.account_id}] not found"
+            elif (
+                row.offset_account_id is not None
+                and row.offset_account_id not in owned_account_id_set
+            ):
+                detail = f"Offset account[id: {row.offset_account_id}] not found"
+            elif row.offset_account_id == row.account_id:
+                detail = "Offset account must differ from the account"
+            elif row.category_id not in category_id_set:
+                detail = f"Category[id: {row.category_id}] not found"
+            elif abs(row.amount) >= MAX_AMOUNT:
+                detail = f"Amount out of range: {row.amount}"
+            else:
+                entry_list.append(
+                    {
+                        **row.model_dump(),
+                        "fingerprint": fingerprint_counter.fingerprint(
+                            row.account_id, row.date, row.amount, row.reference
+                        ),
+                    }
+                )
+                continue
+
+            error_list.append({"index": index, "detail": detail})
+
+        _, duplicate_count = await self.insert_transactions(entry_list)
+
+        error_list.sort(key=lambda error: error["index"])
+
+        return {
+            "created": len(entry_list) - duplicate_count,
+            "duplicates": duplicate_count,
+            "errors": error_list,
+        }
+
+    async def insert_transactions(self, entry_list: list[dict]) -> Tuple[int, int]:
+        """
+        Inserts already validated transactions in bulk.
+
+        Information and transaction rows are written with multi-row
+        INSERT ... RETURNING statements, offset transactions are linked with one
+        executemany update and every affected account balance and monthly
+        summary is updated once.
+
+        Entries with a fingerprint are skipped, together with their offset
+        transaction, if their account already has a transaction with that
+        fingerprint. Those rows are written with INSERT ... ON CONFLICT DO
+        NOTHING and the information rows of skipped entries are deleted again,
+        so existing fingerprints are never looked up row by row.
+
+        Args:
+            entry_list: Dicts with account_id, amount, reference, date,
+                category_id and optionally offset_account_id,
+                scheduled_transaction_id and fingerprint.
+
+        Returns:
+            Tuple[int, int]: The number of inserted transaction rows, offsets
+                included, and the number of skipped entries.
+
+        Raises:
+            None
+        """
+
+        information_list, transaction_list, offset_index_map = _build_rows(entry_list)
+
+        if not transaction_list:
+            return 0, 0
+
+        information_id_list = await repo.bulk_insert(
+            models.TransactionInformation, information_list
+        )
+
+        for transaction, information_id in zip(transaction_list, information_id_list):
+            transaction["information_id"] = information_id
+
+        transaction_id_list: list[Optional[int]] = [None] * len(transaction_list)
+        skipped_entry_count, skipped_index_set = await _insert_fingerprinted_rows(
+            transaction_list, transaction_id_list, offset_index_map
+        )
+        await _insert_remaining_rows(
+            transaction_list, transaction_id_list, skipped_index_set
+        )
+        balance_map, summary_entry_list = _get_balance_deltas(
+            transaction_list, transaction_id_list
+        )
+
+        await repo.bulk_update(
+            models.Transaction, _get_offset_links(transaction_id_list, offset_index_map)
+        )
+        await repo.increment_balances(balance_map)
+        await repo.update_monthly_summaries(summary_entry_list)
+
+        return len(summary_entry_list), skipped_entry_count
+
     async def _handle_offset_transaction(
         self,
         user: models.User,
@@ -194,13 +737,12 @@ class TransactionService:
         if offset_account_id is None:
             return None
 
-        offset_account = await repo.get(models.Account, offset_account_id)
+        offset_account = await repo.get_owned(
+            models.Account, offset_account_id, user.id
+        )
 
         if offset_account is None:
-            return None
-
-        if user.id != offset_account.user_id:
-            logger.warning("User ID does not match the offset account's User ID.")
+            logger.warning(ACCOUNT_NOT_FOUND, offset_account_id, user.id)
             return None
 
         transaction_information.amount = RoundedDecimal(
@@ -216,6 +758,8 @@ class TransactionService:
         offset_transaction = models.Transaction(
             information=db_offset_transaction_information,
             account_id=offset_account_id,
+            date=db_offset_transaction_information.date,
+            amount=db_offset_transaction_information.amount,
         )
 
         await repo.save(offset_transaction)
@@ -248,41 +792,70 @@ class TransactionService:
             transaction_id,
             current_user.id,
         )
-        transaction = await repo.get(
+        transaction = await repo.get_owned(
             models.Transaction,
             transaction_id,
-            load_relationships_list=[models.Transaction.account],
+            current_user.id,
+            profile=LoadProfile.DETAIL,
         )
+
         if transaction is None:
+            logger.warning(TRANSACTION_NOT_FOUND, transaction_id, current_user.id)
             return None
 
         account = transaction.account
 
-        if current_user.id != account.user_id:
-            logger.warning(ACCOUNT_USER_ID_MISMATCH)
-            return None
-
         amount_updated = (
             round(transaction_information.amount, 2) - transaction.information.amount
         )
+        summary_entry_list = [
+            (
+                account.id,
+                transaction.information.date,
+                transaction.information.amount,
+                -1,
+            ),
+            (
+                account.id,
+                transaction_information.date,
+                transaction_information.amount,
+                1,
+            ),
+        ]
 
         if transaction.offset_transactions_id:
             logger.info("Handling offset transaction for update.")
-            offset_transaction = await repo.get(
+            offset_transaction = await repo.get_owned(
                 models.Transaction,
                 transaction.offset_transactions_id,
-                load_relationships_list=[models.Transaction.account],
+                current_user.id,
+                profile=LoadProfile.DETAIL,
             )
+
             if offset_transaction is None:
                 return None
 
             offset_account = offset_transaction.account
 
-            if offset_account is None or offset_account.user_id != current_user.id:
-                return None
-
             offset_account.balance -= amount_updated
+            summary_entry_list.append(
+                (
+                    offset_account.id,
+                    offset_transaction.information.date,
+                    offset_transaction.information.amount,
+                    -1,
+                )
+            )
             offset_transaction.information.amount = transaction_information.amount * -1
+            offset_transaction.amount = offset_transaction.information.amount
+            summary_entry_list.append(
+                (
+                    offset_account.id,
+                    offset_transaction.information.date,
+                    offset_transaction.information.amount,
+                    1,
+                )
+            )
 
         account_values = {"balance": account.balance + amount_updated}
         await repo.update(models.Account, account.id, **account_values)
@@ -293,12 +866,23 @@ class TransactionService:
             "date": transaction_information.date,
             "category_id": transaction_information.category_id,
         }
+        category_changed = (
+            transaction.information.category_id != transaction_information.category_id
+        )
         await repo.update(
             models.TransactionInformation,
             transaction.information.id,
             **transaction_values,
         )
 
+        if category_changed:
+            await set_category(
+                transaction.information, transaction_information.category_id
+            )
+        transaction.amount = transaction_information.amount
+        transaction.date = transaction_information.date
+        await repo.update_monthly_summaries(summary_entry_list)
+
         return transaction
 
     async def delete_transaction(
@@ -320,40 +904,47 @@ class TransactionService:
             transaction_id,
             current_user.id,
         )
-        transaction = await repo.get(
+        transaction = await repo.get_owned(
             models.Transaction,
             transaction_id,
-            load_relationships_list=[models.Transaction.offset_transaction],
+            current_user.id,
+            profile=LoadProfile.DETAIL,
         )
 
         if transaction is None:
-            logger.warning("Transaction with ID %s not found.", transaction_id)
+            logger.warning(TRANSACTION_NOT_FOUND, transaction_id, current_user.id)
             return None
 
-        account = await repo.get(models.Account, transaction.account_id)
-
-        if account is None:
-            return None
-
-        if current_user.id != account.user_id:
-            return None
+        account = transaction.account
 
         amount = transaction.information.amount
+        summary_entry_list = [
+            (account.id, transaction.information.date, amount, -1),
+        ]
 
         if transaction.offset_transaction:
             logger.info("Handling offset transaction for delete.")
             offset_transaction = transaction.offset_transaction
-            offset_account = await repo.get(
-                models.Account, offset_transaction.account_id
+            offset_account = await repo.get_owned(
+                models.Account, offset_transaction.account_id, current_user.id
             )
 
             if offset_account is None:
                 return None
 
             offset_account.balance += amount
+            summary_entry_list.append(
+                (
+                    offset_account.id,
+                    offset_transaction.information.date,
+                    offset_transaction.information.amount,
+                    -1,
+                )
+            )
             await repo.delete(transaction.offset_transaction)
 
         account.balance -= amount
         await repo.delete(transaction)
+        await repo.update_monthly_summaries(summary_entry_list)
 
         return True
@@ -6,9 +6,11 @@ from fastapi_users import exceptions
 from app import database, models
 from app import repository as repo
 from app.authentication.management import UserManager
+from app.cache import user_cache
 from app.database import db
 from app.logger import get_logger
 from app.schemas import EmailStr, UserCreate, UserUpdate
+from app.services import categories as category_service
 from app.utils.dataclasses_utils import CreateUserData
 from app.utils.displayname_generator import generate_displayname
 from app.utils.enums import EmailVerificationStatus
@@ -74,6 +76,9 @@ class UserService:
 
         logger.info("Deleting user %s", current_user.id)
         await repo.delete(current_user)
+        user_cache.invalidate(current_user.id)
+        # The user's own categories are deleted with the user
+        await category_service.invalidate_categories(current_user.id)
         return True
 
     async def update_user(self, user: models.User) -> models.User:
@@ -1,8 +1,5 @@
 from typing import Any
 
-from sqlalchemy.orm.base import object_mapper
-from sqlalchemy.orm.exc import UnmappedInstanceError
-
 from app.database import db
 from app.logger import get_logger
 
@@ -12,6 +9,10 @@ logger = get_logger(__name__)
 async def transaction(handler, *args: Any) -> Any:
     """Execute a transaction for the specified handler function.
 
+    The result is returned as it is after the commit. Handlers load or set
+    the relationships their responses need, and server defaults are fetched
+    during the flush.
+
     Args:
         handler: The handler function to execute within the transaction.
         *args: Additional arguments to pass to the handler function.
@@ -22,35 +23,18 @@ async def transaction(handler, *args: Any) -> Any:
     Raises:
         None
     """
+    session = db.current_session
     try:
         result = await handler(*args)
-        if db.session:
-            await db.session.commit()
-            if is_model_instance(result):
-                await db.session.refresh(result)
+        if session is not None:
+            await session.commit()
 
     except Exception as e:
         logger.error(
             "Error occurred during transaction for %s: %s", handler.__name__, e
         )
         result = {}
-        if db.session:
-            await db.session.rollback()
+        if session is not None:
+            await session.rollback()
 
     return result
-
-
-def is_model_instance(obj):
-    """Check if the given object is a SQLAlchemy model instance.
-
-    Args:
-        obj: The object to check.
-
-    Returns:
-        bool: True if the object is a SQLAlchemy model instance, False otherwise.
-    """
-    try:
-        object_mapper(obj)
-        return True
-    except UnmappedInstanceError:
-        return False
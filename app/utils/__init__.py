@@ -2,6 +2,8 @@ from typing import Optional
 
 from fastapi import APIRouter, Request
 
+from app.utils.responses import ApiJSONResponse
+
 
 class Breadcrumb:
     def __init__(self, request: Request, title: str, url: Optional[str] = None):
@@ -70,6 +72,10 @@ class APIRouterExtended(APIRouter):
         if "tags" in kwargs and "Api" not in kwargs["tags"]:
             kwargs["tags"].append("Api")
 
+        # Render with orjson if enabled, unless the router chooses a class
+        if "default_response_class" not in kwargs:
+            kwargs["default_response_class"] = ApiJSONResponse
+
         super().__init__(*args, **kwargs)
 
 
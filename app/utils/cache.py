@@ -0,0 +1,103 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+MISSING = object()
+
+
+class TTLCache:
+    """
+    A process-local cache whose entries expire after a fixed time.
+
+    When max_size entries are stored, the least recently used one is evicted.
+    The cache is meant for the event loop thread and is not thread-safe.
+
+    Args:
+        ttl: The number of seconds an entry stays valid.
+        max_size: The maximum number of entries.
+        timer: The clock used for expiry, monotonic by default.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int = 1024,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.timer = timer
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Returns the value of a key that has not expired yet.
+
+        Args:
+            key: The key.
+            default: The value to return if the key is missing or expired.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self.timer():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value, evicting the least recently used entry when full.
+
+        Args:
+            key: The key.
+            value: The value.
+            ttl: The number of seconds the value stays valid (default: self.ttl).
+
+        Returns:
+            None
+        """
+
+        self._entries[key] = (
+            self.timer() + (self.ttl if ttl is None else ttl),
+            value,
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Removes a key if it is cached.
+
+        Args:
+            key: The key.
+
+        Returns:
+            None
+        """
+
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+
+        Returns:
+            None
+        """
+
+        self._entries.clear()
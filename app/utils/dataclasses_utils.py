@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
 from typing import Optional
 
 from fastapi import Request
@@ -12,3 +14,21 @@ class CreateUserData:
     is_verified: Optional[bool] = False
     is_superuser: Optional[bool] = False
     request: Optional[Request] = None
+
+
+@dataclass
+class DailyTransactionSummary:
+    day: date
+    income: Decimal
+    expenses: Decimal
+    total: Decimal
+    count: int
+
+
+@dataclass
+class TransactionSummary:
+    income: Decimal = Decimal(0)
+    expenses: Decimal = Decimal(0)
+    total: Decimal = Decimal(0)
+    count: int = 0
+    days: list[DailyTransactionSummary] = field(default_factory=list)
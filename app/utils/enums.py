@@ -28,3 +28,34 @@ class DatabaseFilterOperator(Enum):
     LESS_THAN_OR_EQUAL = "<="
     GREATER_THAN = ">"
     GREATER_THAN_OR_EQUAL = ">="
+
+
+class Frequency(Enum):
+    ONCE = 1
+    DAILY = 2
+    WEEKLY = 3
+    MONTHLY = 4
+    YEARLY = 5
+
+
+class ImportFormat(Enum):
+    CSV = "csv"
+    OFX = "ofx"
+
+
+class ImportStatus(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExportFormat(Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class LoadProfile(Enum):
+    MINIMAL = "minimal"
+    LIST = "list"
+    DETAIL = "detail"
@@ -0,0 +1,88 @@
+import hashlib
+from collections import Counter
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Hashable
+
+
+def normalize_reference(reference: str) -> str:
+    """
+    Normalizes a booking text for comparison.
+
+    Args:
+        reference: The booking text.
+
+    Returns:
+        str: The case folded text with collapsed whitespace.
+    """
+
+    return " ".join(reference.casefold().split())
+
+
+def transaction_fingerprint(
+    date: datetime, amount: Decimal, reference: str, occurrence: int = 0
+) -> str:
+    """
+    Computes the fingerprint that identifies an imported transaction.
+
+    Banks report the same booking with different times of day, so only the
+    UTC day is part of the fingerprint. The occurrence tells identical
+    bookings within one statement apart, like two equal payments on a day.
+
+    Args:
+        date: The booking date.
+        amount: The amount, rounded to two decimal places.
+        reference: The booking text.
+        occurrence: How many identical bookings came before in the statement.
+
+    Returns:
+        str: The hex digest of the fingerprint.
+    """
+
+    key = "|".join(
+        [
+            date.astimezone(timezone.utc).date().isoformat(),
+            f"{amount:.2f}",
+            normalize_reference(reference),
+            str(occurrence),
+        ]
+    )
+
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class FingerprintCounter:
+    """
+    Assigns fingerprints to the transactions of one statement or request,
+    counting identical bookings per scope (usually the account).
+    """
+
+    def __init__(self) -> None:
+        self.occurrence_map: Counter = Counter()
+
+    def fingerprint(
+        self, scope: Hashable, date: datetime, amount: Decimal, reference: str
+    ) -> str:
+        """
+        Computes the fingerprint of the next transaction.
+
+        Args:
+            scope: The scope the fingerprint is unique in.
+            date: The booking date.
+            amount: The amount, rounded to two decimal places.
+            reference: The booking text.
+
+        Returns:
+            str: The hex digest of the fingerprint.
+        """
+
+        fingerprint = transaction_fingerprint(date, amount, reference)
+        # Only the hashes are kept, so memory does not grow with the references
+        key = (scope, hash(fingerprint))
+        occurrence = self.occurrence_map[key]
+        self.occurrence_map[key] += 1
+
+        if occurrence:
+            return transaction_fingerprint(date, amount, reference, occurrence)
+
+        return fingerprint
@@ -1 +1,3 @@
 ACCOUNT_USER_ID_MISMATCH = "Account User ID does not match the User ID."
+ACCOUNT_NOT_FOUND = "Account %s not found for user %s."
+TRANSACTION_NOT_FOUND = "Transaction %s not found for user %s."
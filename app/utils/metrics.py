@@ -0,0 +1,280 @@
+from bisect import bisect_left
+from typing import Iterable, Iterator, Sequence, TypeVar
+
+LATENCY_BUCKET_LIST = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+MetricT = TypeVar("MetricT", bound="Metric")
+
+
+def _escape(value: str) -> str:
+    """
+    Escapes a label value for the Prometheus text format.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        str: The escaped value.
+    """
+
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(label_pair_list: Iterable[tuple[str, str]]) -> str:
+    """
+    Formats label pairs for a sample line.
+
+    Args:
+        label_pair_list: The (name, value) pairs.
+
+    Returns:
+        str: The labels in braces, or an empty string without labels.
+    """
+
+    labels = ",".join(f'{name}="{_escape(value)}"' for name, value in label_pair_list)
+    return f"{{{labels}}}" if labels else ""
+
+
+def _format_value(value: float) -> str:
+    """
+    Formats a sample value.
+
+    Args:
+        value: The value.
+
+    Returns:
+        str: The value, without a fraction for whole numbers.
+    """
+
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    """
+    The base of all metrics, a family of series identified by label values.
+
+    Args:
+        name: The metric name.
+        documentation: The help text.
+        label_names: The names of the labels every series has.
+    """
+
+    metric_type = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+
+    def _check_labels(self, label_values: tuple) -> None:
+        """
+        Checks that a value is given for every label.
+
+        Args:
+            label_values: The values of the labels.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+
+        if len(label_values) != len(self.label_names):
+            raise ValueError(
+                f"{self.name} expects the labels {', '.join(self.label_names)}"
+            )
+
+    def samples(self) -> Iterator[str]:
+        """
+        Yields the sample lines of all series.
+
+        Yields:
+            str: A sample line.
+        """
+
+        yield from ()
+
+    def render(self) -> str:
+        """
+        Renders the metric in the Prometheus text format.
+
+        Returns:
+            str: The HELP and TYPE lines followed by the samples.
+        """
+
+        return "\n".join(
+            [
+                f"# HELP {self.name} {self.documentation}",
+                f"# TYPE {self.name} {self.metric_type}",
+                *self.samples(),
+            ]
+        )
+
+
+class Counter(Metric):
+    """
+    A value that only goes up, like the number of executed queries.
+    """
+
+    metric_type = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """
+        Increases the series of the given label values.
+
+        Args:
+            label_values: The values of the labels, in the order of label_names.
+            amount: The amount to add.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+
+        self._check_labels(label_values)
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def get(self, *label_values: str) -> float:
+        """
+        Returns the current value of a series.
+
+        Args:
+            label_values: The values of the labels.
+
+        Returns:
+            float: The value, 0 if nothing was counted yet.
+        """
+
+        return self._values.get(label_values, 0)
+
+    def samples(self) -> Iterator[str]:
+        for label_values, value in self._values.items():
+            labels = _format_labels(zip(self.label_names, label_values))
+            yield f"{self.name}_total{labels} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    """
+    Counts observations in buckets and keeps their sum, like the latency of
+    requests.
+
+    Args:
+        name: The metric name.
+        documentation: The help text.
+        label_names: The names of the labels every series has.
+        buckets: The upper bounds of the buckets. The +Inf bucket is implied.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = tuple(LATENCY_BUCKET_LIST),
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_label_list = [_format_value(bound) for bound in self.buckets]
+        self.bucket_label_list.append("+Inf")
+        # Per series: the count of each bucket and the +Inf bucket, then the sum
+        self._series: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """
+        Records an observation in the series of the given label values.
+
+        Args:
+            value: The observed value.
+            label_values: The values of the labels, in the order of label_names.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+
+        self._check_labels(label_values)
+        series = self._series.get(label_values)
+
+        if series is None:
+            series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def get_count(self, *label_values: str) -> int:
+        """
+        Returns the number of observations of a series.
+
+        Args:
+            label_values: The values of the labels.
+
+        Returns:
+            int: The number of observations.
+        """
+
+        series = self._series.get(label_values)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> Iterator[str]:
+        for label_values, series in self._series.items():
+            label_pair_list = list(zip(self.label_names, label_values))
+            cumulative_count = 0
+
+            for upper_bound, count in zip(self.bucket_label_list, series[:-1]):
+                cumulative_count += int(count)
+                labels = _format_labels([*label_pair_list, ("le", upper_bound)])
+                yield f"{self.name}_bucket{labels} {cumulative_count}"
+
+            labels = _format_labels(label_pair_list)
+            yield f"{self.name}_sum{labels} {_format_value(series[-1])}"
+            yield f"{self.name}_count{labels} {cumulative_count}"
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics of the process and renders them together.
+    """
+
+    def __init__(self) -> None:
+        self.metric_list: list[Metric] = []
+
+    def register(self, metric: MetricT) -> MetricT:
+        """
+        Adds a metric to the registry.
+
+        Args:
+            metric: The metric.
+
+        Returns:
+            MetricT: The same metric.
+        """
+
+        self.metric_list.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+
+        return "\n".join(metric.render() for metric in self.metric_list) + "\n"
@@ -0,0 +1,66 @@
+import base64
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+CURSOR_SEPARATOR = "|"
+
+
+def encode_cursor(date: datetime, instance_id: int) -> str:
+    """Encode a (date, id) keyset position into an opaque cursor.
+
+    Args:
+        date: The date of the last returned row.
+        instance_id: The ID of the last returned row.
+
+    Returns:
+        str: The URL-safe cursor.
+
+    Raises:
+        None
+    """
+    raw_cursor = f"{date.isoformat()}{CURSOR_SEPARATOR}{instance_id}"
+    return base64.urlsafe_b64encode(raw_cursor.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: The opaque cursor.
+
+    Returns:
+        tuple[datetime, int]: The date and ID of the keyset position.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        raw_cursor = base64.urlsafe_b64decode(cursor + padding).decode()
+        raw_date, raw_id = raw_cursor.split(CURSOR_SEPARATOR)
+        return datetime.fromisoformat(raw_date), int(raw_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[tuple[datetime, int]]:
+    """Decode the cursor parameter of a request.
+
+    Args:
+        cursor: The opaque cursor, or None for the first page.
+
+    Returns:
+        Optional[tuple[datetime, int]]: The keyset position, or None for the
+            first page.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        return decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from e
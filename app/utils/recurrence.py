@@ -0,0 +1,441 @@
+from datetime import datetime, timezone
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from app.utils.enums import Frequency
+
+DATETIME_DTYPE = "datetime64[us]"
+DAY = np.timedelta64(1, "D")
+DAY_STEP_MAP = {Frequency.DAILY: 1, Frequency.WEEKLY: 7}
+MONTH_STEP_MAP = {Frequency.MONTHLY: 1, Frequency.YEARLY: 12}
+# Longest gap between two occurrences, from Feb 28 to Feb 29 of a leap year
+MAX_STEP = np.timedelta64(366, "D")
+
+DatetimeLike = Union[np.ndarray, np.datetime64]
+
+
+def to_datetime64(date_list: Sequence[Optional[datetime]]) -> np.ndarray:
+    """Convert timezone-aware datetimes into a UTC datetime64 array.
+
+    Args:
+        date_list: The datetimes to convert. None becomes NaT.
+
+    Returns:
+        np.ndarray: The datetime64[us] array.
+
+    Raises:
+        None
+    """
+    return np.array(
+        [
+            date.astimezone(timezone.utc).replace(tzinfo=None) if date else None
+            for date in date_list
+        ],
+        dtype=DATETIME_DTYPE,
+    )
+
+
+def from_datetime64(date_array: np.ndarray) -> list[Optional[datetime]]:
+    """Convert a UTC datetime64 array back into timezone-aware datetimes.
+
+    Args:
+        date_array: The datetime64 array.
+
+    Returns:
+        list[Optional[datetime]]: The UTC datetimes, None for NaT.
+
+    Raises:
+        None
+    """
+    return [
+        date.replace(tzinfo=timezone.utc) if date is not None else None
+        for date in date_array.astype(DATETIME_DTYPE).tolist()
+    ]
+
+
+def _get_steps(frequency_ids: np.ndarray, step_map: dict[Frequency, int]) -> np.ndarray:
+    """Look up the step length of every schedule.
+
+    Args:
+        frequency_ids: The frequency ID of every schedule.
+        step_map: The step length per frequency.
+
+    Returns:
+        np.ndarray: The step length of every schedule, 0 for frequencies that
+            are not in the map.
+
+    Raises:
+        None
+    """
+    steps = np.zeros(len(frequency_ids), dtype=np.int64)
+    for frequency, step in step_map.items():
+        steps[frequency_ids == frequency.value] = step
+
+    return steps
+
+
+def _get_day_step_range(
+    day_steps: np.ndarray,
+    date_starts: np.ndarray,
+    after: np.ndarray,
+    limits: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the first and last step index of daily and weekly schedules.
+
+    Args:
+        day_steps: The step length in days of every schedule, 0 if it has none.
+        date_starts: The first occurrence of every schedule.
+        after: The exclusive lower bound of every schedule.
+        limits: The inclusive upper bound of every schedule.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The first and last step index, 0 for
+            schedules without a day step.
+
+    Raises:
+        None
+    """
+    is_day_step = day_steps > 0
+    step_lengths = (np.where(is_day_step, day_steps, 1) * DAY).astype("timedelta64[us]")
+
+    first_indexes = np.where(is_day_step, (after - date_starts) // step_lengths + 1, 0)
+    last_indexes = np.where(is_day_step, (limits - date_starts) // step_lengths, 0)
+
+    return first_indexes, last_indexes
+
+
+def _get_month_step_range(
+    month_steps: np.ndarray,
+    start_months: np.ndarray,
+    after: np.ndarray,
+    limits: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the first and last step index of monthly and yearly schedules.
+
+    The range may include one occurrence too many on each side, because the
+    day of the month is not taken into account; those are filtered out later.
+
+    Args:
+        month_steps: The step length in months of every schedule, 0 if it has none.
+        start_months: The month of the first occurrence of every schedule.
+        after: The exclusive lower bound of every schedule.
+        limits: The inclusive upper bound of every schedule.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The first and last step index, 0 for
+            schedules without a month step.
+
+    Raises:
+        None
+    """
+    is_month_step = month_steps > 0
+    safe_month_steps = np.where(is_month_step, month_steps, 1)
+
+    after_months = (after.astype("datetime64[M]") - start_months).astype(np.int64)
+    limit_months = (limits.astype("datetime64[M]") - start_months).astype(np.int64)
+
+    first_indexes = np.where(is_month_step, after_months // safe_month_steps, 0)
+    last_indexes = np.where(is_month_step, limit_months // safe_month_steps, 0)
+
+    return first_indexes, last_indexes
+
+
+def _repeat_steps(
+    first_indexes: np.ndarray, last_indexes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Enumerate the step indexes of every schedule without a Python loop.
+
+    Args:
+        first_indexes: The first step index of every schedule.
+        last_indexes: The last step index of every schedule.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The schedule index and the step index
+            of every candidate occurrence.
+
+    Raises:
+        None
+    """
+    first_indexes = np.maximum(first_indexes, 0)
+    counts = np.maximum(last_indexes - first_indexes + 1, 0)
+
+    schedule_indexes = np.repeat(np.arange(len(counts)), counts)
+    group_offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    step_indexes = (
+        first_indexes[schedule_indexes]
+        + np.arange(len(schedule_indexes))
+        - group_offsets
+    )
+
+    return schedule_indexes, step_indexes
+
+
+def _get_month_step_dates(
+    date_starts: np.ndarray, month_steps: np.ndarray, step_indexes: np.ndarray
+) -> np.ndarray:
+    """Compute the dates of monthly and yearly occurrences.
+
+    The day of date_start is kept and clamped to the end of shorter months.
+
+    Args:
+        date_starts: The first occurrence of the schedule of every occurrence.
+        month_steps: The step length in months of the schedule of every occurrence.
+        step_indexes: The step index of every occurrence.
+
+    Returns:
+        np.ndarray: The date of every occurrence.
+
+    Raises:
+        None
+    """
+    start_months = date_starts.astype("datetime64[M]")
+    start_days = date_starts.astype("datetime64[D]")
+    day_offsets = start_days - start_months.astype("datetime64[D]")
+
+    months = start_months + (step_indexes * month_steps).astype("timedelta64[M]")
+    month_starts = months.astype("datetime64[D]")
+    month_lengths = (months + np.timedelta64(1, "M")).astype(
+        "datetime64[D]"
+    ) - month_starts
+
+    return (
+        month_starts
+        + np.minimum(day_offsets, month_lengths - DAY)
+        + (date_starts - start_days)
+    )
+
+
+def _check_frequencies(frequency_ids: np.ndarray) -> None:
+    """Check that every frequency ID belongs to a known frequency.
+
+    Args:
+        frequency_ids: The frequency ID of every schedule.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If a frequency is unknown.
+    """
+    unknown_id_list = set(frequency_ids.tolist()) - {f.value for f in Frequency}
+    if unknown_id_list:
+        raise ValueError(f"Unknown frequency IDs: {sorted(unknown_id_list)}")
+
+
+def _get_bounds(
+    date_starts: np.ndarray,
+    date_ends: np.ndarray,
+    after: DatetimeLike,
+    until: DatetimeLike,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the window of every schedule.
+
+    Args:
+        date_starts: The first occurrence of every schedule.
+        date_ends: The last possible occurrence of every schedule (NaT if open).
+        after: The exclusive lower bound (per schedule or scalar, NaT for none).
+        until: The inclusive upper bound (per schedule or scalar).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The exclusive lower and the inclusive
+            upper bound of every schedule.
+
+    Raises:
+        None
+    """
+    shape = date_starts.shape
+    after_array = np.broadcast_to(np.asarray(after, dtype=DATETIME_DTYPE), shape)
+    until_array = np.broadcast_to(np.asarray(until, dtype=DATETIME_DTYPE), shape)
+    end_array = np.asarray(date_ends, dtype=DATETIME_DTYPE)
+
+    return (
+        np.where(
+            np.isnat(after_array), date_starts - np.timedelta64(1, "us"), after_array
+        ),
+        np.where(np.isnat(end_array), until_array, np.minimum(end_array, until_array)),
+    )
+
+
+def _get_step_range(
+    day_steps: np.ndarray,
+    month_steps: np.ndarray,
+    date_starts: np.ndarray,
+    after: np.ndarray,
+    limits: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the range of steps of every schedule within its window.
+
+    Args:
+        day_steps: The step length in days of every schedule.
+        month_steps: The step length in months of every schedule.
+        date_starts: The first occurrence of every schedule.
+        after: The exclusive lower bound of every schedule.
+        limits: The inclusive upper bound of every schedule.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The first and the last step of every
+            schedule.
+
+    Raises:
+        None
+    """
+    # Only one of the ranges is non-zero per schedule
+    day_first, day_last = _get_day_step_range(day_steps, date_starts, after, limits)
+    month_first, month_last = _get_month_step_range(
+        month_steps, date_starts.astype("datetime64[M]"), after, limits
+    )
+
+    return day_first + month_first, day_last + month_last
+
+
+def _get_dates(
+    date_starts: np.ndarray,
+    day_steps: np.ndarray,
+    month_steps: np.ndarray,
+    schedule_indexes: np.ndarray,
+    step_indexes: np.ndarray,
+) -> np.ndarray:
+    """Compute the date of every candidate occurrence.
+
+    Args:
+        date_starts: The first occurrence of every schedule.
+        day_steps: The step length in days of every schedule.
+        month_steps: The step length in months of every schedule.
+        schedule_indexes: The schedule index of every occurrence.
+        step_indexes: The step index of every occurrence.
+
+    Returns:
+        np.ndarray: The date of every occurrence.
+
+    Raises:
+        None
+    """
+    starts = date_starts[schedule_indexes]
+    month_steps = month_steps[schedule_indexes]
+
+    return np.where(
+        month_steps > 0,
+        _get_month_step_dates(starts, month_steps, step_indexes),
+        starts + step_indexes * (day_steps[schedule_indexes] * DAY),
+    )
+
+
+def _filter_window(
+    schedule_indexes: np.ndarray,
+    dates: np.ndarray,
+    after: np.ndarray,
+    limits: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Drop the occurrences outside of their schedule's window and sort them.
+
+    Args:
+        schedule_indexes: The schedule index of every occurrence.
+        dates: The date of every occurrence.
+        after: The exclusive lower bound of every schedule.
+        limits: The inclusive upper bound of every schedule.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The schedule index and the date of the
+            remaining occurrences, sorted by date.
+
+    Raises:
+        None
+    """
+    mask = (dates > after[schedule_indexes]) & (dates <= limits[schedule_indexes])
+    schedule_indexes = schedule_indexes[mask]
+    dates = dates[mask]
+
+    order = np.argsort(dates, kind="stable")
+
+    return schedule_indexes[order], dates[order]
+
+
+def expand_occurrences(
+    frequency_ids: Sequence[int],
+    date_starts: np.ndarray,
+    date_ends: np.ndarray,
+    after: DatetimeLike,
+    until: DatetimeLike,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the occurrences of many schedules within a window at once.
+
+    Occurrence k of a schedule is date_start + k steps. Monthly and yearly steps
+    keep the day of date_start and clamp it to the end of shorter months, so a
+    schedule starting on Jan 31 occurs on Feb 28 (or 29) and again on Mar 31.
+
+    Args:
+        frequency_ids: The frequency ID of every schedule.
+        date_starts: The first occurrence of every schedule (datetime64).
+        date_ends: The last possible occurrence of every schedule (NaT if open).
+        after: Only occurrences later than this date (per schedule or scalar,
+            NaT for no lower bound).
+        until: Only occurrences up to and including this date (per schedule or
+            scalar).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The index of the schedule and the date of
+            every occurrence, sorted by date.
+
+    Raises:
+        ValueError: If a frequency is unknown.
+    """
+    frequency_array = np.asarray(frequency_ids, dtype=np.int64)
+    start_array = np.asarray(date_starts, dtype=DATETIME_DTYPE)
+
+    if len(frequency_array) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=DATETIME_DTYPE)
+
+    _check_frequencies(frequency_array)
+    after_array, limits = _get_bounds(start_array, date_ends, after, until)
+
+    day_steps = _get_steps(frequency_array, DAY_STEP_MAP)
+    month_steps = _get_steps(frequency_array, MONTH_STEP_MAP)
+
+    schedule_indexes, step_indexes = _repeat_steps(
+        *_get_step_range(day_steps, month_steps, start_array, after_array, limits)
+    )
+
+    dates = _get_dates(
+        start_array, day_steps, month_steps, schedule_indexes, step_indexes
+    )
+
+    return _filter_window(schedule_indexes, dates, after_array, limits)
+
+
+def next_occurrences(
+    frequency_ids: Sequence[int],
+    date_starts: np.ndarray,
+    date_ends: np.ndarray,
+    after: np.ndarray,
+) -> np.ndarray:
+    """Compute the first occurrence of many schedules after a date at once.
+
+    Args:
+        frequency_ids: The frequency ID of every schedule.
+        date_starts: The first occurrence of every schedule (datetime64).
+        date_ends: The last possible occurrence of every schedule (NaT if open).
+        after: The date per schedule the occurrence must be later than (NaT
+            for no lower bound).
+
+    Returns:
+        np.ndarray: The next occurrence of every schedule, NaT if it has none.
+
+    Raises:
+        ValueError: If a frequency is unknown.
+    """
+    date_starts = np.asarray(date_starts, dtype=DATETIME_DTYPE)
+    after = np.asarray(after, dtype=DATETIME_DTYPE)
+    until = np.where(np.isnat(after), date_starts, after) + MAX_STEP
+
+    schedule_indexes, dates = expand_occurrences(
+        frequency_ids, date_starts, date_ends, after, until
+    )
+
+    # The occurrences are sorted by date, so the first one of every schedule
+    # is its next occurrence.
+    next_dates = np.full(len(date_starts), np.datetime64("NaT"), dtype=DATETIME_DTYPE)
+    schedule_indexes, first_positions = np.unique(schedule_indexes, return_index=True)
+    next_dates[schedule_indexes] = dates[first_positions]
+
+    return next_dates
@@ -0,0 +1,73 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+
+
+def _default(value: Any) -> Any:
+    """
+    Converts the values orjson cannot serialize itself.
+
+    Decimals become floats, like the json_encoders of the schemas do.
+
+    Args:
+        value: The value.
+
+    Returns:
+        Any: The serializable value.
+
+    Raises:
+        TypeError: If the value has an unsupported type.
+    """
+
+    if isinstance(value, Decimal):
+        return float(value)
+
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _render_fast(content: Any) -> bytes:
+    """
+    Renders content with orjson.
+
+    Args:
+        content: The content.
+
+    Returns:
+        bytes: The JSON body.
+    """
+
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    A JSON response rendered with orjson.
+
+    Besides the JSON compatible content FastAPI passes to response classes,
+    it also takes Decimal, datetime, date and UUID values directly.
+    Datetimes are rendered in ISO 8601 with their offset, so UTC is
+    "+00:00" and not "Z" like in the schemas.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _render_fast(content)
+
+
+class ApiJSONResponse(JSONResponse):
+    """
+    The response class of the API routes.
+
+    Renders like FastJSONResponse if fast JSON responses are enabled and like
+    JSONResponse otherwise. The setting is read for every response, so it
+    can be changed without rebuilding the routers.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if settings.fast_json_responses:
+            return _render_fast(content)
+
+        return super().render(content)
@@ -0,0 +1,318 @@
+import codecs
+import csv
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import IO, Iterable, Iterator, Optional
+
+CHUNK_SIZE = 64 * 1024
+OFX_TOKEN_PATTERN = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+OFX_DATE_PATTERN = re.compile(
+    r"^(\d{8})(\d{6})?(?:\.\d+)?(?:\[([+-]?\d+(?:\.\d+)?)(?::[^\]]*)?\])?"
+)
+
+
+@dataclass(slots=True)
+class StatementRow:
+    """
+    A transaction parsed from a bank statement, before validation.
+
+    Args:
+        index: The position of the transaction in the statement.
+        date: The booking date.
+        amount: The signed amount.
+        reference: The booking text.
+    """
+
+    index: int
+    date: datetime
+    amount: Decimal
+    reference: str
+
+
+@dataclass(slots=True)
+class StatementError:
+    """
+    A statement row that could not be parsed.
+
+    Args:
+        index: The position of the row in the statement.
+        detail: What was wrong with the row.
+    """
+
+    index: int
+    detail: str
+
+
+@dataclass(slots=True)
+class CsvMapping:
+    """
+    Describes the layout of a CSV statement.
+
+    Args:
+        date_column: The header of the booking date column.
+        amount_column: The header of the amount column.
+        reference_column: The header of the booking text column.
+        delimiter: The field delimiter.
+        date_format: The strptime format of the dates (ISO 8601 if None).
+        decimal_separator: The decimal separator of the amounts.
+        thousands_separator: The thousands separator of the amounts.
+    """
+
+    date_column: str = "date"
+    amount_column: str = "amount"
+    reference_column: str = "reference"
+    delimiter: str = ","
+    date_format: Optional[str] = None
+    decimal_separator: str = "."
+    thousands_separator: str = ""
+
+
+def iter_chunks(file: IO[bytes], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Reads a binary file in chunks.
+
+    Args:
+        file: The file to read.
+        chunk_size: The number of bytes per chunk.
+
+    Yields:
+        bytes: The next chunk.
+    """
+
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+def iter_text(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """
+    Decodes byte chunks, also when a character is split between two chunks.
+
+    Args:
+        chunks: The byte chunks.
+        encoding: The text encoding.
+
+    Yields:
+        str: The decoded text of every chunk.
+    """
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    for chunk in chunks:
+        if text := decoder.decode(chunk):
+            yield text
+
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+def iter_lines(texts: Iterable[str]) -> Iterator[str]:
+    """
+    Splits a stream of text into lines, keeping the line endings.
+
+    Args:
+        texts: The text chunks.
+
+    Yields:
+        str: The next line.
+    """
+
+    rest = ""
+
+    for text in texts:
+        *line_list, rest = (rest + text).split("\n")
+        for line in line_list:
+            yield line + "\n"
+
+    if rest:
+        yield rest
+
+
+def parse_amount(
+    value: str, decimal_separator: str, thousands_separator: str
+) -> Decimal:
+    """
+    Parses a localized amount like "-1.234,56".
+
+    Args:
+        value: The raw amount.
+        decimal_separator: The decimal separator.
+        thousands_separator: The thousands separator.
+
+    Returns:
+        Decimal: The amount.
+
+    Raises:
+        ValueError: If the value is not a number.
+    """
+
+    value = value.strip().replace(" ", "")
+    if thousands_separator:
+        value = value.replace(thousands_separator, "")
+    if decimal_separator != ".":
+        value = value.replace(decimal_separator, ".")
+
+    try:
+        return Decimal(value)
+    except InvalidOperation as e:
+        raise ValueError(f"Invalid amount: {value!r}") from e
+
+
+def parse_date(value: str, date_format: Optional[str]) -> datetime:
+    """
+    Parses a date, assuming UTC if it has no timezone.
+
+    Args:
+        value: The raw date.
+        date_format: The strptime format (ISO 8601 if None).
+
+    Returns:
+        datetime: The timezone-aware date.
+
+    Raises:
+        ValueError: If the value does not match the format.
+    """
+
+    value = value.strip()
+    date = (
+        datetime.strptime(value, date_format)
+        if date_format
+        else datetime.fromisoformat(value)
+    )
+
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
+
+def parse_csv(
+    lines: Iterable[str], mapping: CsvMapping
+) -> Iterator[StatementRow | StatementError]:
+    """
+    Parses the rows of a CSV statement with a header line.
+
+    Args:
+        lines: The lines of the statement.
+        mapping: The layout of the statement.
+
+    Yields:
+        StatementRow | StatementError: The next parsed or rejected row.
+
+    Raises:
+        ValueError: If a mapped column is missing from the header.
+    """
+
+    reader = csv.DictReader(lines, delimiter=mapping.delimiter)
+    column_list = [mapping.date_column, mapping.amount_column, mapping.reference_column]
+    missing_column_list = [
+        column for column in column_list if column not in (reader.fieldnames or [])
+    ]
+
+    if missing_column_list:
+        raise ValueError(f"Missing columns: {', '.join(missing_column_list)}")
+
+    for index, row in enumerate(reader):
+        try:
+            yield StatementRow(
+                index=index,
+                date=parse_date(row[mapping.date_column] or "", mapping.date_format),
+                amount=parse_amount(
+                    row[mapping.amount_column] or "",
+                    mapping.decimal_separator,
+                    mapping.thousands_separator,
+                ),
+                reference=(row[mapping.reference_column] or "").strip(),
+            )
+        except ValueError as e:
+            yield StatementError(index=index, detail=str(e))
+
+
+def parse_ofx_date(value: str) -> datetime:
+    """
+    Parses an OFX date like 20240131120000.000[-5:EST].
+
+    Args:
+        value: The raw date.
+
+    Returns:
+        datetime: The timezone-aware date.
+
+    Raises:
+        ValueError: If the value is not an OFX date.
+    """
+
+    match = OFX_DATE_PATTERN.match(value.strip())
+
+    if match is None:
+        raise ValueError(f"Invalid date: {value!r}")
+
+    day, time, offset = match.groups()
+    date = datetime.strptime(day + (time or "000000"), "%Y%m%d%H%M%S")
+    tzinfo = timezone.utc
+
+    if offset:
+        tzinfo = timezone(timedelta(minutes=int(Decimal(offset) * 60)))
+
+    return date.replace(tzinfo=tzinfo).astimezone(timezone.utc)
+
+
+def iter_ofx_tokens(texts: Iterable[str]) -> Iterator[tuple[bool, str, str]]:
+    """
+    Tokenizes OFX (SGML or XML) into tags and their values.
+
+    Args:
+        texts: The text chunks of the statement.
+
+    Yields:
+        tuple[bool, str, str]: Whether it is a closing tag, the tag name in
+            upper case and the stripped value following the tag.
+    """
+
+    buffer = ""
+
+    for text in texts:
+        buffer += text
+        # The last tag may continue in the next chunk
+        cut = buffer.rfind("<")
+        complete, buffer = buffer[:cut], buffer[cut:]
+
+        for match in OFX_TOKEN_PATTERN.finditer(complete):
+            yield bool(match.group(1)), match.group(2).upper(), match.group(3).strip()
+
+    for match in OFX_TOKEN_PATTERN.finditer(buffer):
+        yield bool(match.group(1)), match.group(2).upper(), match.group(3).strip()
+
+
+def parse_ofx(texts: Iterable[str]) -> Iterator[StatementRow | StatementError]:
+    """
+    Parses the <STMTTRN> entries of an OFX statement.
+
+    Args:
+        texts: The text chunks of the statement.
+
+    Yields:
+        StatementRow | StatementError: The next parsed or rejected transaction.
+    """
+
+    index = 0
+    in_transaction = False
+    field_map: dict[str, str] = {}
+
+    for is_closing, tag, value in iter_ofx_tokens(texts):
+        if tag == "STMTTRN" and not is_closing:
+            in_transaction = True
+            field_map = {}
+        elif tag == "STMTTRN" and in_transaction:
+            try:
+                yield StatementRow(
+                    index=index,
+                    date=parse_ofx_date(field_map.get("DTPOSTED", "")),
+                    amount=parse_amount(field_map.get("TRNAMT", ""), ".", ""),
+                    reference=field_map.get("NAME") or field_map.get("MEMO", ""),
+                )
+            except ValueError as e:
+                yield StatementError(index=index, detail=str(e))
+
+            index += 1
+            in_transaction = False
+        elif in_transaction and not is_closing and value:
+            field_map[tag] = value
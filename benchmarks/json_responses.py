@@ -0,0 +1,134 @@
+"""
+Benchmark for rendering transaction lists as JSON responses.
+
+Builds a list of generated transactions and renders it with the default
+JSONResponse and with FastJSONResponse, in the two ways API routes produce
+their bodies: validated through a response model, where FastAPI converts
+the schemas to JSON compatible values before the response class renders
+them, and returned as plain dicts with Decimal and datetime values, which
+need jsonable_encoder for JSONResponse but not for FastJSONResponse.
+
+Usage:
+    python -m benchmarks.json_responses --rows 10000
+"""
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app import schemas
+from app.utils.responses import FastJSONResponse
+
+list_adapter = TypeAdapter(list[schemas.Transaction])
+
+
+def build_transactions(row_count: int) -> list[dict]:
+    """
+    Generates transactions in the shape of schemas.Transaction.
+
+    Args:
+        row_count: The number of transactions.
+
+    Returns:
+        list[dict]: The transactions with Decimal amounts and datetimes.
+    """
+
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    return [
+        {
+            "id": i,
+            "account_id": 1,
+            "information": {
+                "amount": Decimal(i % 20000 - 10000) / 100,
+                "reference": f"reference_{i}",
+                "category_id": 1 + i % 20,
+                "date": start + timedelta(minutes=i),
+                "category": {
+                    "id": 1 + i % 20,
+                    "label": "Category",
+                    "section": {"id": 1, "label": "Section"},
+                },
+            },
+            "offset_transactions_id": None,
+        }
+        for i in range(row_count)
+    ]
+
+
+def median_ms(render: Callable[[], bytes], repetitions: int) -> float:
+    """
+    Times a render function.
+
+    Args:
+        render: Renders a response body.
+        repetitions: How often it is called.
+
+    Returns:
+        float: The median duration in milliseconds.
+    """
+
+    durations = []
+
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        render()
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations) * 1000
+
+
+def main(row_count: int, repetitions: int) -> None:
+    """
+    Runs the benchmark and prints the results.
+
+    Args:
+        row_count: The number of transactions in the list.
+        repetitions: How often each body is rendered.
+
+    Returns:
+        None
+    """
+
+    transaction_list = build_transactions(row_count)
+    model_list = list_adapter.validate_python(transaction_list)
+
+    case_list = [
+        (
+            "response model",
+            lambda: JSONResponse(list_adapter.dump_python(model_list, mode="json")),
+            lambda: FastJSONResponse(list_adapter.dump_python(model_list, mode="json")),
+        ),
+        (
+            "plain dicts",
+            lambda: JSONResponse(jsonable_encoder(transaction_list)),
+            lambda: FastJSONResponse(transaction_list),
+        ),
+    ]
+
+    print(f"{row_count} transactions, median time per response")
+    print(f"{'content':<16}{'JSONResponse':>14}{'FastJSONResponse':>18}{'speedup':>9}")
+
+    for name, default_render, fast_render in case_list:
+        default_ms = median_ms(default_render, repetitions)
+        fast_ms = median_ms(fast_render, repetitions)
+        print(
+            f"{name:<16}{default_ms:>11.1f} ms{fast_ms:>15.1f} ms"
+            f"{default_ms / fast_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repetitions", type=int, default=20)
+    args = parser.parse_args()
+
+    main(args.rows, args.repetitions)
@@ -0,0 +1,190 @@
+"""
+Benchmark for the per-request overhead of the page context middlewares.
+
+Sends requests straight to two minimal apps, one with the header link,
+breadcrumb and token refresh middlewares written as BaseHTTPMiddleware and
+@app.middleware("http") functions, as they were before, and one with the
+pure ASGI middlewares from app.middleware. Each app serves an API route and
+a page route without a database.
+
+Usage:
+    python -m benchmarks.middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.config import settings
+from app.middleware import (
+    BreadcrumbMiddleware,
+    HeaderLinkMiddleware,
+    TokenRefreshMiddleware,
+)
+from app.utils import BreadcrumbBuilder
+
+
+def add_routes(app: FastAPI) -> FastAPI:
+    """
+    Adds an API route and a page route that read the request state.
+
+    Args:
+        app: The app.
+
+    Returns:
+        FastAPI: The app.
+    """
+
+    @app.get("/api/ping")
+    async def api_ping():
+        return {"ping": "pong"}
+
+    @app.get("/page")
+    async def page(request: Request):
+        return PlainTextResponse(str(request.state.breadcrumb_builder.build()))
+
+    return app
+
+
+def build_http_app() -> FastAPI:
+    """
+    Builds the app with the middlewares based on BaseHTTPMiddleware.
+
+    Returns:
+        FastAPI: The app.
+    """
+
+    app = add_routes(FastAPI())
+
+    class LegacyHeaderLinkMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            request.state.header_links = []
+            return await call_next(request)
+
+    app.add_middleware(LegacyHeaderLinkMiddleware)
+
+    @app.middleware("http")
+    async def add_breadcrumbs(request: Request, call_next):
+        breadcrumb_builder = BreadcrumbBuilder(request)
+        breadcrumb_builder.add("Dashboard", "/dashboard")
+        request.state.breadcrumb_builder = breadcrumb_builder
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def token_refresh_middleware(request: Request, call_next):
+        # Without token cookies the old middleware only read the cookies
+        request.cookies.get(settings.access_token_name)
+        request.cookies.get(settings.refresh_token_name)
+        return await call_next(request)
+
+    return app
+
+
+def build_asgi_app() -> FastAPI:
+    """
+    Builds the app with the pure ASGI middlewares.
+
+    Returns:
+        FastAPI: The app.
+    """
+
+    app = add_routes(FastAPI())
+    app.add_middleware(HeaderLinkMiddleware)
+    app.add_middleware(BreadcrumbMiddleware)
+    app.add_middleware(TokenRefreshMiddleware)
+
+    return app
+
+
+async def send_requests(app: FastAPI, path: str, request_count: int) -> float:
+    """
+    Sends GET requests to an app through the ASGI interface.
+
+    Args:
+        app: The app.
+        path: The requested path.
+        request_count: The number of requests.
+
+    Returns:
+        float: The mean time per request in microseconds.
+    """
+
+    async def send(_message):
+        return None
+
+    def make_receive():
+        message_list = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if message_list:
+                return message_list.pop()
+
+            # Like a server, wait for a disconnect that never comes
+            await asyncio.Event().wait()
+
+        return receive
+
+    def make_scope() -> dict:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 1234),
+            "server": ("bench", 80),
+        }
+
+    # Warm up the routing and middleware stack
+    for _ in range(100):
+        await app(make_scope(), make_receive(), send)
+
+    start = time.perf_counter()
+
+    for _ in range(request_count):
+        await app(make_scope(), make_receive(), send)
+
+    return (time.perf_counter() - start) / request_count * 1e6
+
+
+async def main(request_count: int) -> None:
+    """
+    Runs the benchmark and prints the results.
+
+    Args:
+        request_count: The number of requests per app and path.
+
+    Returns:
+        None
+    """
+
+    http_app = build_http_app()
+    asgi_app = build_asgi_app()
+
+    print(f"{request_count} requests per app and path, mean time per request")
+
+    for path in ["/api/ping", "/page"]:
+        http_us = await send_requests(http_app, path, request_count)
+        asgi_us = await send_requests(asgi_app, path, request_count)
+
+        print(f"{path}")
+        print(f"  {'http middleware':<18}{http_us:>10.1f} us")
+        print(f"  {'asgi middleware':<18}{asgi_us:>10.1f} us")
+        print(f"  {'saved':<18}{http_us - asgi_us:>10.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
@@ -0,0 +1,246 @@
+"""
+Benchmark for the period queries behind the account pages.
+
+Seeds the test database with a configurable number of transactions and
+scheduled transactions, then times repository.get_transactions_from_period
+and repository.get_scheduled_transactions_from_period without and with the
+period query indexes.
+
+WARNING: This drops and recreates all tables of the test database.
+
+Usage:
+    python -m benchmarks.period_queries --rows 2000000 --accounts 500
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app import repository as repo
+from app.config import settings
+from app.database import db
+from app.models import Base
+
+PERIOD_INDEX_LIST = [
+    (
+        "ix_transactions_account_id_information_id",
+        "transactions (account_id, information_id)",
+    ),
+    ("ix_transactions_information_date", "transactions_information (date)"),
+    (
+        "ix_transactions_scheduled_account_id_date_start_date_end",
+        "transactions_scheduled (account_id, date_start, date_end)",
+    ),
+]
+
+SEED_STATEMENT_LIST = [
+    "INSERT INTO transactions_section (id, label) VALUES (1, 'Section')",
+    "INSERT INTO transactions_category (id, label, section_id) VALUES (1, 'Category', 1)",
+    "INSERT INTO frequencies (id, label) VALUES (4, 'monthly')",
+    'INSERT INTO "user" (id, email, hashed_password, is_active, is_superuser, '
+    "is_verified) VALUES ('00000000-0000-0000-0000-000000000001', "
+    "'bench@pecuny.de', 'x', true, false, true)",
+]
+
+HISTORY_START = datetime(2014, 1, 1, tzinfo=timezone.utc)
+HISTORY_DAYS = 3650
+
+
+async def seed(row_count: int, account_count: int) -> None:
+    """
+    Recreates the schema and fills it with generated rows.
+
+    Args:
+        row_count: The number of transactions to create.
+        account_count: The number of accounts the transactions are spread over.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If the engine has not been initialized.
+    """
+
+    if db.engine is None:
+        raise RuntimeError("Engine has not been initialized")
+
+    async with db.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+        for statement in SEED_STATEMENT_LIST:
+            await conn.execute(text(statement))
+        await conn.execute(
+            text(
+                "INSERT INTO accounts (id, user_id, label, balance) "
+                "SELECT i, '00000000-0000-0000-0000-000000000001', "
+                "'account_' || i, 0 FROM generate_series(1, :accounts) AS i"
+            ),
+            {"accounts": account_count},
+        )
+
+        for table, target in [
+            ("transactions", row_count),
+            ("transactions_scheduled", row_count // 100),
+        ]:
+            await conn.execute(
+                text(
+                    "INSERT INTO transactions_information "
+                    "(id, amount, reference, date, category_id) "
+                    "SELECT i, round((random() * 200 - 100)::numeric, 2), "
+                    "'reference_' || i, "
+                    "CAST(:history_start AS timestamptz) "
+                    "+ random() * make_interval(days => :days), 1 "
+                    "FROM generate_series(:offset + 1, :offset + :rows) AS i"
+                ),
+                {
+                    "history_start": HISTORY_START,
+                    "days": HISTORY_DAYS,
+                    "offset": 0 if table == "transactions" else row_count,
+                    "rows": target,
+                },
+            )
+
+        await conn.execute(
+            text(
+                "INSERT INTO transactions (account_id, information_id, date, amount) "
+                "SELECT 1 + (i % :accounts), i, ti.date, ti.amount "
+                "FROM generate_series(1, :rows) AS i "
+                "JOIN transactions_information ti ON ti.id = i"
+            ),
+            {"accounts": account_count, "rows": row_count},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO transactions_scheduled "
+                "(account_id, information_id, frequency_id, date_start, date_end) "
+                "SELECT 1 + (i % :accounts), i, 4, ti.date, "
+                "ti.date + interval '20 days' "
+                "FROM generate_series(:offset + 1, :offset + :rows) AS i "
+                "JOIN transactions_information ti ON ti.id = i"
+            ),
+            {
+                "accounts": account_count,
+                "offset": row_count,
+                "rows": row_count // 100,
+            },
+        )
+        await conn.execute(
+            text(
+                "SELECT setval('transactions_information_id_seq', "
+                "(SELECT max(id) FROM transactions_information))"
+            )
+        )
+
+
+async def set_period_indexes(enabled: bool) -> None:
+    """
+    Creates or drops the period query indexes and refreshes the statistics.
+
+    Args:
+        enabled: Whether the indexes should exist afterwards.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If the engine has not been initialized.
+    """
+
+    if db.engine is None:
+        raise RuntimeError("Engine has not been initialized")
+
+    async with db.engine.begin() as conn:
+        for name, definition in PERIOD_INDEX_LIST:
+            if enabled:
+                await conn.execute(
+                    text(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+                )
+            else:
+                await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+        await conn.execute(text("ANALYZE"))
+
+
+async def time_queries(account_count: int, repetitions: int) -> dict[str, float]:
+    """
+    Times both period queries for random accounts and months.
+
+    Args:
+        account_count: The number of seeded accounts.
+        repetitions: How often each query is executed.
+
+    Returns:
+        dict[str, float]: The median duration of each query in milliseconds.
+    """
+
+    rng = random.Random(42)
+    durations: dict[str, list[float]] = {"transactions": [], "scheduled": []}
+
+    for _ in range(repetitions):
+        account_id = rng.randint(1, account_count)
+        date_start = HISTORY_START + timedelta(days=rng.randint(0, HISTORY_DAYS - 31))
+        date_end = date_start + timedelta(days=31)
+
+        async with db.session_scope():
+            start = time.perf_counter()
+            await repo.get_transactions_from_period(account_id, date_start, date_end)
+            durations["transactions"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await repo.get_scheduled_transactions_from_period(
+                account_id, date_start, date_end
+            )
+            durations["scheduled"].append(time.perf_counter() - start)
+
+    return {
+        name: statistics.median(values) * 1000 for name, values in durations.items()
+    }
+
+
+async def main(row_count: int, account_count: int, repetitions: int) -> None:
+    """
+    Runs the benchmark and prints the results.
+
+    Args:
+        row_count: The number of transactions to create.
+        account_count: The number of accounts the transactions are spread over.
+        repetitions: How often each query is executed per run.
+
+    Returns:
+        None
+    """
+
+    db.url = settings.test_db_url
+    await db.init()
+
+    print(f"Seeding {row_count} transactions over {account_count} accounts ...")
+    await seed(row_count, account_count)
+
+    results = {}
+    for enabled in [False, True]:
+        await set_period_indexes(enabled)
+        results[enabled] = await time_queries(account_count, repetitions)
+
+    print(f"{'query':<16}{'without indexes':>18}{'with indexes':>16}{'speedup':>10}")
+    for name in results[False]:
+        before = results[False][name]
+        after = results[True][name]
+        print(f"{name:<16}{before:>15.2f} ms{after:>13.2f} ms{before / after:>9.1f}x")
+
+    await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--repetitions", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.accounts, args.repetitions))
@@ -0,0 +1,114 @@
+"""
+Benchmark for the recurrence expansion of scheduled transactions.
+
+Generates random schedules and expands their occurrences within a window,
+once with a per-occurrence datetime loop and once with the vectorized
+app.utils.recurrence.expand_occurrences.
+
+Usage:
+    python -m benchmarks.recurrence --schedules 5000 --years 5
+"""
+
+import argparse
+import calendar
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.utils.enums import Frequency
+from app.utils.recurrence import expand_occurrences, to_datetime64
+
+
+def expand_with_loop(schedule_list: list[tuple], until: datetime) -> int:
+    """
+    Expands the schedules one occurrence at a time.
+
+    Args:
+        schedule_list: (frequency_id, date_start, date_end) tuples.
+        until: The end of the window.
+
+    Returns:
+        int: The number of occurrences.
+    """
+
+    occurrence_count = 0
+
+    for frequency_id, date_start, date_end in schedule_list:
+        limit = min(date_end, until)
+        index = 0
+        date = date_start
+
+        while date <= limit:
+            occurrence_count += 1
+            if frequency_id == Frequency.ONCE.value:
+                break
+
+            index += 1
+            if frequency_id in (Frequency.DAILY.value, Frequency.WEEKLY.value):
+                days = 1 if frequency_id == Frequency.DAILY.value else 7
+                date = date_start + timedelta(days=days * index)
+            else:
+                months = (
+                    index if frequency_id == Frequency.MONTHLY.value else index * 12
+                )
+                year, month = divmod(date_start.month - 1 + months, 12)
+                year += date_start.year
+                day = min(date_start.day, calendar.monthrange(year, month + 1)[1])
+                date = date_start.replace(year=year, month=month + 1, day=day)
+
+    return occurrence_count
+
+
+def main(schedule_count: int, years: int) -> None:
+    """
+    Runs the benchmark and prints the results.
+
+    Args:
+        schedule_count: The number of schedules.
+        years: The length of the window in years.
+
+    Returns:
+        None
+    """
+
+    random.seed(42)
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    until = now + timedelta(days=365 * years)
+
+    schedule_list = []
+    for _ in range(schedule_count):
+        date_start = now + timedelta(days=random.randint(0, 365))
+        date_end = date_start + timedelta(days=random.randint(30, 365 * years))
+        schedule_list.append(
+            (random.choice(list(Frequency)).value, date_start, date_end)
+        )
+
+    start = time.perf_counter()
+    loop_count = expand_with_loop(schedule_list, until)
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    schedule_index_array, _ = expand_occurrences(
+        [schedule[0] for schedule in schedule_list],
+        to_datetime64([schedule[1] for schedule in schedule_list]),
+        to_datetime64([schedule[2] for schedule in schedule_list]),
+        after=to_datetime64([None])[0],
+        until=to_datetime64([until])[0],
+    )
+    vectorized_ms = (time.perf_counter() - start) * 1000
+
+    assert loop_count == len(schedule_index_array)
+
+    print(f"{schedule_count} schedules, {loop_count} occurrences over {years} years")
+    print(f"{'datetime loop':<16}{loop_ms:>12.2f} ms")
+    print(f"{'vectorized':<16}{vectorized_ms:>12.2f} ms")
+    print(f"{'speedup':<16}{loop_ms / vectorized_ms:>12.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--schedules", type=int, default=5000)
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    main(args.schedules, args.years)
@@ -0,0 +1,150 @@
+"""
+Benchmark for building the response of the transaction list endpoint.
+
+Seeds the test database with the transactions of one account, then times a
+full page of them in two ways: loading ORM objects and serializing them
+through the response schema, as the endpoint did before, and selecting only
+the needed columns and serializing the rows directly, as the endpoint does
+now. Both include the query and rendering the JSON body.
+
+WARNING: This drops and recreates all tables of the test database.
+
+Usage:
+    python -m benchmarks.transaction_list --rows 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app import models
+from app import repository as repo
+from app import schemas
+from app.config import settings
+from app.database import db
+from app.services.transactions import _serialize_transaction_row
+from benchmarks.period_queries import seed, set_period_indexes
+
+DATE_START = datetime(2000, 1, 1, tzinfo=timezone.utc)
+DATE_END = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+page_adapter = TypeAdapter(schemas.TransactionPage)
+
+
+async def render_orm_page(limit: int) -> bytes:
+    """
+    Renders a page from ORM objects like the endpoint did with its
+    response model.
+
+    Args:
+        limit: The number of transactions of the page.
+
+    Returns:
+        bytes: The JSON body.
+    """
+
+    transaction = models.Transaction
+    query = (
+        select(transaction)
+        .filter(transaction.account_id == 1)
+        .filter(transaction.date >= DATE_START)
+        .filter(transaction.date <= DATE_END)
+        .order_by(transaction.date.desc(), transaction.id.desc())
+        .limit(limit)
+    )
+    result = await db.session.execute(query)
+    page = {"items": result.scalars().all(), "limit": limit, "next_cursor": None}
+
+    validated = page_adapter.validate_python(page, from_attributes=True)
+    return JSONResponse(page_adapter.dump_python(validated, mode="json")).body
+
+
+async def render_row_page(limit: int) -> bytes:
+    """
+    Renders a page from the selected rows like the endpoint does now,
+    without the ownership check of the service.
+
+    Args:
+        limit: The number of transactions of the page.
+
+    Returns:
+        bytes: The JSON body.
+    """
+
+    row_list = await repo.get_transactions_page(1, DATE_START, DATE_END, limit)
+    page = {
+        "items": [_serialize_transaction_row(row) for row in row_list],
+        "limit": limit,
+        "next_cursor": None,
+    }
+    return JSONResponse(page).body
+
+
+async def time_renders(limit: int, repetitions: int) -> dict[str, float]:
+    """
+    Times both ways of rendering a page, each in a fresh session.
+
+    Args:
+        limit: The number of transactions of the page.
+        repetitions: How often each page is rendered.
+
+    Returns:
+        dict[str, float]: The median duration of each way in milliseconds.
+    """
+
+    durations: dict[str, list[float]] = {"orm": [], "rows": []}
+
+    for _ in range(repetitions):
+        for name, render in [("orm", render_orm_page), ("rows", render_row_page)]:
+            async with db.session_scope():
+                start = time.perf_counter()
+                await render(limit)
+                durations[name].append(time.perf_counter() - start)
+
+    return {
+        name: statistics.median(values) * 1000 for name, values in durations.items()
+    }
+
+
+async def main(row_count: int, repetitions: int) -> None:
+    """
+    Runs the benchmark and prints the results.
+
+    Args:
+        row_count: The number of transactions of the account and the page.
+        repetitions: How often each page is rendered.
+
+    Returns:
+        None
+    """
+
+    db.url = settings.test_db_url
+    await db.init()
+
+    print(f"Seeding {row_count} transactions ...")
+    await seed(row_count, 1)
+    await set_period_indexes(True)
+
+    results = await time_renders(row_count, repetitions)
+    orm_ms, rows_ms = results["orm"], results["rows"]
+
+    print(f"{'orm objects':<14}{orm_ms:>10.1f} ms")
+    print(f"{'rows':<14}{rows_ms:>10.1f} ms")
+    print(f"{'speedup':<14}{orm_ms / rows_ms:>10.1f}x")
+
+    await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repetitions", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.repetitions))
@@ -1,13 +1,25 @@
+import csv
+import datetime
+import io
+import json
 from typing import Any, List
 
 import pytest
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
 
 from app import models
 from app import repository as repo
 from app import schemas
+from app.database import db
 from app.utils.classes import RoundedDecimal
-from app.utils.enums import RequestMethod
-from tests.utils import make_http_request
+from app.utils.enums import Frequency, RequestMethod
+from app.utils.responses import FastJSONResponse
+from tests.utils import (
+    get_account_transactions,
+    get_user_offset_account,
+    make_http_request,
+)
 
 pytestmark = pytest.mark.anyio
 ENDPOINT = "/api/accounts/"
@@ -205,6 +217,7 @@ async def test_update_account(
             assert account_val == value
 
 
+@pytest.mark.usefixtures("fast_json_responses")
 async def test_get_account_response(test_account):
     """
     Tests if the transaction amount in the JSON response is a float.
@@ -231,3 +244,341 @@ async def test_get_account_response(test_account):
     assert json_response["description"] == test_account.description
     assert json_response["id"] == test_account.id
     assert isinstance(json_response["balance"], float)
+
+
+async def test_get_balance_forecast(test_account: models.Account):
+    """
+    Test case for projecting the balances of an account and its offset account.
+
+    Args:
+        test_account (fixture): The test account.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    offset_account = await get_user_offset_account(test_account)
+
+    assert offset_account is not None
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    res = await make_http_request(
+        "/api/scheduled_transactions/",
+        json={
+            "account_id": test_account.id,
+            "amount": 10,
+            "reference": "Weekly",
+            "category_id": 1,
+            "date_start": str(now + datetime.timedelta(days=1)),
+            "date_end": str(now + datetime.timedelta(days=30)),
+            "frequency_id": Frequency.WEEKLY.value,
+            "offset_account_id": offset_account.id,
+        },
+        as_user=test_account.user,
+    )
+
+    assert res.status_code == 201
+
+    until = (now + datetime.timedelta(days=14)).isoformat().replace("+00:00", "Z")
+
+    for account, amount in [(test_account, 10), (offset_account, -10)]:
+        res = await make_http_request(
+            f"{ENDPOINT}{account.id}/forecast?until={until}",
+            as_user=test_account.user,
+            method=RequestMethod.GET,
+        )
+
+        assert res.status_code == 200
+
+        forecast = res.json()
+        balance_list = [day["balance"] for day in forecast["days"]]
+
+        assert len(balance_list) == 15
+        assert balance_list[0] == float(account.balance)
+        assert balance_list[1] == float(account.balance + amount)
+        assert balance_list[-1] == float(account.balance + 2 * amount)
+
+
+async def test_get_balance_forecast_pending_occurrences(
+    test_account: models.Account,
+):
+    """
+    Test case for forecasts that include due occurrences the scheduler has not
+    created yet and every occurrence of the last day.
+
+    Args:
+        test_account (fixture): The test account.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    until = f"{today + datetime.timedelta(days=3)}T00:00:00Z"
+    forecast_url = f"{ENDPOINT}{test_account.id}/forecast?until={until}"
+
+    res = await make_http_request(
+        forecast_url, as_user=test_account.user, method=RequestMethod.GET
+    )
+    before_list = [day["balance"] for day in res.json()["days"]]
+
+    # At noon, so no occurrence moves to another day while the test runs
+    date_start = datetime.datetime.combine(
+        today - datetime.timedelta(days=2), datetime.time(12), datetime.timezone.utc
+    )
+    res = await make_http_request(
+        "/api/scheduled_transactions/",
+        json={
+            "account_id": test_account.id,
+            "amount": 1,
+            "reference": "Daily",
+            "category_id": 1,
+            "date_start": str(date_start),
+            "date_end": str(date_start + datetime.timedelta(days=10)),
+            "frequency_id": Frequency.DAILY.value,
+            "offset_account_id": None,
+        },
+        as_user=test_account.user,
+    )
+
+    assert res.status_code == 201
+
+    scheduled_transaction_id = res.json()["id"]
+    res = await make_http_request(
+        forecast_url, as_user=test_account.user, method=RequestMethod.GET
+    )
+    after_list = [day["balance"] for day in res.json()["days"]]
+
+    scheduled_transaction = await repo.get(
+        models.TransactionScheduled, scheduled_transaction_id
+    )
+
+    assert scheduled_transaction is not None
+
+    await repo.delete(scheduled_transaction)
+    await db.session.commit()
+
+    # Today also gets the two past occurrences, the last day its noon one
+    assert [
+        round(after - before, 2) for before, after in zip(before_list, after_list)
+    ] == [3, 4, 5, 6]
+
+
+async def test_invalid_balance_forecast(
+    test_user: models.User, test_accounts: List[models.Account]
+):
+    """
+    Test case for forecasts of other users' accounts and too long forecasts.
+
+    Args:
+        test_user (fixture): The test user.
+        test_accounts (fixture): The list of test accounts.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    account = next(
+        account for account in test_accounts if account.user_id != test_user.id
+    )
+    own_account = next(
+        account for account in test_accounts if account.user_id == test_user.id
+    )
+
+    res = await make_http_request(
+        f"{ENDPOINT}{account.id}/forecast?until=2030-01-01T00:00:00Z",
+        as_user=test_user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == 404
+
+    res = await make_http_request(
+        f"{ENDPOINT}{own_account.id}/forecast?until=2100-01-01T00:00:00Z",
+        as_user=test_user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == 400
+
+
+@pytest.mark.usefixtures("create_transactions")
+async def test_export_account(test_account: models.Account):
+    """
+    Test case for exporting the transactions of an account as CSV and NDJSON.
+
+    Args:
+        test_account (fixture): The test account.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    transaction_list = await get_account_transactions(test_account)
+
+    assert transaction_list
+
+    res = await make_http_request(
+        f"{ENDPOINT}{test_account.id}/export?format=csv",
+        as_user=test_account.user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+
+    row_list = list(csv.DictReader(io.StringIO(res.text)))
+
+    assert len(row_list) == len(transaction_list)
+    assert [row["date"] for row in row_list] == sorted(row["date"] for row in row_list)
+
+    res = await make_http_request(
+        f"{ENDPOINT}{test_account.id}/export?format=ndjson",
+        as_user=test_account.user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == 200
+
+    item_list = [json.loads(line) for line in res.text.splitlines()]
+    transaction_map = {transaction.id: transaction for transaction in transaction_list}
+
+    assert {item["id"] for item in item_list} == set(transaction_map)
+
+    for item in item_list:
+        transaction = transaction_map[item["id"]]
+
+        assert RoundedDecimal(item["amount"]) == transaction.amount
+        assert item["category"] == transaction.information.category.label
+        assert item["section"] == transaction.information.category.section.label
+
+
+async def test_invalid_export_account(
+    test_user: models.User, test_accounts: List[models.Account]
+):
+    """
+    Test case for exporting another user's account.
+
+    Args:
+        test_user (fixture): The test user.
+        test_accounts (fixture): The list of test accounts.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    account = next(
+        account for account in test_accounts if account.user_id != test_user.id
+    )
+
+    res = await make_http_request(
+        f"{ENDPOINT}{account.id}/export",
+        as_user=test_user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == 404
+
+
+async def test_summaries_use_utc_calendar(
+    test_account: models.Account, test_user: models.User
+):
+    """
+    Tests that the monthly summaries and the daily buckets file transactions
+    under their UTC calendar day and month when the connection uses another
+    time zone.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    date = datetime.datetime(2020, 1, 31, 23, 30, tzinfo=datetime.timezone.utc)
+    date_start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    date_end = datetime.datetime(2020, 3, 1, tzinfo=datetime.timezone.utc)
+
+    res = await make_http_request(
+        "/api/transactions/",
+        json={
+            "account_id": test_account.id,
+            "amount": 10,
+            "reference": "End of January",
+            "date": date.isoformat(),
+            "category_id": 1,
+        },
+        as_user=test_user,
+    )
+    transaction_id = res.json()["id"]
+
+    await db.session.execute(text("SET LOCAL TIME ZONE 'Pacific/Kiritimati'"))
+    await repo.rebuild_monthly_summaries(test_account.id)
+
+    summary_list = await repo.get_monthly_summaries(
+        test_account.id, date_start, date_end
+    )
+    transaction_summary = await repo.get_transaction_summary(
+        test_account.id, date_start, date_end
+    )
+
+    assert [(item.year, item.month, item.count) for item in summary_list] == [
+        (2020, 1, 1)
+    ]
+    assert [day.day for day in transaction_summary.days] == [date.date()]
+
+    await db.session.commit()
+    await make_http_request(
+        f"/api/transactions/{transaction_id}",
+        as_user=test_user,
+        method=RequestMethod.DELETE,
+    )
+
+
+@pytest.mark.usefixtures("fast_json_responses")
+async def test_fast_json_responses(
+    test_account: models.Account, test_user: models.User
+):
+    """
+    Test case for the response class of the API routes, which renders the
+    same bytes as the default JSON response with and without orjson, and for
+    FastJSONResponse rendering Decimals as floats.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    res = await make_http_request(ENDPOINT, as_user=test_user, method=RequestMethod.GET)
+
+    assert res.status_code == 200
+    assert test_account.id in [account["id"] for account in res.json()]
+    assert res.content == JSONResponse(res.json()).body
+
+    content = {"amount": RoundedDecimal("-12.5"), "ids": [1, 2]}
+    assert FastJSONResponse(content).body == b'{"amount":-12.5,"ids":[1,2]}'
@@ -6,6 +6,7 @@ from app import models
 from app import repository as repo
 from app import schemas
 from app.auth_manager import get_strategy
+from app.authentication.strategies import decode_token, token_claims_cache
 from app.config import settings
 from app.utils.enums import RequestMethod
 from tests.utils import make_http_request
@@ -279,3 +280,55 @@ async def test_refresh_token_handling(test_user: models.User):
         url=endpoint, method=RequestMethod.GET, cookies=cookies
     )
     assert res.status_code == 200
+
+    access_token = res.cookies.get(settings.access_token_name)
+    assert access_token is not None
+    claims = decode_token(
+        access_token,
+        settings.access_token_secret_key,
+        settings.token_audience,
+        settings.algorithm,
+    )
+    assert claims["sub"] == str(test_user.id)
+
+
+async def test_token_claims_cached(test_user: models.User):
+    """
+    Tests that verified token claims are cached per key and that invalid or
+    expired tokens are rejected.
+
+    Args:
+        test_user: The test user object the tokens are issued for.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    strategy = get_strategy()
+    assert strategy is get_strategy()
+
+    token = await strategy.write_token(test_user)
+    args = (settings.token_audience, settings.algorithm)
+
+    claims = decode_token(token, settings.access_token_secret_key, *args)
+
+    assert claims["sub"] == str(test_user.id)
+    assert decode_token(token, settings.access_token_secret_key, *args) is claims
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_token(token, settings.refresh_token_secret_key, *args)
+
+    cache_size = len(token_claims_cache)
+    expired_token = jwt.encode(
+        {"sub": str(test_user.id), "aud": settings.token_audience, "exp": 1},
+        settings.access_token_secret_key,
+        algorithm=settings.algorithm,
+    )
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_token(expired_token, settings.access_token_secret_key, *args)
+
+    assert len(token_claims_cache) == cache_size
@@ -0,0 +1,166 @@
+from fastapi import status
+
+from app import models
+from app import repository as repo
+from app.database import db
+from app.services import categories as category_service
+from app.utils.enums import RequestMethod
+from tests.utils import make_http_request
+
+ENDPOINT = "/api/categories/"
+
+
+async def test_get_categories_cached(test_user: models.User):
+    """
+    Tests that categories are served from the cache until they are invalidated.
+
+    Args:
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    res = await make_http_request(ENDPOINT, as_user=test_user, method=RequestMethod.GET)
+
+    assert res.status_code == status.HTTP_200_OK
+
+    category = res.json()[0]
+    version = await category_service.category_cache.get_version()
+
+    await repo.update(
+        models.TransactionCategory, category["id"], label="Renamed category"
+    )
+    await db.session.commit()
+
+    res = await make_http_request(ENDPOINT, as_user=test_user, method=RequestMethod.GET)
+
+    label_map = {item["id"]: item["label"] for item in res.json()}
+
+    assert label_map[category["id"]] == category["label"]
+
+    await category_service.invalidate_categories()
+
+    # Until the bump is committed, the worker keeps its entries
+    assert await category_service.category_cache.get_version() == version
+
+    await db.session.commit()
+
+    assert await category_service.category_cache.get_version() == version + 1
+
+    res = await make_http_request(ENDPOINT, as_user=test_user, method=RequestMethod.GET)
+    choice_map = await category_service.get_category_choices(test_user)
+
+    label_map = {item["id"]: item["label"] for item in res.json()}
+
+    assert label_map[category["id"]] == "Renamed category"
+    assert (category["id"], "Renamed category") in choice_map[
+        category["section"]["label"]
+    ]
+
+    await repo.update(
+        models.TransactionCategory, category["id"], label=category["label"]
+    )
+    await category_service.invalidate_categories()
+    await db.session.commit()
+
+
+async def test_get_categories_per_user(
+    test_user: models.User, test_superuser: models.User
+):
+    """
+    Tests that users get the global categories and only their own custom ones,
+    and that creating, renaming and deleting them invalidates the cache of
+    their user only.
+
+    Args:
+        test_user (fixture): The test user.
+        test_superuser (fixture): Another verified user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    global_category_list = await repo.get_categories_by_user(None)
+    category_map = {}
+    cache = category_service.category_cache
+    global_version = await cache.get_version()
+    other_version = await cache.get_version(test_superuser.id)
+
+    for user, label in [(test_user, "Own category"), (test_superuser, "Other")]:
+        res = await make_http_request(
+            ENDPOINT, json={"label": label, "section_id": 1}, as_user=user
+        )
+
+        assert res.status_code == status.HTTP_201_CREATED
+        assert res.json()["section"]["id"] == 1
+
+        category_map[user.id] = res.json()["id"]
+
+    for user, hidden_user in [(test_user, test_superuser), (test_superuser, test_user)]:
+        res = await make_http_request(ENDPOINT, as_user=user, method=RequestMethod.GET)
+
+        assert res.status_code == status.HTTP_200_OK
+
+        id_list = [item["id"] for item in res.json()]
+
+        assert category_map[user.id] in id_list
+        assert category_map[hidden_user.id] not in id_list
+        assert len(id_list) == len(global_category_list) + 1
+
+    own_category_id = category_map[test_user.id]
+    res = await make_http_request(
+        f"{ENDPOINT}{own_category_id}", json={"label": "Renamed"}, as_user=test_user
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json()["label"] == "Renamed"
+
+    # Changes of custom categories only drop the cache of their user
+    assert await cache.get_version() == global_version
+    assert await cache.get_version(test_superuser.id) == other_version + 1
+
+    category_list = await category_service.get_categories(test_user)
+
+    assert category_list[-1].label == "Renamed"
+
+    res = await make_http_request(
+        f"{ENDPOINT}{own_category_id}",
+        json={"label": "Foreign"},
+        as_user=test_superuser,
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+    res = await make_http_request(
+        f"{ENDPOINT}{own_category_id}",
+        as_user=test_superuser,
+        method=RequestMethod.DELETE,
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+    for user, category_id in category_map.items():
+        res = await make_http_request(
+            f"{ENDPOINT}{category_id}",
+            as_user=test_user if user == test_user.id else test_superuser,
+            method=RequestMethod.DELETE,
+        )
+
+        assert res.status_code == status.HTTP_204_NO_CONTENT
+
+    assert len(await category_service.get_categories(test_user)) == len(
+        global_category_list
+    )
+
+    res = await make_http_request(
+        ENDPOINT, json={"label": "No section", "section_id": 0}, as_user=test_user
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
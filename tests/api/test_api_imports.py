@@ -0,0 +1,226 @@
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+
+from app import models
+from app import repository as repo
+from app.config import settings
+from app.database import db
+from app.services import categories as category_service
+from app.utils.enums import ImportStatus, RequestMethod
+from tests.utils import make_http_request
+
+ENDPOINT = "/api/imports/"
+
+CSV_STATEMENT = """Buchungstag;Betrag;Verwendungszweck
+31.01.2024;-1.234,56;Miete Januar
+01.02.2024;2.500,00;Gehalt
+01.02.2024;2.500,00;Gehalt
+02.02.2024;abc;Kaputt
+"""
+
+OFX_STATEMENT = """OFXHEADER:100
+DATA:OFXSGML
+
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240131120000.000[-5:EST]<TRNAMT>-42.50
+<FITID>A1<NAME>Grocery Store</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20240201<TRNAMT>100.004<FITID>A2
+<MEMO>Refund</STMTTRN>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240131120000<TRNAMT>-42.50<FITID>A1
+<NAME>Grocery Store</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+async def test_import_statements(
+    test_account: models.Account,
+    test_user: models.User,
+):
+    """
+    Tests importing a localized CSV and an SGML OFX statement, including
+    repeated, duplicate and invalid rows, the job status and the account
+    balance.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    account_balance = test_account.balance
+
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={test_account.id}&category_id=1&delimiter=;"
+        "&date_column=Buchungstag&amount_column=Betrag"
+        "&reference_column=Verwendungszweck&date_format=%25d.%25m.%25Y"
+        "&decimal_separator=,&thousands_separator=.&encoding=cp1252",
+        content=CSV_STATEMENT.encode("cp1252"),
+        headers={"content-type": "text/csv"},
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_202_ACCEPTED
+
+    res = await make_http_request(
+        f"{ENDPOINT}{res.json()['id']}", as_user=test_user, method=RequestMethod.GET
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+
+    job = res.json()
+
+    assert job["status"] == ImportStatus.COMPLETED.value
+    assert job["finished_at"] is not None
+    # A repeated row is a second booking, not a duplicate
+    assert (job["rows_read"], job["created_count"]) == (4, 3)
+    assert (job["duplicate_count"], job["error_count"]) == (0, 1)
+    assert job["errors"][0]["index"] == 3
+
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={test_account.id}&category_id=1&file_format=ofx",
+        content=OFX_STATEMENT.encode(),
+        headers={"content-type": "application/x-ofx"},
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_202_ACCEPTED
+
+    job = await repo.get(models.ImportJob, res.json()["id"])
+
+    assert job is not None
+    await repo.refresh(job)
+    assert job.status == ImportStatus.COMPLETED.value
+    assert (job.rows_read, job.created_count, job.duplicate_count) == (3, 3, 0)
+
+    # Statements that overlap with an earlier import only add the new rows
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={test_account.id}&category_id=1&file_format=ofx",
+        content=OFX_STATEMENT.replace(
+            "</BANKTRANLIST>",
+            "<STMTTRN><DTPOSTED>20240202<TRNAMT>-5<FITID>A3<NAME>Bakery</STMTTRN>\n"
+            "</BANKTRANLIST>",
+        ).encode(),
+        headers={"content-type": "application/x-ofx"},
+        as_user=test_user,
+    )
+    job = await repo.get(models.ImportJob, res.json()["id"])
+
+    assert job is not None
+    await repo.refresh(job)
+    assert (job.rows_read, job.created_count, job.duplicate_count) == (4, 1, 3)
+
+    account_refreshed = await repo.get(models.Account, test_account.id)
+
+    assert account_refreshed is not None
+    await repo.refresh(account_refreshed)
+    assert account_refreshed.balance == account_balance + Decimal("3775.44")
+
+
+async def test_invalid_imports(
+    test_accounts: list[models.Account],
+    test_account: models.Account,
+    test_user: models.User,
+    test_superuser: models.User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Tests that imports into another user's account, too large ones, ones with
+    unknown columns or with another user's category and job status requests of
+    other users are rejected.
+
+    Args:
+        test_accounts (fixture): The test accounts.
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+        test_superuser (fixture): A verified user that does not own the job.
+        monkeypatch (fixture): Pytest's monkeypatch fixture.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    other_account = next(
+        account for account in test_accounts if account.user_id != test_user.id
+    )
+
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={other_account.id}&category_id=1",
+        content=b"date,amount,reference\n",
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={test_account.id}&category_id=1&encoding=unknown",
+        content=b"date,amount,reference\n",
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    with monkeypatch.context() as patch:
+        patch.setattr(settings, "import_max_bytes", 10)
+        res = await make_http_request(
+            f"{ENDPOINT}?account_id={test_account.id}&category_id=1",
+            content=b"date,amount,reference\n",
+            as_user=test_user,
+        )
+
+    assert res.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={test_account.id}&category_id=1",
+        content=b"Datum,Betrag\n2024-01-01,1\n",
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_202_ACCEPTED
+
+    job_id = res.json()["id"]
+    job = await repo.get(models.ImportJob, job_id)
+
+    assert job is not None
+    await repo.refresh(job)
+    assert job.status == ImportStatus.FAILED.value
+    assert job.created_count == 0
+    assert "Missing columns" in job.errors[0]["detail"]
+
+    await repo.refresh(test_superuser)
+    res = await make_http_request(
+        f"{ENDPOINT}{job_id}", as_user=test_superuser, method=RequestMethod.GET
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+    other_category = await category_service.create_category(
+        test_superuser, "Other import category", 1
+    )
+    await db.session.commit()
+
+    assert other_category is not None
+
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={test_account.id}&category_id={other_category.id}",
+        content=b"date,amount,reference\n2024-01-01,1,Other category\n",
+        as_user=test_user,
+    )
+    job = await repo.get(models.ImportJob, res.json()["id"])
+
+    assert job is not None
+    await repo.refresh(job)
+    assert job.status == ImportStatus.FAILED.value
+    assert job.errors[0]["detail"] == f"Category[id: {other_category.id}] not found"
+
+    await category_service.delete_category(test_superuser, other_category.id)
+    await db.session.commit()
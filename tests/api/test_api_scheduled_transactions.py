@@ -0,0 +1,260 @@
+import datetime
+import logging
+from decimal import Decimal
+
+from fastapi import status
+
+from app import models
+from app import repository as repo
+from app.scheduler import run_scheduled_transactions
+from app.utils.enums import (
+    DatabaseFilterOperator,
+    Frequency,
+    LoadProfile,
+    RequestMethod,
+)
+from tests.utils import get_user_offset_account, make_http_request
+
+ENDPOINT = "/api/scheduled_transactions/"
+
+
+async def test_execute_scheduled_transactions(
+    test_account: models.Account,
+    test_user: models.User,
+):
+    """
+    Tests that due occurrences of a scheduled transaction are created once,
+    including the offset transactions and the balances of both accounts.
+
+    Args:
+        test_account (models.Account): The test account.
+        test_user (models.User): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    offset_account = await get_user_offset_account(test_account)
+
+    assert offset_account is not None
+
+    account_balance = test_account.balance
+    offset_account_balance = offset_account.balance
+
+    res = await make_http_request(
+        ENDPOINT,
+        json={
+            "account_id": test_account.id,
+            "amount": 10,
+            "reference": "Monthly",
+            "category_id": 1,
+            "date_start": "2024-01-31T00:00:00Z",
+            "date_end": "2024-06-30T00:00:00Z",
+            "frequency_id": Frequency.MONTHLY.value,
+            "offset_account_id": offset_account.id,
+        },
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_201_CREATED
+
+    scheduled_transaction_id = res.json()["id"]
+    now = datetime.datetime(2024, 12, 31, tzinfo=datetime.timezone.utc)
+
+    assert await run_scheduled_transactions(now=now, batch_size=1) == 12
+    assert await run_scheduled_transactions(now=now, batch_size=1) == 0
+
+    # The exhausted schedule is no longer selected
+    scheduled_transaction = await repo.get(
+        models.TransactionScheduled, scheduled_transaction_id
+    )
+    due_list = await repo.get_due_scheduled_transactions(now, 100)
+
+    assert scheduled_transaction is not None
+    assert scheduled_transaction.next_run_at is None
+    assert scheduled_transaction_id not in [scheduled.id for scheduled in due_list]
+
+    transaction_list = await repo.filter_by(
+        models.Transaction,
+        models.Transaction.scheduled_transaction_id,
+        scheduled_transaction_id,
+        DatabaseFilterOperator.EQUAL,
+        profile=LoadProfile.LIST,
+    )
+    account_transaction_list = sorted(
+        (t for t in transaction_list if t.account_id == test_account.id),
+        key=lambda t: t.date,
+    )
+
+    assert len(transaction_list) == 12
+    assert [t.date.day for t in account_transaction_list] == [31, 29, 31, 30, 31, 30]
+
+    for transaction in account_transaction_list:
+        await repo.refresh(transaction)
+
+        assert transaction.information.amount == Decimal("10.00")
+        assert transaction.offset_transaction.account_id == offset_account.id
+        assert transaction.offset_transaction.amount == Decimal("-10.00")
+
+    await repo.refresh(test_account)
+    await repo.refresh(offset_account)
+
+    assert test_account.balance == account_balance + 60
+    assert offset_account.balance == offset_account_balance - 60
+
+
+async def test_execute_unknown_frequency(
+    test_account: models.Account, test_user: models.User, caplog
+):
+    """
+    Tests that a scheduled transaction with an unknown frequency is logged and
+    skipped without aborting the other scheduled transactions of its batch.
+
+    Args:
+        test_account (models.Account): The test account.
+        test_user (models.User): The test user.
+        caplog (fixture): Pytest's log capture fixture.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    await repo.save(models.Frequency(id=99, label="hourly"))
+
+    scheduled_transaction_id_list = []
+    for frequency_id in [99, Frequency.ONCE.value]:
+        res = await make_http_request(
+            ENDPOINT,
+            json={
+                "account_id": test_account.id,
+                "amount": 10,
+                "reference": "Unknown frequency",
+                "category_id": 1,
+                "date_start": "2023-01-01T00:00:00Z",
+                "date_end": "2023-12-31T00:00:00Z",
+                "frequency_id": frequency_id,
+                "offset_account_id": None,
+            },
+            as_user=test_user,
+        )
+        scheduled_transaction_id_list.append(res.json()["id"])
+
+    now = datetime.datetime(2023, 12, 31, tzinfo=datetime.timezone.utc)
+
+    with caplog.at_level(logging.ERROR):
+        assert await run_scheduled_transactions(now=now) == 1
+
+    assert "has the unknown frequency 99" in caplog.text
+
+    for scheduled_transaction_id in scheduled_transaction_id_list:
+        scheduled_transaction = await repo.get(
+            models.TransactionScheduled, scheduled_transaction_id
+        )
+        assert scheduled_transaction is not None
+        assert scheduled_transaction.next_run_at is None
+
+
+async def test_projected_transactions(
+    test_account: models.Account,
+    test_user: models.User,
+):
+    """
+    Tests that the projected transactions contain the month-end clamped
+    occurrences for the account and the inverted ones for the offset account.
+
+    Args:
+        test_account (models.Account): The test account.
+        test_user (models.User): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    offset_account = await get_user_offset_account(test_account)
+
+    assert offset_account is not None
+
+    res = await make_http_request(
+        ENDPOINT,
+        json={
+            "account_id": test_account.id,
+            "amount": -25,
+            "reference": "Rent",
+            "category_id": 1,
+            "date_start": "2030-01-31T08:00:00Z",
+            "date_end": "2031-01-01T00:00:00Z",
+            "frequency_id": Frequency.MONTHLY.value,
+            "offset_account_id": offset_account.id,
+        },
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_201_CREATED
+
+    scheduled_transaction_id = res.json()["id"]
+
+    for account, amount in [(test_account, -25), (offset_account, 25)]:
+        res = await make_http_request(
+            f"{ENDPOINT}projected?account_id={account.id}"
+            "&date_start=2030-02-01T00:00:00Z&date_end=2030-05-31T23:59:59Z",
+            as_user=test_user,
+            method=RequestMethod.GET,
+        )
+
+        assert res.status_code == status.HTTP_200_OK
+
+        projected_list = [
+            item
+            for item in res.json()
+            if item["scheduled_transaction_id"] == scheduled_transaction_id
+        ]
+
+        assert [item["date"][:10] for item in projected_list] == [
+            "2030-02-28",
+            "2030-03-31",
+            "2030-04-30",
+            "2030-05-31",
+        ]
+        assert all(item["amount"] == amount for item in projected_list)
+        assert all(item["account_id"] == account.id for item in projected_list)
+
+
+async def test_invalid_projected_transactions(
+    test_accounts: list[models.Account],
+    test_user: models.User,
+):
+    """
+    Tests that projected transactions of another user's account are not found.
+
+    Args:
+        test_accounts (list[models.Account]): The test accounts.
+        test_user (models.User): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    account = next(
+        account for account in test_accounts if account.user_id != test_user.id
+    )
+
+    res = await make_http_request(
+        f"{ENDPOINT}projected?account_id={account.id}"
+        "&date_start=2030-02-01T00:00:00Z&date_end=2030-05-31T23:59:59Z",
+        as_user=test_user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
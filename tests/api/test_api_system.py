@@ -0,0 +1,196 @@
+import asyncio
+import contextvars
+import logging
+import re
+
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import text
+from starlette.types import Receive, Scope, Send
+
+from app import models
+from app.config import settings
+from app.database import db
+from app.middleware import DatabaseSessionMiddleware
+from app.utils.enums import RequestMethod
+from tests.utils import make_http_request
+
+ENDPOINT = "/api/system"
+
+
+async def test_pool_status(test_superuser: models.User):
+    """
+    Test case for retrieving the connection pool status.
+
+    Args:
+        test_superuser (fixture): The superuser.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    res = await make_http_request(
+        f"{ENDPOINT}/pool", as_user=test_superuser, method=RequestMethod.GET
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+
+    pool_status = res.json()
+    assert pool_status["checked_out"] >= 1
+    assert pool_status["idle"] >= 0
+    assert pool_status["overflow"] >= 0
+    assert pool_status["checkout_count"] >= pool_status["checked_out"]
+
+
+async def test_request_sessions():
+    """
+    Test case for the sessions of concurrent requests, which run without the
+    session the test suite binds to its context.
+
+    Every request gets its own session, which is closed and rolled back once
+    the request has finished, even if it raised an exception.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    session_list = []
+    barrier = asyncio.Barrier(3)
+
+    async def session_app(scope: Scope, _receive: Receive, send: Send) -> None:
+        session_list.append(db.session)
+        await db.session.execute(text("SELECT 1"))
+        await barrier.wait()
+
+        if scope["path"] == "/fail":
+            raise RuntimeError("Request failed")
+
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def get(client: AsyncClient, url: str) -> int:
+        try:
+            res = await client.get(url)
+        except RuntimeError:
+            return status.HTTP_500_INTERNAL_SERVER_ERROR
+        return res.status_code
+
+    async def make_requests() -> list[int]:
+        async with AsyncClient(
+            app=DatabaseSessionMiddleware(session_app), base_url="http://test"
+        ) as client:
+            return list(
+                await asyncio.gather(
+                    get(client, "/"), get(client, "/"), get(client, "/fail")
+                )
+            )
+
+    checked_out = db.engine.pool.checkedout()
+
+    status_list = await asyncio.create_task(
+        make_requests(), context=contextvars.Context()
+    )
+
+    assert sorted(status_list) == [200, 200, 500]
+    assert len({id(session) for session in session_list}) == 3
+    assert all(session is not db.session for session in session_list)
+    assert not any(session.in_transaction() for session in session_list)
+    assert db.engine.pool.checkedout() == checked_out
+
+
+async def test_invalid_pool_status(test_user: models.User):
+    """
+    Test case for retrieving the connection pool status as a regular user.
+
+    Args:
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    res = await make_http_request(
+        f"{ENDPOINT}/pool", as_user=test_user, method=RequestMethod.GET
+    )
+
+    assert res.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_metrics(
+    test_user: models.User, test_superuser: models.User, monkeypatch, caplog
+):
+    """
+    Test case for the request metrics, the per-request query counts, the log
+    of slow requests and who may read the metrics.
+
+    Args:
+        test_user (fixture): The test user.
+        test_superuser (fixture): The test superuser.
+        monkeypatch (fixture): Pytest's monkeypatch fixture.
+        caplog (fixture): Pytest's log capture fixture.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    monkeypatch.setattr(settings, "slow_request_threshold", 1e-9)
+
+    with caplog.at_level(logging.WARNING, logger="app.metrics"):
+        res = await make_http_request(
+            "/api/accounts/", as_user=test_user, method=RequestMethod.GET
+        )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert "Slow request GET /api/accounts/" in caplog.text
+    assert "SELECT" in caplog.text
+
+    res = await make_http_request("/metrics", method=RequestMethod.GET)
+
+    assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    res = await make_http_request(
+        "/metrics", as_user=test_user, method=RequestMethod.GET
+    )
+
+    assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    monkeypatch.setattr(settings, "metrics_token", "scraper-token")
+    res = await make_http_request(
+        "/metrics",
+        method=RequestMethod.GET,
+        headers={"authorization": "Bearer scraper-token"},
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+
+    res = await make_http_request(
+        "/metrics", as_user=test_superuser, method=RequestMethod.GET
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.headers["content-type"].startswith("text/plain")
+
+    metrics = res.text
+    labels = '{method="GET",route="/api/accounts/",status="200"}'
+
+    assert f"pecuny_http_request_duration_seconds_count{labels}" in metrics
+    assert 'pecuny_http_slow_requests_total{route="/api/accounts/"}' in metrics
+
+    query_sum = re.search(
+        r'^pecuny_http_request_queries_sum\{route="/api/accounts/"\} (\d+)$',
+        metrics,
+        re.MULTILINE,
+    )
+    assert query_sum is not None and int(query_sum.group(1)) > 0
@@ -0,0 +1,185 @@
+import datetime
+import json
+
+import pytest
+from fastapi import status
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
+
+from app import models
+from app import repository as repo
+from app import schemas
+from app.database import db
+from app.services.transactions import TransactionService
+from app.utils.enums import LoadProfile, RequestMethod
+from tests.utils import make_http_request
+
+ENDPOINT = "/api/transactions/"
+
+
+async def test_create_transaction_without_reload(
+    test_account: models.Account, test_user: models.User
+):
+    """
+    Tests that the response of a created transaction, including its category
+    and section, is built without a query after the commit.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    statement_list = []
+    commit_statement_count_list = []
+
+    def count_statement(*_args):
+        statement_list.append(_args[2])
+
+    def mark_commit(_session):
+        commit_statement_count_list.append(len(statement_list))
+
+    assert db.engine is not None
+    engine = db.engine.sync_engine
+    sync_session = db.session.sync_session
+    event.listen(engine, "before_cursor_execute", count_statement)
+    event.listen(sync_session, "after_commit", mark_commit)
+
+    try:
+        res = await make_http_request(
+            ENDPOINT,
+            json={
+                "account_id": test_account.id,
+                "amount": 12.5,
+                "reference": "without reload",
+                "date": str(datetime.datetime.now(datetime.timezone.utc)),
+                "category_id": 2,
+            },
+            as_user=test_user,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+        event.remove(sync_session, "after_commit", mark_commit)
+
+    category = await repo.get(models.TransactionCategory, 2, profile=LoadProfile.DETAIL)
+
+    assert category is not None
+    assert res.status_code == status.HTTP_201_CREATED
+    assert res.json()["information"]["category"] == {
+        "id": category.id,
+        "label": category.label,
+        "section": {"id": category.section.id, "label": category.section.label},
+    }
+    assert commit_statement_count_list == [len(statement_list)]
+
+
+@pytest.mark.usefixtures("create_transactions", "fast_json_responses")
+async def test_get_transaction_page_matches_schema(
+    test_account: models.Account, test_user: models.User
+):
+    """
+    Tests that the transactions of a page, which are serialized without the ORM,
+    are the same as the serialized schema of each transaction, including
+    transactions without a category.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    await TransactionService().insert_transactions(
+        [
+            {
+                "account_id": test_account.id,
+                "amount": 1,
+                "reference": "Without category",
+                "date": datetime.datetime.now(datetime.timezone.utc),
+                "category_id": None,
+            }
+        ]
+    )
+    await db.session.commit()
+
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={test_account.id}"
+        "&date_start=2000-01-01T00:00:00Z&date_end=2100-01-01T00:00:00Z&limit=1000",
+        as_user=test_user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+
+    item_list = res.json()["items"]
+    uncategorized_list = [
+        item for item in item_list if item["information"]["category"] is None
+    ]
+
+    assert len(uncategorized_list) == 1
+    assert len(item_list) > 1
+
+    for item in item_list:
+        transaction = await repo.get(
+            models.Transaction,
+            item["id"],
+            profile=LoadProfile.LIST,
+        )
+        expected = schemas.Transaction.model_validate(transaction, from_attributes=True)
+        assert item == json.loads(expected.model_dump_json())
+
+    await make_http_request(
+        f"{ENDPOINT}{uncategorized_list[0]['id']}",
+        as_user=test_user,
+        method=RequestMethod.DELETE,
+    )
+
+
+@pytest.mark.usefixtures("create_transactions")
+async def test_transaction_load_profiles(test_account: models.Account):
+    """
+    Tests that the minimal profile loads no relationships and the list profile
+    loads the ones the transaction responses show.
+
+    Args:
+        test_account (fixture): The test account.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    query = select(models.Transaction).where(
+        models.Transaction.account_id == test_account.id
+    )
+
+    # A separate session, so no relationship is loaded already
+    session = await db.get_session()
+    try:
+        minimal_query = repo.load_profile(
+            query, models.Transaction, LoadProfile.MINIMAL
+        )
+        transaction = (await session.scalars(minimal_query)).first()
+
+        with pytest.raises(InvalidRequestError):
+            _ = transaction.information
+
+        session.expunge_all()
+
+        list_query = repo.load_profile(query, models.Transaction, LoadProfile.LIST)
+        transaction = (await session.scalars(list_query)).first()
+
+        assert transaction.information.category.section.label
+    finally:
+        await session.close()
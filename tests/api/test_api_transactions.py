@@ -8,8 +8,12 @@ from app import models
 from app import repository as repo
 from app import schemas
 from app.utils.classes import RoundedDecimal
-from app.utils.enums import DatabaseFilterOperator, RequestMethod
-from tests.utils import get_user_offset_account, make_http_request
+from app.utils.enums import DatabaseFilterOperator, LoadProfile, RequestMethod
+from tests.utils import (
+    get_account_transactions,
+    get_user_offset_account,
+    make_http_request,
+)
 
 ENDPOINT = "/api/transactions/"
 STATUS_CODE = status.HTTP_201_CREATED
@@ -122,9 +126,7 @@ async def test_updated_transaction(
 
     account_balance = test_account.balance
 
-    transaction_list = await repo.filter_by(
-        models.Transaction, models.Transaction.account_id, test_account.id
-    )
+    transaction_list = await get_account_transactions(test_account)
 
     transaction = transaction_list[0]
 
@@ -151,6 +153,14 @@ async def test_updated_transaction(
     assert transaction.information.amount == amount
     assert transaction.information.reference == reference
     assert transaction.information.category_id == category_id
+    assert transaction.information.category is not None
+    assert transaction.information.category.id == category_id
+
+    db_transaction = await repo.get(models.Transaction, transaction.id)
+
+    assert db_transaction is not None
+    assert db_transaction.amount == amount
+    assert db_transaction.date == transaction.information.date
 
 
 async def test_delete_transactions(
@@ -249,6 +259,55 @@ async def test_delete_transactions_fail(
         assert account_balance_after == account_balance
 
 
+async def test_get_owned_transaction(
+    test_account: models.Account, test_user: models.User
+):
+    """
+    Test case for reading transactions and accounts only through their owner.
+
+    Args:
+        test_account (models.Account): The test account.
+        test_user (models.User): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    result = await repo.filter_by(
+        models.Account,
+        models.Account.user_id,
+        test_account.user_id,
+        DatabaseFilterOperator.NOT_EQUAL,
+        load_relationships_list=[models.Account.transactions],
+    )
+    other_account = next(account for account in result if account.transactions)
+    other_transaction = other_account.transactions[0]
+
+    assert await repo.get_owned(models.Account, other_account.id, test_user.id) is None
+    assert (
+        await repo.get_owned(models.Transaction, other_transaction.id, test_user.id)
+        is None
+    )
+
+    transaction = await repo.get_owned(
+        models.Transaction, other_transaction.id, other_account.user_id
+    )
+
+    assert transaction is other_transaction
+    assert transaction.account.id == other_account.id
+
+    res = await make_http_request(
+        f"{ENDPOINT}{other_transaction.id}",
+        method=RequestMethod.GET,
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.parametrize(
     "amount, expected_offset_amount,  category_id",
     [
@@ -311,7 +370,9 @@ async def test_create_offset_transaction(
 
     assert isinstance(offset_transactions_id, int)
 
-    new_offset_transaction = await repo.get(models.Transaction, offset_transactions_id)
+    new_offset_transaction = await repo.get(
+        models.Transaction, offset_transactions_id, profile=LoadProfile.DETAIL
+    )
 
     assert new_offset_transaction is not None
 
@@ -561,6 +622,7 @@ async def test_delete_offset_transaction(
     assert account_balance == account_refresh.balance
 
 
+@pytest.mark.usefixtures("fast_json_responses")
 async def test_transaction_amount_is_number(test_account_transaction_list):
     """
     Tests if the transaction amount in the JSON response is a float.
@@ -591,3 +653,151 @@ async def test_transaction_amount_is_number(test_account_transaction_list):
     json_response = res.json()
 
     assert isinstance(json_response["information"]["amount"], float)
+
+
+@pytest.mark.usefixtures("create_transactions", "fast_json_responses")
+async def test_get_transaction_pages(
+    test_account: models.Account, test_user: models.User
+):
+    """
+    Tests that paging through the transaction list returns every transaction once,
+    ordered by date and id.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    query = (
+        f"{ENDPOINT}?account_id={test_account.id}"
+        "&date_start=2000-01-01T00:00:00Z&date_end=2100-01-01T00:00:00Z"
+    )
+
+    res = await make_http_request(
+        f"{query}&limit=1000", as_user=test_user, method=RequestMethod.GET
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json()["next_cursor"] is None
+
+    item_list = res.json()["items"]
+    expected_id_list = [item["id"] for item in item_list]
+    assert len(expected_id_list) > 2
+
+    date_list = [schemas.Transaction(**item).information.date for item in item_list]
+    assert date_list == sorted(date_list, reverse=True)
+
+    id_list: list[int] = []
+    cursor = None
+    while True:
+        url = f"{query}&limit=2" + (f"&cursor={cursor}" if cursor else "")
+        res = await make_http_request(url, as_user=test_user, method=RequestMethod.GET)
+        page = res.json()
+
+        assert res.status_code == status.HTTP_200_OK
+        assert page["limit"] == 2
+        assert len(page["items"]) <= 2
+
+        id_list.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert id_list == expected_id_list
+
+
+async def test_get_transaction_page_invalid_cursor(
+    test_account: models.Account, test_user: models.User
+):
+    """
+    Tests that a malformed cursor is rejected.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    res = await make_http_request(
+        f"{ENDPOINT}?account_id={test_account.id}"
+        "&date_start=2000-01-01T00:00:00Z&date_end=2100-01-01T00:00:00Z"
+        "&cursor=not-a-cursor",
+        as_user=test_user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.usefixtures("create_transactions")
+async def test_monthly_summaries_match_transactions(
+    test_account: models.Account,
+    test_accounts: list[models.Account],
+    test_user: models.User,
+):
+    """
+    Tests that the incrementally maintained monthly summaries match the
+    transactions and a rebuild from the transactions table.
+
+    Args:
+        test_account (fixture): The test account.
+        test_accounts (fixture): The test accounts.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    date_start = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+    date_end = datetime.datetime(2100, 1, 1, tzinfo=datetime.timezone.utc)
+
+    res = await make_http_request(
+        f"/api/accounts/{test_account.id}/monthly-summary"
+        "?date_start=2000-01-01T00:00:00Z&date_end=2100-01-01T00:00:00Z",
+        as_user=test_user,
+        method=RequestMethod.GET,
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert len(res.json()) > 0
+
+    for account in test_accounts:
+        summary_list = [
+            schemas.MonthlySummaryData.model_validate(item)
+            for item in await repo.get_monthly_summaries(
+                account.id, date_start, date_end
+            )
+        ]
+        transaction_summary = await repo.get_transaction_summary(
+            account.id, date_start, date_end
+        )
+
+        assert sum(item.count for item in summary_list) == transaction_summary.count
+        assert sum(item.income for item in summary_list) == transaction_summary.income
+        assert (
+            sum(item.expenses for item in summary_list) == transaction_summary.expenses
+        )
+
+        await repo.rebuild_monthly_summaries(account.id)
+        rebuilt_summary_list = await repo.get_monthly_summaries(
+            account.id, date_start, date_end
+        )
+
+        assert summary_list == [
+            schemas.MonthlySummaryData.model_validate(item)
+            for item in rebuilt_summary_list
+        ]
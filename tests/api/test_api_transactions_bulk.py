@@ -0,0 +1,219 @@
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+from fastapi import status
+
+from app import models
+from app import repository as repo
+from app import transaction_manager as tm
+from app.database import db
+from app.services import categories as category_service
+from tests.utils import get_user_offset_account, make_http_request
+
+ENDPOINT = "/api/transactions/"
+
+
+async def test_create_transactions_bulk(
+    test_account: models.Account,
+    test_accounts: list[models.Account],
+    test_user: models.User,
+):
+    """
+    Tests creating transactions in bulk, including offset transactions,
+    per-row errors and duplicates, from a JSON array and from NDJSON.
+
+    Args:
+        test_account (fixture): The test account.
+        test_accounts (fixture): The test accounts.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    offset_account = await get_user_offset_account(test_account)
+    other_account = next(
+        account for account in test_accounts if account.user_id != test_user.id
+    )
+
+    assert offset_account is not None
+
+    account_balance = test_account.balance
+    offset_account_balance = offset_account.balance
+    date = str(datetime.datetime.now(datetime.timezone.utc))
+
+    row_list = [
+        {
+            "account_id": test_account.id,
+            "amount": 10.5,
+            "reference": "Bulk 1",
+            "date": date,
+            "category_id": 1,
+        },
+        {
+            "account_id": test_account.id,
+            "amount": -3.333,
+            "reference": "Bulk 2",
+            "date": date,
+            "category_id": 2,
+            "offset_account_id": offset_account.id,
+        },
+        {"account_id": test_account.id, "reference": "No amount", "date": date},
+        {
+            "account_id": other_account.id,
+            "amount": 1,
+            "reference": "Not allowed",
+            "date": date,
+            "category_id": 1,
+        },
+    ]
+
+    res = await make_http_request(f"{ENDPOINT}bulk", json=row_list, as_user=test_user)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json()["created"] == 2
+    assert [error["index"] for error in res.json()["errors"]] == [2, 3]
+
+    # The first row was created before, the repeated one is a second payment
+    repeated_row = {**row_list[1], "reference": "Bulk 3"}
+    content = "\n".join(
+        [
+            json.dumps(row_list[0]),
+            "{broken",
+            json.dumps(repeated_row),
+            json.dumps(repeated_row),
+        ]
+    ).encode()
+    res = await make_http_request(
+        f"{ENDPOINT}bulk",
+        content=content,
+        headers={"content-type": "application/x-ndjson"},
+        as_user=test_user,
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == {
+        "created": 2,
+        "duplicates": 1,
+        "errors": [{"index": 1, "detail": "Invalid JSON object"}],
+    }
+
+    account_refreshed = await repo.get(models.Account, test_account.id)
+    offset_account_refreshed = await repo.get(models.Account, offset_account.id)
+
+    assert account_refreshed is not None and offset_account_refreshed is not None
+    assert account_refreshed.balance == account_balance + Decimal("0.51")
+    assert offset_account_refreshed.balance == offset_account_balance + 3 * Decimal(
+        "3.33"
+    )
+
+    transaction_list = await repo.filter_by(
+        models.Transaction,
+        models.Transaction.account_id,
+        offset_account.id,
+        load_relationships_list=[models.Transaction.offset_transaction],
+    )
+
+    assert (
+        sum(
+            1
+            for transaction in transaction_list
+            if transaction.offset_transaction is not None
+            and transaction.offset_transaction.account_id == test_account.id
+            and transaction.amount == Decimal("3.33")
+        )
+        >= 2
+    )
+
+
+async def test_create_transactions_bulk_limits(
+    test_account: models.Account,
+    test_user: models.User,
+    test_superuser: models.User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Tests that bulk rows can only use global or own categories and amounts
+    that fit the column, that too large bodies are rejected before they are
+    parsed and that a failed insert is reported as a client error.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+        test_superuser (fixture): The test superuser.
+        monkeypatch (fixture): The pytest monkeypatch fixture.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    own_category = await category_service.create_category(
+        test_user, "Own bulk category", 1
+    )
+    other_category = await category_service.create_category(
+        test_superuser, "Other bulk category", 1
+    )
+    await db.session.commit()
+
+    assert own_category is not None and other_category is not None
+
+    row_list = [
+        {
+            "account_id": test_account.id,
+            "amount": 1,
+            "reference": f"Bulk category {category_id}",
+            "date": str(datetime.datetime.now(datetime.timezone.utc)),
+            "category_id": category_id,
+        }
+        for category_id in [1, own_category.id, other_category.id]
+    ]
+    row_list.append({**row_list[0], "amount": 1e9, "reference": "Bulk overflow"})
+
+    res = await make_http_request(f"{ENDPOINT}bulk", json=row_list, as_user=test_user)
+
+    assert res.status_code == status.HTTP_200_OK
+    assert res.json() == {
+        "created": 2,
+        "duplicates": 0,
+        "errors": [
+            {"index": 2, "detail": f"Category[id: {other_category.id}] not found"},
+            {"index": 3, "detail": "Amount out of range: 1000000000.00"},
+        ],
+    }
+
+    async def fail_transaction(*_args):
+        # What transaction_manager returns after rolling back a database error
+        return {}
+
+    with monkeypatch.context() as patch:
+        patch.setattr(tm, "transaction", fail_transaction)
+        res = await make_http_request(
+            f"{ENDPOINT}bulk", json=row_list[:1], as_user=test_user
+        )
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    monkeypatch.setattr("app.routers.api.transactions.MAX_BULK_BYTES", 10)
+    res = await make_http_request(f"{ENDPOINT}bulk", json=row_list, as_user=test_user)
+
+    assert res.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    # Move the created row back to a global category so the user can be deleted
+    for information in await repo.filter_by(
+        models.TransactionInformation,
+        models.TransactionInformation.category_id,
+        own_category.id,
+    ):
+        await repo.update(models.TransactionInformation, information.id, category_id=1)
+
+    await category_service.delete_category(test_user, own_category.id)
+    await category_service.delete_category(test_superuser, other_category.id)
+    await db.session.commit()
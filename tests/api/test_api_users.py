@@ -1,7 +1,10 @@
 import pytest
+from sqlalchemy import event
 
 from app import models
 from app import repository as repo
+from app.cache import user_cache
+from app.database import db
 from app.utils.enums import DatabaseFilterOperator, RequestMethod
 from tests.utils import make_http_request
 
@@ -42,6 +45,60 @@ async def test_invalid_updated_user(test_user: models.User, values: dict):
     assert res.status_code == 403
 
 
+async def test_get_user_cached(test_user: models.User):
+    """
+    Tests that authenticated users are served from the user cache without a
+    query and that updating a user invalidates its entry.
+
+    Args:
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    statement_list = []
+
+    def count_statement(*_args):
+        statement_list.append(_args[2])
+
+    assert db.engine is not None
+    engine = db.engine.sync_engine
+
+    user_cache.invalidate(test_user.id)
+    db.session.expunge(test_user)
+    event.listen(engine, "before_cursor_execute", count_statement)
+
+    try:
+        user = await user_cache.get(test_user.id)
+        db.session.expunge(user)
+        loaded_statement_count = len(statement_list)
+
+        cached_user = await user_cache.get(test_user.id)
+        db.session.expunge(cached_user)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+        db.session.add(test_user)
+
+    assert loaded_statement_count == 1
+    assert len(statement_list) == loaded_statement_count
+    assert cached_user is not None and cached_user is not user
+    assert (cached_user.id, cached_user.email) == (test_user.id, test_user.email)
+
+    res = await make_http_request(
+        "/api/users/me",
+        json={"displayname": "Cached"},
+        method=RequestMethod.PATCH,
+        as_user=test_user,
+    )
+
+    assert res.status_code == 200
+    assert user_cache.entries.get(test_user.id, None) is None
+
+
 async def test_delete_user(
     test_user: models.User,
 ):
@@ -1,7 +1,7 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.data import categories
+from app.data import categories, frequencies
 from app.database import db
 from app.models import Base
 
@@ -29,8 +29,13 @@ async def populate_db(session: AsyncSession):
     transaction_category_list = [
         models.TransactionCategory(**category) for category in category_list
     ]
+    frequency_list = [
+        models.Frequency(**frequency) for frequency in frequencies.get_frequency_list()
+    ]
 
-    session.add_all(transaction_category_list + transaction_section_list)
+    session.add_all(
+        transaction_category_list + transaction_section_list + frequency_list
+    )
     await session.commit()
 
 
@@ -48,11 +53,12 @@ async def fixture_init_db():
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
 
-    await populate_db(db.session)
+    async with db.session_scope() as session:
+        await populate_db(session)
 
-    yield
+        yield
 
-    await db.engine.dispose()
+    await db.close()
 
 
 async def cleanup_tests():
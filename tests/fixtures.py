@@ -8,11 +8,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app import models
 from app import repository as repo
 from app import schemas
+from app.config import settings
 from app.services.accounts import AccountService
 from app.services.transactions import TransactionService
 from app.services.users import UserService
 from app.utils.dataclasses_utils import CreateUserData
-from app.utils.enums import DatabaseFilterOperator
+from app.utils.enums import DatabaseFilterOperator, LoadProfile
+from tests.utils import get_account_transactions
 
 # Reference: https://github.com/EduardSchwarzkopf/pecuny/issues/88
 # pylint: disable=unused-argument
@@ -103,6 +105,36 @@ async def fixture_test_user(create_test_users):
     yield user_list[0]
 
 
+@pytest.fixture(name="test_superuser")
+async def fixture_test_superuser(user_service: UserService, session: AsyncSession):
+    """
+    Fixture that creates a verified superuser and deletes it afterwards.
+
+    Args:
+        user_service (fixture): The user service fixture.
+        session (fixture): The session fixture.
+
+    Yields:
+        models.User: The superuser.
+    """
+
+    superuser = await user_service.create_user(
+        CreateUserData(
+            email="superuser@pytest.de",
+            password="password123",
+            displayname="SuperUser",
+            is_verified=True,
+            is_superuser=True,
+        ),
+    )
+    assert superuser is not None
+
+    yield superuser
+
+    await repo.delete(superuser)
+    await session.commit()
+
+
 @pytest.fixture(name="create_test_accounts", scope="session")
 async def fixture_create_test_accounts(
     session: AsyncSession, create_test_users: list[models.User]
@@ -320,9 +352,7 @@ async def fixture_test_account_transaction_list(create_transactions, test_accoun
         list[models.Transaction]: A list of transactions associated with the test account.
     """
 
-    yield await repo.filter_by(
-        models.Transaction, models.Transaction.account_id, test_account.id
-    )
+    yield await get_account_transactions(test_account)
 
 
 @pytest.fixture(name="transaction_list")
@@ -338,4 +368,24 @@ async def fixture_get_all_transactions(create_transactions):
 
     """
 
-    yield await repo.get_all(models.Transaction)
+    yield await repo.get_all(models.Transaction, profile=LoadProfile.LIST)
+
+
+@pytest.fixture(
+    name="fast_json_responses", params=[False, True], ids=["json", "orjson"]
+)
+def fixture_fast_json_responses(request, monkeypatch):
+    """
+    Fixture that runs a test with the default and with the orjson rendering
+    of the API responses.
+
+    Args:
+        request (fixture): The pytest request with the setting as param.
+        monkeypatch (fixture): Pytest's monkeypatch fixture.
+
+    Yields:
+        bool: Whether fast JSON responses are enabled.
+    """
+
+    monkeypatch.setattr(settings, "fast_json_responses", request.param)
+    yield request.param
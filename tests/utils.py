@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import Response
 from httpx import AsyncClient, Cookies
@@ -7,7 +7,7 @@ from app import models, repository
 from app.auth_manager import get_strategy
 from app.config import settings
 from app.main import app
-from app.utils.enums import RequestMethod
+from app.utils.enums import LoadProfile, RequestMethod
 
 
 async def authorized_httpx_client(client: AsyncClient, user: models.User):
@@ -35,10 +35,11 @@ async def authorized_httpx_client(client: AsyncClient, user: models.User):
 async def make_http_request(
     url: str,
     data: Optional[dict] = None,
-    json: Optional[dict] = None,
+    json: Optional[dict | list] = None,
     as_user: Optional[models.User] = None,
     method: RequestMethod = RequestMethod.POST,
     cookies: Optional[Cookies] = None,
+    **request_kwargs: Any,
 ) -> Response:
     """
     Makes an HTTP request to the specified URL using the given method and JSON data.
@@ -48,6 +49,8 @@ async def make_http_request(
         method: The HTTP method to use for the request.
         url: The URL to make the request to.
         json_data: The JSON data to include in the request body. Defaults to None.
+        request_kwargs: Further arguments of the request, like headers or the
+            raw content of POST requests.
 
     Returns:
         Response: The response object.
@@ -65,13 +68,13 @@ async def make_http_request(
             client = await authorized_httpx_client(client, as_user)
 
         if method == RequestMethod.POST:
-            response = client.post(url, json=json, data=data)
+            response = client.post(url, json=json, data=data, **request_kwargs)
         elif method == RequestMethod.PATCH:
-            response = client.patch(url, json=json, data=data)
+            response = client.patch(url, json=json, data=data, **request_kwargs)
         elif method == RequestMethod.GET:
-            response = client.get(url)
+            response = client.get(url, **request_kwargs)
         elif method == RequestMethod.DELETE:
-            response = client.delete(url)
+            response = client.delete(url, **request_kwargs)
         else:
             raise ValueError(
                 f"Invalid method: {method}. Expected one of: get, post, patch, delete."
@@ -103,3 +106,22 @@ async def get_user_offset_account(account: models.Account) -> Optional[models.Ac
         ),
         None,
     )
+
+
+async def get_account_transactions(account: models.Account) -> list[models.Transaction]:
+    """
+    Returns the transactions of an account with their information loaded.
+
+    Args:
+        account (models.Account): The account.
+
+    Returns:
+        list[models.Transaction]: The transactions of the account.
+    """
+
+    return await repository.filter_by(
+        models.Transaction,
+        models.Transaction.account_id,
+        account.id,
+        profile=LoadProfile.LIST,
+    )
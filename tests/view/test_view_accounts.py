@@ -0,0 +1,126 @@
+import datetime
+import re
+
+import pytest
+from fastapi import status
+
+from app import models
+from app import repository as repo
+from app.routers import accounts
+from app.utils.enums import RequestMethod
+from tests.utils import get_account_transactions, make_http_request
+
+DATE_START = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+DATE_END = datetime.datetime(2100, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+@pytest.mark.usefixtures("create_transactions")
+async def test_account_page_summary(
+    test_account: models.Account, test_user: models.User
+):
+    """
+    Tests that the account page shows the aggregated income, expenses and total.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    transaction_list = await get_account_transactions(test_account)
+    amount_list = [transaction.information.amount for transaction in transaction_list]
+
+    summary = await repo.get_transaction_summary(test_account.id, DATE_START, DATE_END)
+
+    assert summary.count == len(transaction_list)
+    assert summary.total == sum(amount_list)
+    assert summary.income == sum(amount for amount in amount_list if amount > 0)
+    assert summary.expenses == sum(amount for amount in amount_list if amount < 0)
+    assert sum(day.count for day in summary.days) == summary.count
+
+    day_list = [day.day for day in summary.days]
+    assert day_list == sorted(day_list, reverse=True)
+
+    res = await make_http_request(
+        f"/dashboard/accounts/{test_account.id}",
+        method=RequestMethod.GET,
+        as_user=test_user,
+        cookies={
+            "date_start": DATE_START.isoformat(),
+            "date_end": DATE_END.isoformat(),
+        },
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert f"{summary.total:0.2f}" in res.text
+    assert f"{summary.income:0.2f}" in res.text
+    assert f"{summary.expenses:0.2f}" in res.text
+    assert f"{summary.days[0].total:0.2f}" in res.text
+
+
+@pytest.mark.usefixtures("create_transactions")
+async def test_account_page_transactions(
+    test_account: models.Account, test_user: models.User, monkeypatch
+):
+    """
+    Tests that the account page lists one page of transactions under the
+    days of the summary and links to the next page.
+
+    Args:
+        test_account (fixture): The test account.
+        test_user (fixture): The test user.
+        monkeypatch (fixture): Pytest's monkeypatch fixture.
+
+    Returns:
+        None
+
+    Raises:
+        AssertionError: If the test fails.
+    """
+
+    monkeypatch.setattr(accounts, "TRANSACTION_PAGE_LIMIT", 1)
+    cookies = {"date_start": DATE_START.isoformat(), "date_end": DATE_END.isoformat()}
+
+    transaction_list = await repo.get_transactions_from_period(
+        test_account.id, DATE_START, DATE_END
+    )
+    newest, second = transaction_list[0], transaction_list[1]
+
+    res = await make_http_request(
+        f"/dashboard/accounts/{test_account.id}",
+        method=RequestMethod.GET,
+        as_user=test_user,
+        cookies=cookies,
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert f"/transactions/{newest.id}" in res.text
+    assert f"/transactions/{second.id}" not in res.text
+
+    cursor = re.search(r"\?cursor=([\w-]+)", res.text)
+    assert cursor is not None
+
+    res = await make_http_request(
+        f"/dashboard/accounts/{test_account.id}?cursor={cursor.group(1)}",
+        method=RequestMethod.GET,
+        as_user=test_user,
+        cookies=cookies,
+    )
+
+    assert res.status_code == status.HTTP_200_OK
+    assert f"/transactions/{newest.id}" not in res.text
+    assert f"/transactions/{second.id}" in res.text
+
+    res = await make_http_request(
+        f"/dashboard/accounts/{test_account.id}?cursor=invalid",
+        method=RequestMethod.GET,
+        as_user=test_user,
+        cookies=cookies,
+    )
+
+    assert res.status_code == status.HTTP_400_BAD_REQUEST